@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark encrypted transaction load/save time and peak RSS.
+
+Each measurement runs in a fresh subprocess so that peak RSS reflects a
+single operation. Two pipelines are compared:
+
+    memory    - csv_handler.read_transactions / write_transactions
+    tempfile  - the previous approach: plaintext temp CSV + encrypt_file/decrypt_file
+
+Usage (from the project root):
+    python benchmarks/bench_csv_handler.py
+    python benchmarks/bench_csv_handler.py --sizes 10000 100000
+"""
+
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+CATEGORIES = ["Food", "Rent", "Salary", "Transportation", "Utilities", "Shopping"]
+
+
+def peak_rss_mb() -> float:
+    """Return this process's peak resident set size in MB."""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def make_transactions(count: int):
+    """Build a deterministic list of synthetic transactions."""
+    from src.models.transaction import Transaction
+    start = datetime(2015, 1, 1)
+    return [
+        Transaction(
+            amount=10 + (i % 5000) / 7,
+            type="income" if i % 10 == 0 else "expense",
+            category=CATEGORIES[i % len(CATEGORIES)],
+            description=f"Synthetic transaction {i}",
+            date=start + timedelta(days=i % 3650),
+        )
+        for i in range(count)
+    ]
+
+
+def tempfile_write(path: str, transactions) -> None:
+    """Reproduce the former temp-file based save."""
+    from src.utils.encryption import get_encryption
+    from src.utils.csv_handler import TRANSACTION_FIELDNAMES
+    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=TRANSACTION_FIELDNAMES)
+        writer.writeheader()
+        for t in transactions:
+            writer.writerow(t.to_dict())
+        temp_path = f.name
+    try:
+        get_encryption().encrypt_file(temp_path, path)
+    finally:
+        os.unlink(temp_path)
+
+
+def tempfile_read(path: str):
+    """Reproduce the former temp-file based load."""
+    from src.models.transaction import Transaction
+    from src.utils.encryption import get_encryption
+    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".csv") as f:
+        temp_path = f.name
+    try:
+        get_encryption().decrypt_file(path, temp_path)
+        with open(temp_path, newline="", encoding="utf-8") as f:
+            return [Transaction.from_dict(row) for row in csv.DictReader(f)]
+    finally:
+        os.unlink(temp_path)
+
+
+def run_worker(pipeline: str, operation: str, count: int, path: str) -> dict:
+    """Perform one timed operation in this process and report the result."""
+    from src.utils import csv_handler
+
+    if operation == "save":
+        transactions = make_transactions(count)
+        start = time.perf_counter()
+        if pipeline == "memory":
+            csv_handler.write_transactions(path, transactions)
+        else:
+            tempfile_write(path, transactions)
+    else:
+        start = time.perf_counter()
+        if pipeline == "memory":
+            loaded = csv_handler.read_transactions(path)
+        else:
+            loaded = tempfile_read(path)
+        assert len(loaded) == count
+    elapsed = time.perf_counter() - start
+    return {"seconds": elapsed, "peak_rss_mb": peak_rss_mb()}
+
+
+def measure(pipeline: str, operation: str, count: int, path: str) -> dict:
+    """Run a single measurement in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, __file__, "--worker", pipeline, operation, str(count), path],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--worker", nargs=4, metavar=("PIPELINE", "OP", "COUNT", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        pipeline, operation, count, path = args.worker
+        print(json.dumps(run_worker(pipeline, operation, int(count), path)))
+        return
+
+    print(f"{'rows':>10} {'pipeline':>9} {'save s':>8} {'save MB':>8} {'load s':>8} {'load MB':>8}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for count in args.sizes:
+            for pipeline in ("tempfile", "memory"):
+                path = os.path.join(tmpdir, f"{pipeline}_{count}.csv.enc")
+                save = measure(pipeline, "save", count, path)
+                load = measure(pipeline, "load", count, path)
+                print(f"{count:>10} {pipeline:>9} {save['seconds']:>8.2f} {save['peak_rss_mb']:>8.1f} "
+                      f"{load['seconds']:>8.2f} {load['peak_rss_mb']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
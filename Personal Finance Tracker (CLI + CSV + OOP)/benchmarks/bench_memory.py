@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memory footprint of in-memory transactions.
+
+Builds N transactions the way a CSV load does (every field parsed from a
+fresh string) and reports traced bytes per transaction. The "legacy" row
+reproduces the former layout (per-instance __dict__, full datetime, no
+string interning) for comparison.
+
+Usage (from the project root):
+    python benchmarks/bench_memory.py
+    python benchmarks/bench_memory.py --count 100000
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.models.transaction import Transaction
+
+DEFAULT_COUNT = 1_000_000
+CATEGORIES = ["Food", "Rent", "Salary", "Transportation", "Utilities", "Shopping"]
+
+
+class LegacyTransaction:
+    """The former Transaction layout, kept only for comparison."""
+
+    def __init__(self, amount, type, category, description, date, currency, id):
+        self.id = id
+        self.amount = amount
+        self.type = type
+        self.category = category.strip()
+        self.description = description
+        self.date = date
+        self.currency = currency
+
+
+def make_rows(count: int):
+    """Yield CSV-like rows whose strings are distinct objects, as csv.DictReader produces."""
+    start = datetime(2015, 1, 1)
+    for i in range(count):
+        yield {
+            'id': str(uuid.UUID(int=i)),
+            'date': (start + timedelta(days=i % 3650)).strftime('%Y-%m-%d'),
+            'amount': str(10 + (i % 5000) / 7),
+            'type': "".join("income" if i % 10 == 0 else "expense"),
+            'category': "".join(CATEGORIES[i % len(CATEGORIES)]),
+            'description': f"Synthetic transaction {i}",
+            'currency': "".join("INR"),
+        }
+
+
+def build_legacy(row):
+    return LegacyTransaction(
+        float(row['amount']), row['type'], row['category'], row['description'],
+        datetime.strptime(row['date'], '%Y-%m-%d'), row['currency'], row['id'],
+    )
+
+
+def measure(count: int, build) -> float:
+    """Return traced bytes per transaction retained after building `count` rows."""
+    gc.collect()
+    tracemalloc.start()
+    transactions = []
+    for row in make_rows(count):
+        transactions.append(build(row))
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(transactions) == count
+    return current / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT)
+    args = parser.parse_args()
+
+    print(f"{'layout':>8} {'rows':>10} {'bytes/txn':>10}")
+    for name, build in (("legacy", build_legacy), ("compact", Transaction.from_dict)):
+        print(f"{name:>8} {args.count:>10} {measure(args.count, build):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark CSV row parsing into Transaction objects.
+
+Both paths parse the same in-memory CSV text, so only parsing is timed
+(no disk or decryption):
+
+    from_dict  - csv.DictReader + Transaction.from_dict per row (previous load path)
+    bulk       - csv.reader + Transaction.bulk_from_rows (current load path)
+
+Usage (from the project root):
+    python benchmarks/bench_parser.py
+    python benchmarks/bench_parser.py --sizes 10000 100000
+"""
+
+import argparse
+import csv
+import io
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from bench_csv_handler import make_transactions
+from src.models.transaction import Transaction
+from src.utils.csv_handler import TRANSACTION_FIELDNAMES
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+
+def make_csv(count: int) -> str:
+    """Render `count` synthetic transactions as CSV text."""
+    buffer = io.StringIO(newline='')
+    writer = csv.DictWriter(buffer, fieldnames=TRANSACTION_FIELDNAMES)
+    writer.writeheader()
+    for transaction in make_transactions(count):
+        writer.writerow(transaction.to_dict())
+    return buffer.getvalue()
+
+
+def parse_from_dict(text: str):
+    return [Transaction.from_dict(row) for row in csv.DictReader(io.StringIO(text, newline=''))]
+
+
+def parse_bulk(text: str):
+    reader = csv.reader(io.StringIO(text, newline=''))
+    return Transaction.bulk_from_rows(reader, next(reader))
+
+
+def best_of(parse, text: str, repeat: int) -> float:
+    """Return the fastest of `repeat` timed runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(text)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'from_dict s':>12} {'bulk s':>8} {'speedup':>8}")
+    for count in args.sizes:
+        text = make_csv(count)
+        assert len(parse_bulk(text)) == count
+        slow = best_of(parse_from_dict, text, args.repeat)
+        fast = best_of(parse_bulk, text, args.repeat)
+        print(f"{count:>10} {slow:>12.2f} {fast:>8.2f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
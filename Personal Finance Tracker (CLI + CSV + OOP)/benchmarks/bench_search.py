@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark transaction search latency.
+
+Compares the indexed BudgetManager.search_transactions with the former
+linear scan over every transaction for a handful of typical queries.
+
+Usage (from the project root):
+    python benchmarks/bench_search.py
+    python benchmarks/bench_search.py --count 100000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from bench_csv_handler import make_transactions
+from src.models.budget_manager import BudgetManager
+
+DEFAULT_COUNT = 500_000
+QUERIES = ["transaction 4242", "utilities", "1234", "714.28", "no such text"]
+
+
+def linear_search(transactions, query: str):
+    """The former search implementation."""
+    query = query.lower().strip()
+    return [
+        t for t in transactions
+        if query in t.description.lower()
+        or query in t.category.lower()
+        or query == str(int(t.amount))
+        or query in str(t.amount)
+    ]
+
+
+def timed(function, *args, repeat: int = 5) -> float:
+    """Return the fastest of `repeat` runs in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        manager.transactions = make_transactions(args.count)
+        manager._rebuild_indexes()
+
+        start = time.perf_counter()
+        manager.search_transactions("warm up")
+        print(f"index build: {time.perf_counter() - start:.2f}s for {args.count} transactions")
+
+        print(f"{'query':>18} {'hits':>7} {'scan ms':>9} {'index ms':>9}")
+        for query in QUERIES:
+            hits = len(manager.search_transactions(query))
+            scan = timed(linear_search, manager.transactions, query, repeat=1)
+            indexed = timed(manager.search_transactions, query)
+            print(f"{query!r:>18} {hits:>7} {scan:>9.1f} {indexed:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
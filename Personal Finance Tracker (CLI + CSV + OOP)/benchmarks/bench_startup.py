@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark application startup.
+
+Two parts:
+
+    imports  - cumulative `python -X importtime` cost of the manager and both
+               GUIs, each in a fresh interpreter, with the heaviest modules
+               they pull in
+    ledger   - time until a BudgetManager is ready over a ledger spanning ten
+               years, stored as one snapshot (CsvStorage) vs monthly
+               partitions that load only recent months (PartitionedCsvStorage)
+
+Usage (from the project root):
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --size 1000000
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from bench_csv_handler import make_transactions
+
+MODULES = ["src.models.budget_manager", "src.gui", "src.qt_gui"]
+
+
+def import_profile(module: str):
+    """Return [(cumulative seconds, name)] for every module imported by `import module`."""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        return None
+    profile = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        profile.append((int(cumulative) / 1e6, name.strip()))
+    return profile
+
+
+def bench_imports() -> None:
+    print(f"{'module':<28}{'import time':>14}  heaviest top-level dependencies")
+    for module in MODULES:
+        profile = import_profile(module)
+        if profile is None:
+            print(f"{module:<28}{'unavailable':>14}")
+            continue
+        total = next(seconds for seconds, name in profile if name == module)
+        top_level = sorted(
+            ((seconds, name) for seconds, name in profile if "." not in name and name != module.split(".")[0]),
+            reverse=True,
+        )[:4]
+        heaviest = ", ".join(f"{name} {seconds * 1000:.0f}ms" for seconds, name in top_level)
+        print(f"{module:<28}{total * 1000:>12.1f}ms  {heaviest}")
+
+
+def bench_ledger(size: int) -> None:
+    from src.models.budget_manager import BudgetManager
+    from src.utils.partitioned_storage import PartitionedCsvStorage
+    from src.utils.storage import CsvStorage
+
+    # Spread the ledger over the ten years ending today
+    transactions = make_transactions(size)
+    today = date.today()
+    for i, transaction in enumerate(transactions):
+        transaction.date = today - timedelta(days=i % 3650)
+
+    print(f"\n{size:,} transactions over ten years")
+    print(f"{'storage':<28}{'ready in':>14}{'loaded':>12}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, factory in (
+            ("single snapshot", CsvStorage),
+            ("monthly partitions", PartitionedCsvStorage),
+        ):
+            data_dir = os.path.join(tmpdir, name.replace(" ", "_"))
+            factory(data_dir).save_transactions(transactions)
+            start = time.perf_counter()
+            manager = BudgetManager(data_dir=data_dir, storage=factory(data_dir))
+            elapsed = time.perf_counter() - start
+            print(f"{name:<28}{elapsed * 1000:>12.1f}ms{len(manager.transactions):>12,}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, default=100_000, help="ledger size for the load benchmark")
+    args = parser.parse_args()
+    bench_imports()
+    bench_ledger(args.size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark BudgetManager.get_time_series over ten years of daily data.
+
+Builds a ledger with --per-day transactions on every day of ten years and
+times daily, weekly and monthly resampling grouped by type and by
+category, next to a per-period scan of every transaction (how a trend
+chart would be computed without an index) for the monthly series.
+
+Usage (from the project root):
+    python benchmarks/bench_time_series.py
+    python benchmarks/bench_time_series.py --per-day 100
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from bench_csv_handler import CATEGORIES
+from src.models.budget_manager import BudgetManager
+from src.models.transaction import Transaction
+
+YEARS = 10
+
+
+def make_daily_ledger(per_day: int):
+    """per_day transactions on every day of the ten years ending today."""
+    today = date.today()
+    days = YEARS * 365
+    return [
+        Transaction(
+            amount=5 + (i % 997) / 3,
+            type="income" if i % 10 == 0 else "expense",
+            category=CATEGORIES[i % len(CATEGORIES)],
+            description=f"Daily transaction {i}",
+            date=today - timedelta(days=i % days),
+        )
+        for i in range(days * per_day)
+    ]
+
+
+def scan_monthly(transactions, months):
+    """Monthly expense totals by scanning every transaction once per month."""
+    return [
+        sum(t.amount for t in transactions if t.type == "expense" and (t.date.year, t.date.month) == month)
+        for month in months
+    ]
+
+
+def timed(function, *args, repeat: int = 3, **kwargs) -> float:
+    """Return the fastest of `repeat` runs in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--per-day", type=int, default=10, help="transactions per day")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        manager.transactions = make_daily_ledger(args.per_day)
+        manager._rebuild_indexes()
+        print(f"{len(manager.transactions):,} transactions over {YEARS} years")
+
+        print(f"{'frequency':>10} {'group_by':>9} {'periods':>8} {'ms':>9}")
+        for frequency in BudgetManager.TIME_SERIES_FREQUENCIES:
+            for group_by in ("type", "category"):
+                periods = len(manager.get_time_series(frequency, group_by=group_by)["periods"])
+                elapsed = timed(manager.get_time_series, frequency, group_by=group_by)
+                print(f"{frequency:>10} {group_by:>9} {periods:>8} {elapsed:>9.1f}")
+
+        today = date.today()
+        start = date(today.year - 1, today.month, 1)
+        series = manager.get_time_series("month", start_date=start, end_date=today, type_filter="expense")
+        months = [(period.year, period.month) for period in series["periods"]]
+        indexed = timed(manager.get_time_series, "month", start_date=start, end_date=today, type_filter="expense")
+        scanned = timed(scan_monthly, manager.transactions, months, repeat=1)
+        print(f"\n{len(months)}-month expense trend: {indexed:.2f}ms indexed vs {scanned:.0f}ms scanning per month")
+
+
+if __name__ == "__main__":
+    main()
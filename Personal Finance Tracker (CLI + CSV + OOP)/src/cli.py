@@ -1,6 +1,7 @@
 import sys
 from datetime import datetime
 from src.models.budget_manager import BudgetManager
+from src.utils.partitioned_storage import PartitionedCsvStorage
 
 def print_menu():
     print("\nPersonal Finance Tracker")
@@ -58,62 +59,22 @@ def view_summary(manager):
             year = get_input("Year (YYYY, leave blank for current): ", required=False)
             now = datetime.now()
             y = int(year) if year else now.year
-            # Aggregate all months in the year
-            from datetime import date
-            total_summary = {
-                'total_income': 0.0,
-                'total_expenses': 0.0,
-                'total_transfers': 0.0,
-                'net_amount': 0.0,
-                'category_breakdown': {},
-                'transaction_count': 0
-            }
+            total_summary = manager.get_yearly_summary(y)
             all_alerts = []
             for m in range(1, 13):
-                s = manager.get_monthly_summary(y, m)
-                total_summary['total_income'] += s['total_income']
-                total_summary['total_expenses'] += s['total_expenses']
-                total_summary['total_transfers'] += s['total_transfers']
-                total_summary['net_amount'] += s['net_amount']
-                total_summary['transaction_count'] += s['transaction_count']
-                for cat, vals in s['category_breakdown'].items():
-                    if cat not in total_summary['category_breakdown']:
-                        total_summary['category_breakdown'][cat] = {'income': 0.0, 'expense': 0.0, 'transfer': 0.0}
-                    for k in ['income', 'expense', 'transfer']:
-                        total_summary['category_breakdown'][cat][k] += vals.get(k, 0.0)
                 all_alerts.extend(manager.check_budget_alerts(y, m))
             print_summary(total_summary, title=f"Yearly Summary for {y}", alerts=all_alerts)
         elif choice == "3":
             # Last 12 months summary
             now = datetime.now()
-            from datetime import timedelta
-            from collections import defaultdict
-            summaries = []
+            months = []
             all_alerts = []
             for i in range(12):
                 y = (now.year if now.month - i > 0 else now.year - 1)
                 m = (now.month - i - 1) % 12 + 1
-                summaries.append(manager.get_monthly_summary(y, m))
+                months.append((y, m))
                 all_alerts.extend(manager.check_budget_alerts(y, m))
-            total_summary = {
-                'total_income': 0.0,
-                'total_expenses': 0.0,
-                'total_transfers': 0.0,
-                'net_amount': 0.0,
-                'category_breakdown': {},
-                'transaction_count': 0
-            }
-            for s in summaries:
-                total_summary['total_income'] += s['total_income']
-                total_summary['total_expenses'] += s['total_expenses']
-                total_summary['total_transfers'] += s['total_transfers']
-                total_summary['net_amount'] += s['net_amount']
-                total_summary['transaction_count'] += s['transaction_count']
-                for cat, vals in s['category_breakdown'].items():
-                    if cat not in total_summary['category_breakdown']:
-                        total_summary['category_breakdown'][cat] = {'income': 0.0, 'expense': 0.0, 'transfer': 0.0}
-                    for k in ['income', 'expense', 'transfer']:
-                        total_summary['category_breakdown'][cat][k] += vals.get(k, 0.0)
+            total_summary = manager.get_months_summary(months)
             print_summary(total_summary, title="Summary for Last 12 Months", alerts=all_alerts)
         elif choice == "4":
             break
@@ -121,7 +82,7 @@ def view_summary(manager):
             print("Invalid option. Please try again.")
 
 def main():
-    manager = BudgetManager()
+    manager = BudgetManager(storage=PartitionedCsvStorage("data"))
     while True:
         print_menu()
         choice = get_input("Select an option: ")
@@ -284,6 +245,7 @@ def main():
             # View Summary
             view_summary(manager)
         elif choice == "10":
+            manager.flush()
             print("Goodbye!")
             sys.exit(0)
         else:
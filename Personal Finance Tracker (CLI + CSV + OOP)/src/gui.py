@@ -1,29 +1,74 @@
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 from src.models.budget_manager import BudgetManager
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
+from src.utils.partitioned_storage import PartitionedCsvStorage
 
 class FinanceTrackerApp(tk.Tk):
     def __init__(self):
         super().__init__()
         self.title("Personal Finance Tracker")
         self.geometry("700x500")
-        self.manager = BudgetManager()
+        # Saves happen on a background thread so edits never block the UI
+        self.manager = BudgetManager(storage=PartitionedCsvStorage("data"), write_behind=0.5, load=False)
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        # The visualizations window and its charts, created when first opened
+        self.charts_window = None
+        self.charts = None
         self.create_widgets()
+        # The ledger is decrypted on a background thread while the window shows a loading state
+        self.load_error = None
+        self.loader = threading.Thread(target=self.load_ledger, name="LedgerLoader", daemon=True)
+        self.loader.start()
+        self.after(50, self.check_loaded)
+
+    def load_ledger(self):
+        # Runs on the loader thread; the UI does not touch the manager until it finishes
+        try:
+            self.manager.load_data()
+        except Exception as e:
+            self.load_error = e
+
+    def check_loaded(self):
+        if self.loader.is_alive():
+            self.after(50, self.check_loaded)
+            return
+        if self.load_error is not None:
+            self.clear_content()
+            tk.Label(self.content, text=f"Could not load your transactions:\n{self.load_error}", fg="red").pack(pady=40)
+            return
+        for button in self.nav_buttons:
+            button.config(state=tk.NORMAL)
+        self.show_dashboard()
+
+    def on_close(self):
+        # Let a load still in progress finish before anything is written
+        self.loader.join()
+        # Write any changes still queued for the background saver before exiting
+        try:
+            self.manager.flush()
+        except Exception as e:
+            messagebox.showerror("Save Failed", f"Could not save your changes: {e}")
+            return
+        self.close_visualizations_window()
+        self.destroy()
 
     def create_widgets(self):
         # Navigation buttons
         nav_frame = tk.Frame(self)
         nav_frame.pack(side=tk.TOP, fill=tk.X)
-        tk.Button(nav_frame, text="Dashboard", command=self.show_dashboard).pack(side=tk.LEFT, padx=5, pady=5)
-        tk.Button(nav_frame, text="Transactions", command=self.show_transactions).pack(side=tk.LEFT, padx=5, pady=5)
-        tk.Button(nav_frame, text="Categories", command=self.show_categories).pack(side=tk.LEFT, padx=5, pady=5)
-        tk.Button(nav_frame, text="Visualizations", command=self.open_visualizations_window).pack(side=tk.LEFT, padx=5, pady=5)
+        self.nav_buttons = [
+            tk.Button(nav_frame, text="Dashboard", command=self.show_dashboard, state=tk.DISABLED),
+            tk.Button(nav_frame, text="Transactions", command=self.show_transactions, state=tk.DISABLED),
+            tk.Button(nav_frame, text="Categories", command=self.show_categories, state=tk.DISABLED),
+            tk.Button(nav_frame, text="Visualizations", command=self.open_visualizations_window, state=tk.DISABLED),
+        ]
+        for button in self.nav_buttons:
+            button.pack(side=tk.LEFT, padx=5, pady=5)
         # Main content area
         self.content = tk.Frame(self)
         self.content.pack(fill=tk.BOTH, expand=True)
-        self.show_dashboard()
+        tk.Label(self.content, text="Loading your transactions...", font=("Arial", 14), fg="gray").pack(pady=40)
 
     def clear_content(self):
         for widget in self.content.winfo_children():
@@ -31,7 +76,8 @@ class FinanceTrackerApp(tk.Tk):
 
     def show_dashboard(self):
         self.clear_content()
-        summary = self.manager.get_monthly_summary(self.manager.transactions[-1].date.year, self.manager.transactions[-1].date.month) if self.manager.transactions else self.manager.get_monthly_summary(2023, 1)
+        latest = self.manager.get_latest_date()
+        summary = self.manager.get_monthly_summary(latest.year, latest.month) if latest else self.manager.get_monthly_summary(2023, 1)
         tk.Label(self.content, text="Dashboard", font=("Arial", 18, "bold")).pack(pady=10)
         tk.Label(self.content, text=f"Total Income: ₹{summary['total_income']:.2f}", fg="green").pack()
         tk.Label(self.content, text=f"Total Expenses: ₹{summary['total_expenses']:.2f}", fg="red").pack()
@@ -74,18 +120,17 @@ class FinanceTrackerApp(tk.Tk):
                 m = 12
                 y -= 1
             months.append((y, m))
+        # Fetch each month's breakdown once rather than per category
+        prev_breakdowns = [self.manager.get_monthly_summary(y, m)['category_breakdown'] for (y, m) in months]
+        curr_breakdown = self.manager.get_monthly_summary(year, month)['category_breakdown']
         # Get all categories
         categories = [c.name for c in self.manager.get_categories()]
         for cat in categories:
             # Average over previous 3 months
-            prev_expenses = []
-            for (y, m) in months:
-                s = self.manager.get_monthly_summary(y, m)
-                val = s['category_breakdown'].get(cat, {}).get('expense', 0)
-                prev_expenses.append(val)
+            prev_expenses = [breakdown.get(cat, {}).get('expense', 0) for breakdown in prev_breakdowns]
             avg = sum(prev_expenses) / 3 if prev_expenses else 0
             # Current month
-            curr = self.manager.get_monthly_summary(year, month)['category_breakdown'].get(cat, {}).get('expense', 0)
+            curr = curr_breakdown.get(cat, {}).get('expense', 0)
             if avg > 0 and curr > avg:
                 alerts.append(f"{cat}: Current ₹{curr:.2f} > 3-mo avg ₹{avg:.2f} (+₹{curr-avg:.2f})")
         return alerts
@@ -314,30 +359,37 @@ class FinanceTrackerApp(tk.Tk):
         if not sizes:
             messagebox.showinfo("No Data", "No expenses to visualize for this month.")
             return
-        # Create new window
-        win = tk.Toplevel(self)
-        win.title("Expense Visualizations (Current Month)")
-        win.geometry("600x900")
+        if self.charts_window is None:
+            # matplotlib is imported on first use to keep startup fast
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            from src.utils.charts import ChartService
+            win = tk.Toplevel(self)
+            win.title("Expense Visualizations (Current Month)")
+            win.geometry("600x900")
+            win.protocol("WM_DELETE_WINDOW", self.close_visualizations_window)
+            self.charts_window = win
+            # Both figures stay with the window; reopening it updates them in place
+            self.charts = ChartService(lambda figure: FigureCanvasTkAgg(figure, master=win), figsize=(5, 4), fontsize=10)
+            self.charts.chart("pie").canvas.get_tk_widget().pack(fill=tk.BOTH, expand=False, pady=(10, 0))
+            self.charts.chart("bar").canvas.get_tk_widget().pack(fill=tk.BOTH, expand=False, pady=(10, 10))
         # Pie chart
-        fig1, ax1 = plt.subplots(figsize=(5, 4))
-        ax1.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=140)
-        ax1.set_title(f"Expense Breakdown by Category\n{now.year}-{now.month:02d}")
-        canvas1 = FigureCanvasTkAgg(fig1, master=win)
-        canvas1.draw()
-        canvas1.get_tk_widget().pack(fill=tk.BOTH, expand=False, pady=(10, 0))
+        self.charts.chart("pie").pie(labels, sizes, f"Expense Breakdown by Category\n{now.year}-{now.month:02d}")
         # Bar chart
-        fig2, ax2 = plt.subplots(figsize=(5, 4))
-        ax2.bar(labels, sizes, color='skyblue')
-        ax2.set_ylabel('Amount (₹)')
-        ax2.set_xlabel('Category')
-        ax2.set_title(f"Monthly Expenses by Category\n{now.year}-{now.month:02d}")
-        ax2.tick_params(axis='x', rotation=30)
-        for i, v in enumerate(sizes):
-            ax2.text(i, v + max(sizes)*0.01, f"₹{v:.2f}", ha='center', va='bottom', fontsize=9)
-        fig2.tight_layout()
-        canvas2 = FigureCanvasTkAgg(fig2, master=win)
-        canvas2.draw()
-        canvas2.get_tk_widget().pack(fill=tk.BOTH, expand=False, pady=(10, 10))
+        self.charts.chart("bar").bars(
+            labels, {'Expenses': sizes}, f"Monthly Expenses by Category\n{now.year}-{now.month:02d}",
+            xlabel='Category', ylabel='Amount (₹)', styles={'Expenses': dict(color='skyblue')}, value_labels=True,
+        )
+        self.charts_window.deiconify()
+        self.charts_window.lift()
+
+    def close_visualizations_window(self):
+        """Close the visualizations window and free its figures."""
+        if self.charts_window is None:
+            return
+        self.charts.release()
+        self.charts_window.destroy()
+        self.charts_window = None
+        self.charts = None
 
 if __name__ == "__main__":
     app = FinanceTrackerApp()
@@ -1,12 +1,22 @@
+import copy
 import csv
 import os
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from contextlib import contextmanager
 from datetime import datetime, date
-from typing import List, Dict, Optional, Tuple, Union, Literal
+from typing import Any, Callable, Iterable, Iterator, List, Dict, Optional, Tuple, Union, Literal
 from collections import defaultdict
 
 from .transaction import Transaction
 from .category import Category
-from src.utils import csv_handler
+from .search_index import SearchIndex
+from .duplicate_index import DuplicateIndex, DuplicateMatcher, fingerprint
+from src.utils.atomic import AtomicWriter
+from src.utils.csv_import import DEFAULT_IMPORT_CHUNK_SIZE, DEFAULT_MAX_IMPORT_ERRORS, iter_parsed_chunks
+from src.utils.json_stream import iter_json_lines, iter_json_members
+from src.utils.storage import StorageBackend, CsvStorage
 
 
 class BudgetManager:
@@ -14,21 +24,98 @@ class BudgetManager:
     Main manager class for handling all budget operations.
     
     Manages transactions, categories, and provides summary functionality.
+    
+    With use_columnar=True the transactions are also mirrored into a
+    NumPy-backed ColumnarStore, and range summaries and trends are computed
+    with vectorized group-bys. This requires numpy.
+    
+    Persistence goes through a StorageBackend: the encrypted CSV snapshot
+    and journal in data_dir by default, or e.g. a SqliteStorage passed as
+    storage.
+    
+    With a storage that loads lazily (PartitionedCsvStorage) only recent
+    transactions are in self.transactions after startup; queries that
+    reach further back load the older ones first.
+    
+    With write_behind set to a number of seconds, mutations only mark the
+    ledger dirty; a background thread coalesces everything changed within
+    that debounce window into one write. Call flush() before exiting.
+    
+    Views keep up with the ledger through subscribe(), which reports each
+    change instead of making them re-read everything.
     """
     
-    def __init__(self, data_dir: str = "data"):
+    # Number of journal records after which the journal is folded into a fresh snapshot
+    JOURNAL_COMPACT_THRESHOLD = 500
+    
+    # Batches with more changes than this are reported to listeners as one 'reset'
+    NOTIFY_RESET_THRESHOLD = 1000
+    
+    # Periods get_time_series can resample to
+    TIME_SERIES_FREQUENCIES = ("day", "week", "month")
+    
+    def __init__(
+        self,
+        data_dir: str = "data",
+        use_columnar: bool = False,
+        storage: Optional[StorageBackend] = None,
+        write_behind: Optional[float] = None,
+        load: bool = True
+    ):
         self.data_dir = data_dir
+        self.use_columnar = use_columnar
+        self.write_behind = write_behind
         self.transactions: List[Transaction] = []
         self.categories: Dict[str, Category] = {}
         
+        # Transaction id -> position in self.transactions
+        self._id_index: Dict[str, int] = {}
+        
+        # Date index: sorted date ordinals with the matching transactions
+        self._date_ordinals: List[int] = []
+        self._date_entries: List[Transaction] = []
+        
+        # Monthly aggregates: (year, month) -> (category, type) -> [total, count]
+        self._monthly_totals: Dict[Tuple[int, int], Dict[Tuple[str, str], List[float]]] = {}
+        
+        # Optional column store, created by _rebuild_indexes when enabled
+        self._columns = None
+        
+        # Search index, built on the first search and maintained afterwards
+        self._search_index: Optional[SearchIndex] = None
+        
+        # Duplicate fingerprint counts, built on the first lookup and maintained afterwards
+        self._duplicate_index: Optional[DuplicateIndex] = None
+        
+        # Undo log of the open batch: (op, transaction, previous field values, ledger position of a delete)
+        self._batch: Optional[List[Tuple[str, Transaction, Optional[Dict[str, Any]], Optional[int]]]] = None
+        
+        # Write-behind state: unsaved changes coalesced by id, guarded by _pending_cv
+        self._pending: Dict[str, Tuple[str, Transaction]] = {}
+        self._pending_cv = threading.Condition()
+        self._writer: Optional[threading.Thread] = None
+        self.write_error: Optional[BaseException] = None
+        
+        # Change listeners, see subscribe()
+        self._listeners: List[Callable[[str, Any, Optional[Dict[str, Any]]], None]] = []
+        
+        # _lock guards the structure of self.transactions and its indexes; _io_lock serializes storage writes
+        self._lock = threading.RLock()
+        self._io_lock = threading.Lock()
+        
         # Ensure data directory exists
         os.makedirs(data_dir, exist_ok=True)
         
+        # Where transactions and categories are persisted
+        self.storage = storage if storage is not None else CsvStorage(data_dir)
+        
         # Initialize with predefined categories
         self._initialize_categories()
         
-        # Load existing data
-        self.load_data()
+        # Load existing data; with load=False the caller runs load_data() later,
+        # e.g. on a background thread while the UI shows a loading state
+        if load:
+            self.load_data()
     
     def _initialize_categories(self) -> None:
         """Initialize with predefined categories."""
@@ -64,14 +151,96 @@ class BudgetManager:
             raise ValueError("Transaction type must be 'income', 'expense', or 'transfer'")
         
         # Create and add transaction
+        if date is not None:
+            self._ensure_loaded(date)
         transaction = Transaction(amount, type, category, description, date)  # type: ignore
-        self.transactions.append(transaction)
+        self._append_transaction(transaction)
         
-        # Save to CSV
-        self.save_transactions()
+        # Record the change in the journal
+        self._log_change("add", transaction)
         
         return transaction
     
+    def add_transactions(self, transactions: Iterable[Transaction]) -> List[Transaction]:
+        """
+        Add many transactions and persist them with a single save.
+        
+        Every transaction is validated like add_transaction (and must have an
+        unused id). If any of them is invalid, or saving fails, none of them
+        are added.
+        """
+        added = []
+        with self.batch():
+            for transaction in transactions:
+                self._add_existing(transaction)
+                added.append(transaction)
+        return added
+    
+    def _add_existing(self, transaction: Transaction) -> None:
+        """Validate and add an already constructed transaction, keeping its id."""
+        # Ids must be unique across the whole ledger, not just the loaded part
+        self._ensure_loaded()
+        if transaction.category not in self.categories:
+            raise ValueError(f"Category '{transaction.category}' does not exist. Please create it first.")
+        self._append_transaction(transaction)
+        self._log_change("add", transaction)
+    
+    @contextmanager
+    def batch(self) -> Iterator['BudgetManager']:
+        """
+        Group transaction mutations into one atomic save.
+        
+        Adds, edits and deletes made inside the block are applied in memory
+        immediately but persisted together when the block exits. If the block
+        raises, or the save fails, the in-memory changes are rolled back and
+        the exception propagates. Nested batches join the outermost one.
+        """
+        # Set and cleared under _lock, which compaction holds while it checks for a batch and snapshots
+        with self._lock:
+            if self._batch is not None:
+                changes = None
+            else:
+                self._batch = changes = []
+        if changes is None:
+            yield self
+            return
+        
+        try:
+            yield self
+            if changes:
+                self._persist([(op, t) for op, t, _, _ in changes])
+        except BaseException:
+            self._rollback(changes)
+            raise
+        finally:
+            with self._lock:
+                self._batch = None
+        
+        # Compaction waits while a batch is open; catch up now that it is committed
+        if changes and self.write_behind is None:
+            with self._io_lock:
+                self._compact_if_needed()
+        
+        # Listeners only hear about a batch once it has committed
+        if len(changes) > self.NOTIFY_RESET_THRESHOLD:
+            self._notify("reset")
+        else:
+            for op, transaction, previous, _ in changes:
+                self._notify(op, transaction, previous)
+    
+    def _rollback(self, undo_log: List[Tuple[str, Transaction, Optional[Dict[str, Any]], Optional[int]]]) -> None:
+        """Revert in-memory mutations recorded in a batch, newest first, restoring the ledger order."""
+        for op, transaction, previous, position in reversed(undo_log):
+            if op == "add":
+                self._remove_transaction(transaction)
+            elif op == "delete":
+                self._insert_transaction(transaction, position)
+            else:
+                with self._lock:
+                    self._unindex_values(transaction)
+                    transaction.update_fields(**previous)
+                    self._index_values(transaction)
+    
     def edit_transaction(
         self,
         transaction_id: str,
@@ -86,14 +255,11 @@ class BudgetManager:
         if not transaction:
             return False
         
-        if amount is not None:
-            if amount <= 0:
-                raise ValueError("Amount must be positive")
-            transaction.amount = amount
-        if type is not None:
-            if type not in ["income", "expense", "transfer"]:
-                raise ValueError("Transaction type must be 'income', 'expense', or 'transfer'")
-            transaction.type = type
+        # Validate everything before touching the transaction or the indexes
+        if amount is not None and amount <= 0:
+            raise ValueError("Amount must be positive")
+        if type is not None and type not in ["income", "expense", "transfer"]:
+            raise ValueError("Transaction type must be 'income', 'expense', or 'transfer'")
         if category is not None:
             # Validate category
             if not category or not category.strip():
@@ -103,31 +269,170 @@ class BudgetManager:
             
             if category not in self.categories:
                 raise ValueError(f"Category '{category}' does not exist")
-            transaction.category = category
-        if description is not None:
-            transaction.description = description
+        
         if date is not None:
-            transaction.date = date
+            self._ensure_loaded(date)
+        previous = {
+            'amount': transaction.amount, 'type': transaction.type, 'category': transaction.category,
+            'description': transaction.description, 'date': transaction.date
+        }
+        with self._lock:
+            self._unindex_values(transaction)
+            transaction.update_fields(amount=amount, type=type, category=category, description=description, date=date)
+            self._index_values(transaction)
         
-        # Save to CSV
-        self.save_transactions()
+        # Record the change in the journal
+        self._log_change("edit", transaction, previous)
         return True
     
     def delete_transaction(self, transaction_id: str) -> bool:
         """Delete a transaction by ID."""
         transaction = self.get_transaction_by_id(transaction_id)
         if transaction:
-            self.transactions.remove(transaction)
-            self.save_transactions()
+            position = self._remove_transaction(transaction)
+            self._log_change("delete", transaction, position=position)
             return True
         return False
     
     def get_transaction_by_id(self, transaction_id: str) -> Optional[Transaction]:
         """Get transaction by ID."""
+        position = self._id_index.get(transaction_id)
+        if position is None and self.storage.loaded_since is not None:
+            # It may live in a partition that has not been loaded yet
+            self._ensure_loaded()
+            position = self._id_index.get(transaction_id)
+        if position is None:
+            return None
+        return self.transactions[position]
+    
+    def clear_transactions(self) -> None:
+        """Delete all transactions and persist an empty ledger."""
+        self._ensure_loaded()
+        self.transactions = []
+        self._rebuild_indexes()
+        self.save_transactions()
+        self._notify("reset")
+    
+    def _append_transaction(self, transaction: Transaction) -> None:
+        """Append a transaction and register it in the lookup indexes."""
+        self._insert_transaction(transaction, None)
+    
+    def _insert_transaction(self, transaction: Transaction, position: Optional[int]) -> None:
+        """Insert a transaction at a ledger position (None appends) and register it in the lookup indexes."""
+        if transaction.id in self._id_index:
+            raise ValueError(f"Transaction '{transaction.id}' already exists")
+        with self._lock:
+            if position is None or position >= len(self.transactions):
+                self._id_index[transaction.id] = len(self.transactions)
+                self.transactions.append(transaction)
+            else:
+                self.transactions.insert(position, transaction)
+                self._reindex_from(position)
+            self._index_values(transaction)
+    
+    def _remove_transaction(self, transaction: Transaction) -> int:
+        """Remove a transaction, keeping the ledger in insertion order, and return its position.
+        
+        Only the positions after it are renumbered, so removing recent
+        transactions, the usual case, stays cheap.
+        """
+        with self._lock:
+            position = self._id_index.pop(transaction.id)
+            del self.transactions[position]
+            self._reindex_from(position)
+            self._unindex_values(transaction)
+        return position
+    
+    def _reindex_from(self, start: int) -> None:
+        """Refresh the id -> position entries from start to the end of the ledger; caller holds _lock."""
+        id_index = self._id_index
+        transactions = self.transactions
+        for position in range(start, len(transactions)):
+            id_index[transactions[position].id] = position
+    
+    def _index_values(self, transaction: Transaction) -> None:
+        """Register a transaction's field values in the date, aggregate, search and duplicate indexes."""
+        self._date_index_insert(transaction)
+        self._aggregate(transaction, 1)
+        if self._columns is not None:
+            self._columns.append(transaction)
+        if self._search_index is not None:
+            self._search_index.add(transaction)
+        if self._duplicate_index is not None:
+            self._duplicate_index.add(transaction)
+    
+    def _unindex_values(self, transaction: Transaction) -> None:
+        """Withdraw a transaction's field values; call before mutating its fields."""
+        self._date_index_remove(transaction)
+        self._aggregate(transaction, -1)
+        if self._columns is not None:
+            self._columns.remove(transaction)
+        if self._search_index is not None:
+            self._search_index.remove(transaction)
+        if self._duplicate_index is not None:
+            self._duplicate_index.remove(transaction)
+    
+    def _aggregate(self, transaction: Transaction, sign: int) -> None:
+        """Add (sign=1) or subtract (sign=-1) a transaction from the monthly aggregates."""
+        month_key = (transaction.date.year, transaction.date.month)
+        cells = self._monthly_totals.setdefault(month_key, {})
+        cell = cells.setdefault((transaction.category, transaction.type), [0.0, 0])
+        cell[0] += sign * transaction.amount
+        cell[1] += sign
+        if cell[1] == 0:
+            # Drop empty cells so that rounding residue never outlives the rows
+            del cells[(transaction.category, transaction.type)]
+            if not cells:
+                del self._monthly_totals[month_key]
+    
+    def _date_index_insert(self, transaction: Transaction) -> None:
+        """Insert a transaction into the date index after any same-day entries."""
+        ordinal = transaction.date.toordinal()
+        position = bisect_right(self._date_ordinals, ordinal)
+        self._date_ordinals.insert(position, ordinal)
+        self._date_entries.insert(position, transaction)
+    
+    def _date_index_remove(self, transaction: Transaction) -> None:
+        """Remove a transaction from the date index using its current date."""
+        ordinal = transaction.date.toordinal()
+        start = bisect_left(self._date_ordinals, ordinal)
+        end = bisect_right(self._date_ordinals, ordinal, lo=start)
+        candidates = range(start, end)
+        if not any(self._date_entries[position] is transaction for position in candidates):
+            # The date was changed outside the manager; fall back to a full scan
+            candidates = range(len(self._date_entries))
+        for position in candidates:
+            if self._date_entries[position] is transaction:
+                del self._date_ordinals[position]
+                del self._date_entries[position]
+                return
+    
+    def _transactions_in_range(self, date_from: Optional[date] = None, date_to: Optional[date] = None) -> List[Transaction]:
+        """Return transactions between two dates (inclusive) in ascending date order."""
+        start = bisect_left(self._date_ordinals, date_from.toordinal()) if date_from else 0
+        end = bisect_right(self._date_ordinals, date_to.toordinal()) if date_to else len(self._date_ordinals)
+        return self._date_entries[start:end]
+    
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the lookup indexes from self.transactions."""
+        self._id_index = {t.id: position for position, t in enumerate(self.transactions)}
+        self._date_entries = sorted(self.transactions, key=lambda t: t.date.toordinal())
+        self._date_ordinals = [t.date.toordinal() for t in self._date_entries]
+        self._monthly_totals = {}
         for transaction in self.transactions:
-            if transaction.id == transaction_id:
-                return transaction
-        return None
+            self._aggregate(transaction, 1)
+        if self.use_columnar:
+            from .columnar_store import ColumnarStore
+            self._columns = ColumnarStore.from_transactions(self.transactions)
+        self._search_index = None
+        self._duplicate_index = None
+    
+    def get_latest_date(self) -> Optional[date]:
+        """Date of the most recent transaction, from the date index; None for an empty ledger."""
+        if not self._date_entries:
+            # Loaded transactions are the most recent ones, so only an empty load needs the rest
+            self._ensure_loaded()
+        return self._date_entries[-1].date if self._date_entries else None
     
     def get_transactions(
         self,
@@ -137,7 +442,10 @@ class BudgetManager:
         date_to: Optional[date] = None
     ) -> List[Transaction]:
         """Get filtered transactions."""
-        filtered_transactions = self.transactions
+        self._ensure_loaded(date_from)
+        
+        # Date bounds are resolved with a binary search over the date index
+        filtered_transactions = self._transactions_in_range(date_from, date_to)
         
         if type_filter:
             filtered_transactions = [t for t in filtered_transactions if t.type == type_filter]
@@ -145,12 +453,6 @@ class BudgetManager:
         if category_filter:
             filtered_transactions = [t for t in filtered_transactions if t.category == category_filter]
         
-        if date_from:
-            filtered_transactions = [t for t in filtered_transactions if t.date.date() >= date_from]
-        
-        if date_to:
-            filtered_transactions = [t for t in filtered_transactions if t.date.date() <= date_to]
-        
         # Sort by date (newest first)
         filtered_transactions.sort(key=lambda x: x.date, reverse=True)
         
@@ -177,6 +479,7 @@ class BudgetManager:
         
         # Save categories to CSV
         self.save_categories()
+        self._notify("add_category", category)
         
         return category
     
@@ -186,6 +489,7 @@ class BudgetManager:
             return False
         
         category = self.categories[name]
+        previous = {'name': category.name, 'budget_limit': category.budget_limit}
         
         # Validate new name if provided (even if it's empty)
         if new_name is not None:
@@ -199,10 +503,31 @@ class BudgetManager:
                 if new_name in self.categories:
                     raise ValueError(f"Category '{new_name}' already exists")
                 
+                # Every stored transaction is rewritten, so all of them must be in memory
+                self._ensure_loaded()
+                
                 # Update category name in transactions
-                for transaction in self.transactions:
-                    if transaction.category == name:
-                        transaction.category = new_name
+                with self._lock:
+                    for transaction in self.transactions:
+                        if transaction.category == name:
+                            if self._search_index is not None:
+                                self._search_index.remove(transaction)
+                            if self._duplicate_index is not None:
+                                self._duplicate_index.remove(transaction)
+                            transaction.category = new_name
+                            if self._search_index is not None:
+                                self._search_index.add(transaction)
+                            if self._duplicate_index is not None:
+                                self._duplicate_index.add(transaction)
+                
+                    # Move the aggregate cells over to the new name
+                    for cells in self._monthly_totals.values():
+                        for type_name in ("income", "expense", "transfer"):
+                            cell = cells.pop((name, type_name), None)
+                            if cell is not None:
+                                cells[(new_name, type_name)] = cell
+                    if self._columns is not None:
+                        self._columns.rename_category(name, new_name)
                 
                 # Remove old category and add new one
                 del self.categories[name]
@@ -218,6 +543,7 @@ class BudgetManager:
         # Save data
         self.save_categories()
         self.save_transactions()
+        self._notify("edit_category", category, previous)
         
         return True
     
@@ -231,11 +557,12 @@ class BudgetManager:
             raise ValueError("Cannot delete predefined categories")
         
         # Check if category is used in transactions
-        if any(t.category == name for t in self.transactions):
+        if self._category_in_use(name):
             raise ValueError(f"Cannot delete category '{name}' as it is used in transactions")
         
         del self.categories[name]
         self.save_categories()
+        self._notify("delete_category", category)
         return True
     
     def get_categories(self) -> List[Category]:
@@ -248,7 +575,30 @@ class BudgetManager:
     
     def get_summary(self, start_date: Optional[date] = None, end_date: Optional[date] = None) -> Dict:
         """Get financial summary for a date range."""
-        filtered_transactions = self.get_transactions(date_from=start_date, date_to=end_date)
+        self._ensure_loaded(start_date)
+        
+        # Whole-month ranges are answered from the monthly aggregates
+        starts_on_month = start_date is None or start_date.day == 1
+        ends_on_month = end_date is None or (end_date + date.resolution).day == 1
+        if starts_on_month and ends_on_month:
+            first = (start_date.year, start_date.month) if start_date else None
+            last = (end_date.year, end_date.month) if end_date else None
+            return self.get_months_summary(
+                key for key in self._monthly_totals
+                if (first is None or key >= first) and (last is None or key <= last)
+            )
+        
+        if self._columns is not None:
+            return self._columns.summarize(start_date, end_date)
+        # Storage only reflects written changes: not an open batch or the write-behind queue
+        with self._io_lock:
+            with self._pending_cv:
+                written = self._batch is None and not self._pending
+            summary = self.storage.summarize(start_date, end_date) if written else None
+        if summary is not None:
+            return summary
+        
+        filtered_transactions = self._transactions_in_range(start_date, end_date)
         
         total_income = sum(t.amount for t in filtered_transactions if t.is_income())
         total_expenses = sum(t.amount for t in filtered_transactions if t.is_expense())
@@ -268,15 +618,146 @@ class BudgetManager:
             'transaction_count': len(filtered_transactions)
         }
     
+    def get_months_summary(self, months: Iterable[Tuple[int, int]]) -> Dict:
+        """Get a combined summary for a set of (year, month) pairs from the monthly aggregates."""
+        months = set(months)
+        if months:
+            year, month = min(months)
+            self._ensure_loaded(date(year, month, 1))
+        
+        totals = {'income': 0.0, 'expense': 0.0, 'transfer': 0.0}
+        category_breakdown = defaultdict(lambda: {'income': 0.0, 'expense': 0.0, 'transfer': 0.0})
+        transaction_count = 0
+        
+        for month_key in months:
+            for (category, type_name), (total, count) in self._monthly_totals.get(month_key, {}).items():
+                totals[type_name] += total
+                category_breakdown[category][type_name] += total
+                transaction_count += count
+        
+        return {
+            'total_income': totals['income'],
+            'total_expenses': totals['expense'],
+            'total_transfers': totals['transfer'],
+            'net_amount': totals['income'] - totals['expense'],
+            'category_breakdown': dict(category_breakdown),
+            'transaction_count': transaction_count
+        }
+    
     def get_monthly_summary(self, year: int, month: int) -> Dict:
         """Get summary for a specific month."""
-        start_date = date(year, month, 1)
-        if month == 12:
-            end_date = date(year + 1, 1, 1) - date.resolution
+        return self.get_months_summary([(year, month)])
+    
+    def get_yearly_summary(self, year: int) -> Dict:
+        """Get summary for a calendar year."""
+        return self.get_months_summary((year, month) for month in range(1, 13))
+    
+    def get_time_series(
+        self,
+        frequency: str = "month",
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        type_filter: Optional[str] = None,
+        category_filter: Optional[str] = None,
+        group_by: str = "type"
+    ) -> Dict:
+        """
+        Get totals per day, week (starting Monday) or month.
+        
+        Whole months are read from the monthly aggregates; days, weeks and
+        months cut by start_date or end_date are summed in one pass over
+        the date index. Every period from the first to the last is present,
+        with zeros where nothing happened, so the series can be plotted
+        as is. Without dates the series spans the whole ledger.
+        
+        Returns:
+            {'periods': [first day of each period], 'series': {group: [total per period]}}
+            where a group is a transaction type (group_by='type') or a
+            category (group_by='category') with transactions in the range
+        """
+        if frequency not in self.TIME_SERIES_FREQUENCIES:
+            raise ValueError("frequency must be 'day', 'week' or 'month'")
+        if group_by not in ("type", "category"):
+            raise ValueError("group_by must be 'type' or 'category'")
+        if isinstance(start_date, datetime):
+            start_date = start_date.date()
+        if isinstance(end_date, datetime):
+            end_date = end_date.date()
+        self._ensure_loaded(start_date)
+        if not self._date_ordinals:
+            return {'periods': [], 'series': {}}
+        first = (start_date or date.fromordinal(self._date_ordinals[0])).toordinal()
+        last = (end_date or date.fromordinal(self._date_ordinals[-1])).toordinal()
+        if first > last:
+            return {'periods': [], 'series': {}}
+        
+        # First day of every period, as ordinals
+        if frequency == "day":
+            starts = list(range(first, last + 1))
+        elif frequency == "week":
+            # Ordinal 1 (0001-01-01) is a Monday
+            starts = list(range(first - (first - 1) % 7, last + 1, 7))
+        else:
+            first_day, last_day = date.fromordinal(first), date.fromordinal(last)
+            months = []
+            year, month = first_day.year, first_day.month
+            while (year, month) <= (last_day.year, last_day.month):
+                months.append((year, month))
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+            starts = [date(year, month, 1).toordinal() for year, month in months]
+        
+        # Days per period when scanning by day or week
+        step = 7 if frequency == "week" else 1
+        series: Dict[str, List[float]] = {}
+        
+        def totals_for(category: str, type_name: str) -> Optional[List[float]]:
+            """The series a (category, type) cell adds to, or None if it is filtered out."""
+            if (type_filter and type_name != type_filter) or (category_filter and category != category_filter):
+                return None
+            key = type_name if group_by == "type" else category
+            totals = series.get(key)
+            if totals is None:
+                totals = series[key] = [0.0] * len(starts)
+            return totals
+        
+        def scan(scan_first: int, scan_last: int, period: Optional[int] = None) -> None:
+            """Add the transactions between two ordinals, to period or to their day/week."""
+            start = bisect_left(self._date_ordinals, scan_first)
+            end = bisect_right(self._date_ordinals, scan_last)
+            for position in range(start, end):
+                transaction = self._date_entries[position]
+                totals = totals_for(transaction.category, transaction.type)
+                if totals is not None:
+                    index = period
+                    if index is None:
+                        index = (self._date_ordinals[position] - starts[0]) // step
+                    totals[index] += transaction.amount
+        
+        if frequency != "month":
+            scan(first, last)
         else:
-            end_date = date(year, month + 1, 1) - date.resolution
+            for period, (year, month) in enumerate(months):
+                month_first = starts[period]
+                month_last = date(year + (month == 12), month % 12 + 1, 1).toordinal() - 1
+                if month_first < first or month_last > last:
+                    # Only part of the month is in range
+                    scan(max(month_first, first), min(month_last, last), period)
+                    continue
+                for (category, type_name), (total, _) in self._monthly_totals.get((year, month), {}).items():
+                    totals = totals_for(category, type_name)
+                    if totals is not None:
+                        totals[period] += total
         
-        return self.get_summary(start_date, end_date)
+        return {'periods': [date.fromordinal(ordinal) for ordinal in starts], 'series': series}
+    
+    def _category_in_use(self, name: str) -> bool:
+        """Check whether any transaction uses the category."""
+        self._ensure_loaded()
+        return any(
+            category == name
+            for cells in self._monthly_totals.values()
+            for category, _ in cells
+        )
     
     def check_budget_alerts(self, year: int, month: int) -> List[str]:
         """Check for budget limit violations."""
@@ -296,42 +777,182 @@ class BudgetManager:
         
         return alerts
     
+    @property
+    def journal(self):
+        """The mutation journal of the default CSV storage (None for other backends)."""
+        return getattr(self.storage, 'journal', None)
+    
+    def _log_change(self, op: str, transaction: Transaction, previous: Optional[Dict[str, Any]] = None,
+                    position: Optional[int] = None) -> None:
+        """Persist a single mutation, compacting when too many are pending.
+        
+        Inside a batch the mutation is only recorded in the batch's undo log,
+        along with the ledger position a deleted transaction had.
+        """
+        if self._batch is not None:
+            self._batch.append((op, transaction, previous, position))
+            return
+        self._persist([(op, transaction)])
+        self._notify(op, transaction, previous)
+    
+    def subscribe(self, listener: Callable[[str, Any, Optional[Dict[str, Any]]], None]) -> Callable[[], None]:
+        """
+        Call listener(op, subject, previous) after every change.
+        
+        'add', 'edit' and 'delete' report a Transaction; for edits previous
+        holds its field values before the change. 'add_category',
+        'edit_category' and 'delete_category' report a Category; for edits
+        previous holds its old name and budget limit. 'reset' (subject None)
+        means the ledger was replaced or changed wholesale and should be
+        re-read. Changes made in a batch are reported when it commits, and
+        not at all if it rolls back. Listeners run on the thread that made
+        the change.
+        
+        Returns a function that removes the listener.
+        """
+        self._listeners.append(listener)
+        return lambda: self.unsubscribe(listener)
+    
+    def unsubscribe(self, listener: Callable[[str, Any, Optional[Dict[str, Any]]], None]) -> None:
+        """Stop calling a listener added with subscribe()."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    def _notify(self, op: str, subject: Any = None, previous: Optional[Dict[str, Any]] = None) -> None:
+        """Report a change to every listener."""
+        for listener in list(self._listeners):
+            listener(op, subject, previous)
+    
+    def _persist(self, changes: List[Tuple[str, Transaction]]) -> None:
+        """Write changes now, or hand them to the write-behind thread."""
+        if self.write_behind is None:
+            with self._io_lock:
+                self.storage.record_changes(changes)
+                self._compact_if_needed()
+            return
+        
+        with self._pending_cv:
+            for op, transaction in changes:
+                # Later changes to the same transaction supersede earlier ones; a
+                # copy keeps the writer from seeing half-applied edits
+                self._pending.pop(transaction.id, None)
+                self._pending[transaction.id] = (op, copy.copy(transaction))
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._write_behind_loop, name="BudgetManagerWriter", daemon=True)
+                self._writer.start()
+            self._pending_cv.notify()
+    
+    def _write_behind_loop(self) -> None:
+        """Background writer: wait for changes, let the debounce window pass, write them."""
+        while True:
+            with self._pending_cv:
+                while not self._pending:
+                    self._pending_cv.wait()
+                deadline = time.monotonic() + self.write_behind
+                while self._pending and time.monotonic() < deadline:
+                    self._pending_cv.wait(deadline - time.monotonic())
+            try:
+                self._write_pending()
+                self.write_error = None
+            except Exception as e:
+                # Keep the changes queued; flush() retries and reports the error
+                self.write_error = e
+                time.sleep(self.write_behind)
+    
+    def _write_pending(self) -> None:
+        """Write all queued changes as one unit, compacting afterwards if needed."""
+        with self._io_lock:
+            with self._pending_cv:
+                changes, self._pending = self._pending, {}
+            if changes:
+                try:
+                    self.storage.record_changes(list(changes.values()))
+                except BaseException:
+                    with self._pending_cv:
+                        changes.update(self._pending)
+                        self._pending = changes
+                    raise
+            self._compact_if_needed()
+    
+    def _compact_if_needed(self) -> None:
+        """Fold pending journal records into a snapshot; caller holds _io_lock.
+        
+        Skipped while a batch is open, since the snapshot would include its
+        uncommitted changes and defeat its rollback.
+        """
+        if self.storage.pending_changes < self.JOURNAL_COMPACT_THRESHOLD:
+            return
+        with self._lock:
+            if self._batch is not None:
+                return
+            # Copies, so a batch opened while the snapshot is written cannot change what it holds
+            snapshot = [copy.copy(t) for t in self.transactions]
+        self.storage.save_transactions(snapshot)
+    
+    def flush(self) -> None:
+        """Synchronously write any changes still waiting for the write-behind thread."""
+        self._write_pending()
+        self.write_error = None
+    
     def save_transactions(self) -> None:
-        """Save transactions to encrypted CSV file using csv_handler."""
-        filepath = os.path.join(self.data_dir, "transactions.csv.enc")
-        csv_handler.write_transactions(filepath, self.transactions)
+        """Save a full snapshot of the transactions to storage."""
+        with self._io_lock:
+            # The snapshot already contains every queued change
+            with self._pending_cv:
+                self._pending = {}
+            with self._lock:
+                snapshot = list(self.transactions)
+            self.storage.save_transactions(snapshot)
 
     def save_categories(self) -> None:
-        """Save categories to CSV file using csv_handler."""
-        filepath = os.path.join(self.data_dir, "categories.csv")
-        csv_handler.write_categories(filepath, list(self.categories.values()))
+        """Save categories to storage."""
+        with self._io_lock:
+            self.storage.save_categories(self.categories.values())
 
     def load_data(self) -> None:
-        """Load data from CSV files."""
+        """Load transactions and categories from storage."""
         self.load_transactions()
         self.load_categories()
     
     def load_transactions(self) -> None:
-        """Load transactions from encrypted CSV file using csv_handler."""
-        # Try encrypted file first, fall back to unencrypted for migration
-        encrypted_filepath = os.path.join(self.data_dir, "transactions.csv.enc")
-        unencrypted_filepath = os.path.join(self.data_dir, "transactions.csv")
-        
-        if os.path.exists(encrypted_filepath):
-            self.transactions = csv_handler.read_transactions(encrypted_filepath)
-        elif os.path.exists(unencrypted_filepath):
-            # Migrate unencrypted file to encrypted
-            self.transactions = csv_handler.read_transactions(unencrypted_filepath)
-            # Save as encrypted and remove unencrypted file
-            self.save_transactions()
-            os.remove(unencrypted_filepath)
-        else:
-            self.transactions = []
+        """Load transactions from storage and rebuild the indexes.
+        
+        Storage that loads lazily only returns recent transactions here;
+        older ones are pulled in by _ensure_loaded when a query needs them.
+        """
+        self.transactions = self.storage.load_recent()
+        self._rebuild_indexes()
+        self._notify("reset")
+    
+    def _ensure_loaded(self, since: Optional[Union[date, datetime]] = None) -> None:
+        """Make sure every transaction dated on or after since (all of them when None) is in memory."""
+        loaded_since = self.storage.loaded_since
+        if loaded_since is None:
+            return
+        if isinstance(since, datetime):
+            since = since.date()
+        if since is not None and since >= loaded_since:
+            return
+        # storage.loaded_since moves before the merge, so readers under _lock must not see the gap
+        with self._io_lock, self._lock:
+            older = self.storage.load_older(since)
+            if older:
+                self.transactions.extend(older)
+                self._rebuild_indexes()
+    
+    def load_all(self) -> None:
+        """
+        Load every stored transaction into memory.
+        
+        Call this on the thread that owns the ledger before handing it to a
+        worker thread that only reads it, such as a background search.
+        """
+        self._ensure_loaded()
 
     def load_categories(self) -> None:
-        """Load categories from CSV file."""
+        """Load categories from storage."""
         try:
-            categories = csv_handler.read_categories(os.path.join(self.data_dir, "categories.csv"))
+            categories = self.storage.load_categories()
             for category in categories:
                 self.categories[category.name] = category
         except FileNotFoundError:
@@ -339,33 +960,45 @@ class BudgetManager:
     
     def search_transactions(self, query: str) -> List[Transaction]:
         """Search transactions by description, category, or amount."""
+        self._ensure_loaded()
         query = query.lower().strip()
         if not query:
             return self.transactions
         
-        results = []
-        for transaction in self.transactions:
-            # Search in description
-            if query in transaction.description.lower():
-                results.append(transaction)
-                continue
-            
-            # Search in category
-            if query in transaction.category.lower():
-                results.append(transaction)
-                continue
-            
-            # Search in amount (exact match)
-            if query == str(int(transaction.amount)):
-                results.append(transaction)
-                continue
+        # Held so a search on a worker thread sees a consistent ledger
+        with self._lock:
+            if self._search_index is None:
+                self._search_index = SearchIndex(self.transactions)
             
-            # Search in amount (partial match)
-            if query in str(transaction.amount):
-                results.append(transaction)
-                continue
+            # Keep results in ledger order
+            matches = self._search_index.search(query)
+            return sorted(matches, key=lambda t: self._id_index[t.id])
+    
+    def _duplicates(self) -> DuplicateIndex:
+        """The duplicate index, built on first use."""
+        if self._duplicate_index is None:
+            self._duplicate_index = DuplicateIndex(self.transactions)
+        return self._duplicate_index
+    
+    def count_duplicates(
+        self,
+        amount: float,
+        type: str,
+        category: str,
+        description: str = "",
+        date: Optional[Union[date, datetime]] = None
+    ) -> int:
+        """
+        Count existing transactions that look like the given one.
         
-        return results
+        Transactions match when they share the date, the amount to the cent,
+        the type, the category and the description ignoring case and extra
+        whitespace.
+        """
+        when = date or datetime.now()
+        self._ensure_loaded(when)
+        key = fingerprint(amount, type, category.strip(), description, when)
+        return self._duplicates().count(key)
     
     def get_expense_trends(self, months: int = 6) -> Dict:
         """Get expense trends over the last N months."""
@@ -373,11 +1006,27 @@ class BudgetManager:
         current_date = datetime.now()
         year = current_date.year
         month = current_date.month
+        columnar = None
+        if months > 0:
+            first_index = year * 12 + month - months
+            self._ensure_loaded(date(first_index // 12, first_index % 12 + 1, 1))
+        if self._columns is not None and months > 0:
+            columnar = self._columns.monthly_totals(date(first_index // 12, first_index % 12 + 1, 1))
         for _ in range(months):
             # Always keep month in 1..12 and decrement year accordingly
             if month < 1:
                 month = 12
                 year -= 1
+            if columnar is not None:
+                cell = columnar.get((year, month), {'income': 0.0, 'expense': 0.0, 'count': 0})
+                trends[f"{year}-{month:02d}"] = {
+                    'total_expenses': cell['expense'],
+                    'total_income': cell['income'],
+                    'net_amount': cell['income'] - cell['expense'],
+                    'transaction_count': cell['count']
+                }
+                month -= 1
+                continue
             summary = self.get_monthly_summary(year, month)
             trends[f"{year}-{month:02d}"] = {
                 'total_expenses': summary['total_expenses'],
@@ -429,14 +1078,25 @@ class BudgetManager:
         
         return performance
     
-    def export_data(self, format: str = "csv", filepath: Optional[str] = None) -> str:
-        """Export data in various formats."""
+    def export_data(self, format: str = "csv", filepath: Optional[str] = None, partition: Optional[str] = None) -> str:
+        """Export data in various formats.
+        
+        For 'parquet' and 'arrow', partition='year' or 'month' writes one file
+        per period into the directory filepath instead of a single file.
+        """
+        self._ensure_loaded()
+        if format.lower() in ("parquet", "arrow"):
+            return self._export_to_columnar(format.lower(), filepath, partition)
+        if partition is not None:
+            raise ValueError("Only Parquet and Arrow exports can be partitioned")
         if format.lower() == "csv":
             return self._export_to_csv(filepath)
         elif format.lower() == "json":
             return self._export_to_json(filepath)
+        elif format.lower() == "jsonl":
+            return self._export_to_jsonl(filepath)
         else:
-            raise ValueError("Unsupported export format. Use 'csv' or 'json'")
+            raise ValueError("Unsupported export format. Use 'csv', 'json', 'jsonl', 'parquet' or 'arrow'")
     
     def _export_to_csv(self, filepath: Optional[str] = None) -> str:
         """Export data to CSV format."""
@@ -444,7 +1104,7 @@ class BudgetManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filepath = os.path.join(self.data_dir, f"export_{timestamp}.csv")
         
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+        with AtomicWriter(filepath, mode='w', newline='') as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(['ID', 'Date', 'Type', 'Category', 'Amount', 'Description'])
             
@@ -461,26 +1121,69 @@ class BudgetManager:
         return filepath
     
     def _export_to_json(self, filepath: Optional[str] = None) -> str:
-        """Export data to JSON format."""
+        """Export data to JSON format.
+        
+        The document is written record by record instead of being built in
+        memory first. Categories come before transactions so the export can
+        be imported in a single streaming pass.
+        """
         import json
         
         if not filepath:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filepath = os.path.join(self.data_dir, f"export_{timestamp}.json")
         
-        export_data = {
-            'transactions': [t.to_dict() for t in self.transactions],
-            'categories': [c.to_dict() for c in self.categories.values()],
-            'export_date': datetime.now().isoformat(),
-            'total_transactions': len(self.transactions),
-            'total_categories': len(self.categories)
-        }
+        def write_array(jsonfile, name: str, records: Iterable[Dict], last: bool = False) -> None:
+            jsonfile.write(f'  "{name}": [')
+            separator = '\n    '
+            for record in records:
+                jsonfile.write(separator)
+                jsonfile.write(json.dumps(record, ensure_ascii=False))
+                separator = ',\n    '
+            jsonfile.write('\n  ]' if separator != '\n    ' else ']')
+            jsonfile.write('\n' if last else ',\n')
         
-        with open(filepath, 'w', encoding='utf-8') as jsonfile:
-            json.dump(export_data, jsonfile, indent=2, ensure_ascii=False)
+        with AtomicWriter(filepath, mode='w') as jsonfile:
+            jsonfile.write('{\n')
+            jsonfile.write(f'  "export_date": {json.dumps(datetime.now().isoformat())},\n')
+            jsonfile.write(f'  "total_transactions": {len(self.transactions)},\n')
+            jsonfile.write(f'  "total_categories": {len(self.categories)},\n')
+            write_array(jsonfile, "categories", (c.to_dict() for c in self.categories.values()))
+            write_array(jsonfile, "transactions", (t.to_dict() for t in self.transactions), last=True)
+            jsonfile.write('}\n')
         
         return filepath
     
+    def _export_to_jsonl(self, filepath: Optional[str] = None) -> str:
+        """Export data to JSON Lines: one category or transaction record per line, categories first."""
+        import json
+        
+        if not filepath:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filepath = os.path.join(self.data_dir, f"export_{timestamp}.jsonl")
+        
+        with AtomicWriter(filepath, mode='w') as jsonlfile:
+            for category in self.categories.values():
+                jsonlfile.write(json.dumps({'record': 'category', **category.to_dict()}, ensure_ascii=False))
+                jsonlfile.write('\n')
+            for transaction in self.transactions:
+                jsonlfile.write(json.dumps({'record': 'transaction', **transaction.to_dict()}, ensure_ascii=False))
+                jsonlfile.write('\n')
+        
+        return filepath
+    
+    def _export_to_columnar(self, format: str, filepath: Optional[str] = None, partition: Optional[str] = None) -> str:
+        """Export data to Parquet or Arrow IPC with typed, dictionary-encoded columns (requires pyarrow)."""
+        from src.utils import arrow_io
+        
+        if not filepath:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            suffix = "" if partition else arrow_io.EXTENSIONS[format]
+            filepath = os.path.join(self.data_dir, f"export_{timestamp}{suffix}")
+        
+        arrow_io.write_transactions(filepath, self.transactions, self.categories.values(), format, partition)
+        return filepath
+    
     def get_financial_insights(self) -> Dict:
         """Get financial insights and recommendations."""
         current_date = datetime.now()
@@ -507,79 +1210,134 @@ class BudgetManager:
         
         return insights 
     
-    def import_data(self, filepath: str, format: str = "auto") -> Dict:
-        """Import data from various formats."""
+    def import_data(self, filepath: str, format: str = "auto", duplicates: str = "skip", **options) -> Dict:
+        """Import data from various formats.
+        
+        duplicates decides what happens to rows that match a transaction
+        already in the ledger (see count_duplicates): "skip" (the default)
+        leaves them out, "flag" imports them but lists them in the result and
+        "allow" imports them without checking. Each existing transaction
+        matches at most one imported row.
+        
+        Extra keyword options (progress, chunk_size, workers, max_errors) are
+        passed to the streaming CSV importer; date_from and date_to limit a
+        Parquet or Arrow import, skipping partitions outside the range.
+        """
+        if duplicates not in ("skip", "flag", "allow"):
+            raise ValueError("duplicates must be 'skip', 'flag' or 'allow'")
+        # Duplicate and id checks need the whole ledger
+        self._ensure_loaded()
+        
         if format == "auto":
-            if filepath.lower().endswith('.csv'):
+            from src.utils.arrow_io import detect_format
+            
+            if os.path.isdir(filepath):
+                format = detect_format(filepath) or "unknown"
+            elif filepath.lower().endswith(('.parquet', '.arrow', '.feather')):
+                format = detect_format(filepath)
+            elif filepath.lower().endswith('.csv'):
                 format = "csv"
             elif filepath.lower().endswith('.json'):
                 format = "json"
+            elif filepath.lower().endswith(('.jsonl', '.ndjson')):
+                format = "jsonl"
             else:
                 raise ValueError("Unsupported file format. Please specify format explicitly.")
         
         if format.lower() == "csv":
-            return self._import_from_csv(filepath)
+            return self._import_from_csv(filepath, duplicates=duplicates, **options)
         elif format.lower() == "json":
-            return self._import_from_json(filepath)
+            return self._import_from_json(filepath, duplicates=duplicates)
+        elif format.lower() == "jsonl":
+            return self._import_from_jsonl(filepath, duplicates=duplicates)
+        elif format.lower() in ("parquet", "arrow"):
+            return self._import_from_columnar(filepath, format.lower(), duplicates=duplicates, **options)
         else:
-            raise ValueError("Unsupported import format. Use 'csv' or 'json'")
+            raise ValueError("Unsupported import format. Use 'csv', 'json', 'jsonl', 'parquet' or 'arrow'")
     
-    def _import_from_csv(self, filepath: str) -> Dict:
-        """Import data from CSV format."""
-        import csv
+    def _import_from_csv(
+        self,
+        filepath: str,
+        progress: Optional[Callable[[int, float], Optional[bool]]] = None,
+        chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE,
+        workers: int = 0,
+        max_errors: int = DEFAULT_MAX_IMPORT_ERRORS,
+        duplicates: str = "skip"
+    ) -> Dict:
+        """
+        Import data from CSV format as a stream of chunks.
+        
+        Rows are parsed chunk by chunk (in a process pool when workers > 0)
+        and each chunk is committed as its own batch, so memory stays bounded
+        and an interruption keeps every chunk committed so far. Rows get the
+        same validation as manual entry. At most max_errors error messages
+        (and duplicate messages) are kept; error_count and duplicate_count
+        have the full numbers.
         
+        Args:
+            filepath: CSV file in the exported format
+            progress: Called after each chunk with (rows processed, fraction
+                of the file read); returning False cancels the import
+            chunk_size: Rows per chunk and per committed batch
+            workers: Worker processes for parsing (0 parses in-process)
+            max_errors: Maximum number of error messages to retain
+            duplicates: "skip", "flag" or "allow" (see import_data)
+        """
         imported_count = 0
-        errors = []
+        processed = 0
+        error_count = 0
+        errors: List[str] = []
+        duplicate_count = 0
+        duplicate_rows: List[str] = []
+        matcher = DuplicateMatcher(self._duplicates()) if duplicates != "allow" else None
+        cancelled = False
+        
+        def record_error(row_num: int, message: str) -> None:
+            nonlocal error_count
+            error_count += 1
+            if len(errors) < max_errors:
+                errors.append(f"Row {row_num}: {message}")
         
         try:
+            total_bytes = os.path.getsize(filepath)
             with open(filepath, 'r', newline='', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                
-                for row_num, row in enumerate(reader, start=2):  # Start from 2 to account for header
-                    try:
-                        # Parse transaction data
-                        amount = float(row.get('Amount', 0))
-                        transaction_type = row.get('Type', '').lower()
-                        category = row.get('Category', '').strip()
-                        description = row.get('Description', '').strip()
-                        date_str = row.get('Date', '')
-                        
-                        # Validate required fields
-                        if not category:
-                            errors.append(f"Row {row_num}: Missing category")
-                            continue
-                        
-                        if transaction_type not in ['income', 'expense', 'transfer']:
-                            errors.append(f"Row {row_num}: Invalid transaction type '{transaction_type}'")
-                            continue
-                        
-                        # Parse date
-                        try:
-                            if date_str:
-                                date = datetime.strptime(date_str, '%Y-%m-%d')
-                            else:
-                                date = datetime.now()
-                        except ValueError:
-                            errors.append(f"Row {row_num}: Invalid date format '{date_str}'")
-                            continue
-                        
-                        # Create transaction
-                        transaction = Transaction(amount, transaction_type, category, description, date)  # type: ignore
-                        self.transactions.append(transaction)
-                        imported_count += 1
-                        
-                    except (ValueError, KeyError) as e:
-                        errors.append(f"Row {row_num}: {str(e)}")
-                        continue
-            
-            # Save imported data
-            if imported_count > 0:
-                self.save_transactions()
+                for parsed, row_errors, position in iter_parsed_chunks(csvfile, chunk_size, workers):
+                    for row_num, message in row_errors:
+                        record_error(row_num, message)
+                    
+                    with self.batch():
+                        for row_num, amount, transaction_type, category, description, date in parsed:
+                            date = date or datetime.now()
+                            if matcher is not None:
+                                key = fingerprint(amount, transaction_type, category, description, date)
+                                if matcher.is_duplicate(key):
+                                    duplicate_count += 1
+                                    if len(duplicate_rows) < max_errors:
+                                        duplicate_rows.append(f"Row {row_num}: matches an existing transaction")
+                                    if duplicates == "skip":
+                                        continue
+                            try:
+                                # Same validation as manual entry
+                                self.add_transaction(amount, transaction_type, category, description, date)
+                                imported_count += 1
+                                if matcher is not None:
+                                    matcher.imported(key)
+                            except ValueError as e:
+                                record_error(row_num, str(e))
+                    
+                    processed += len(parsed) + len(row_errors)
+                    if progress is not None and progress(processed, position / total_bytes if total_bytes else 1.0) is False:
+                        cancelled = True
+                        break
             
             return {
                 'imported_count': imported_count,
                 'errors': errors,
-                'success': len(errors) == 0
+                'error_count': error_count,
+                'duplicates': duplicate_rows,
+                'duplicate_count': duplicate_count,
+                'cancelled': cancelled,
+                'success': error_count == 0 and not cancelled
             }
             
         except FileNotFoundError:
@@ -587,55 +1345,187 @@ class BudgetManager:
         except Exception as e:
             raise ValueError(f"Error reading file: {str(e)}")
     
-    def _import_from_json(self, filepath: str) -> Dict:
-        """Import data from JSON format."""
+    def _import_from_json(self, filepath: str, duplicates: str = "skip") -> Dict:
+        """Import data from JSON format.
+        
+        The document is read incrementally, one record at a time. Exports
+        that list categories after transactions are read in two passes so
+        categories exist before the transactions that use them.
+        """
         import json
         
-        try:
+        def members(wanted: str) -> Iterator[Dict]:
             with open(filepath, 'r', encoding='utf-8') as jsonfile:
-                data = json.load(jsonfile)
-            
-            imported_transactions = 0
-            imported_categories = 0
-            errors = []
-            
-            # Import categories if present
-            if 'categories' in data:
-                for cat_data in data['categories']:
-                    try:
-                        category = Category.from_dict(cat_data)
-                        if category.name not in self.categories:
-                            self.categories[category.name] = category
-                            imported_categories += 1
-                    except Exception as e:
-                        errors.append(f"Category import error: {str(e)}")
-            
-            # Import transactions if present
-            if 'transactions' in data:
-                for txn_data in data['transactions']:
+                for key, value in iter_json_members(jsonfile):
+                    if key == wanted:
+                        yield value
+        
+        def categories_first() -> Iterator[Tuple[str, Dict]]:
+            # Stop at the first transaction once the categories array has been read
+            seen_categories = False
+            with open(filepath, 'r', encoding='utf-8') as jsonfile:
+                for key, value in iter_json_members(jsonfile):
+                    if key == 'categories':
+                        seen_categories = True
+                        yield 'category', value
+                    elif key == 'transactions' and seen_categories:
+                        return
+        
+        def records() -> Iterator[Tuple[str, Dict]]:
+            yield from categories_first()
+            for txn_data in members('transactions'):
+                yield 'transaction', txn_data
+        
+        try:
+            return self._import_records(records(), duplicates)
+        except FileNotFoundError:
+            raise ValueError(f"File not found: {filepath}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON format: {str(e)}")
+        except Exception as e:
+            raise ValueError(f"Error reading file: {str(e)}")
+    
+    def _import_from_jsonl(self, filepath: str, duplicates: str = "skip") -> Dict:
+        """Import data from JSON Lines written by export_data('jsonl'), one record per line.
+        
+        Each line is decoded and validated before anything is committed; like
+        rows of a CSV import, invalid lines are skipped and reported as
+        "Row N: ..." errors while the other records are imported.
+        """
+        import json
+        
+        line_errors: List[str] = []
+        
+        def record_error(line_num: int, message: Any) -> None:
+            line_errors.append(f"Row {line_num}: {message}")
+        
+        def records() -> Iterator[Tuple[str, Any]]:
+            with open(filepath, 'r', encoding='utf-8') as jsonlfile:
+                for line_num, data in iter_json_lines(jsonlfile, on_error=record_error):
+                    kind = data.pop('record', None) if isinstance(data, dict) else None
                     try:
-                        transaction = Transaction.from_dict(txn_data)
-                        self.transactions.append(transaction)
-                        imported_transactions += 1
+                        if kind == 'category':
+                            record = Category.from_dict(data)
+                        elif kind == 'transaction':
+                            record = Transaction.from_dict(data)
+                        else:
+                            raise ValueError(f"unknown record type {kind!r}")
                     except Exception as e:
-                        errors.append(f"Transaction import error: {str(e)}")
-            
-            # Save imported data
-            if imported_transactions > 0:
-                self.save_transactions()
-            if imported_categories > 0:
-                self.save_categories()
-            
-            return {
-                'imported_transactions': imported_transactions,
-                'imported_categories': imported_categories,
-                'errors': errors,
-                'success': len(errors) == 0
-            }
-            
+                        record_error(line_num, e)
+                        continue
+                    yield kind, record
+        
+        try:
+            result = self._import_records(records(), duplicates)
+            result['errors'] = line_errors + result['errors']
+            result['success'] = len(result['errors']) == 0
+            return result
         except FileNotFoundError:
             raise ValueError(f"File not found: {filepath}")
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON format: {str(e)}")
         except Exception as e:
-            raise ValueError(f"Error reading file: {str(e)}") 
\ No newline at end of file
+            raise ValueError(f"Error reading file: {str(e)}")
+    
+    def _import_from_columnar(
+        self,
+        filepath: str,
+        format: str,
+        duplicates: str = "skip",
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None
+    ) -> Dict:
+        """Import a Parquet or Arrow export (file or partition directory) through memory maps."""
+        from src.utils import arrow_io
+        
+        def records() -> Iterator[Tuple[str, Any]]:
+            for categories, transactions in arrow_io.read_transactions(filepath, format, date_from, date_to):
+                for category in categories:
+                    yield 'category', category
+                for transaction in transactions:
+                    yield 'transaction', transaction
+        
+        if not os.path.exists(filepath):
+            raise ValueError(f"File not found: {filepath}")
+        try:
+            return self._import_records(records(), duplicates)
+        except ImportError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Error reading file: {str(e)}")
+    
+    def _import_records(self, records: Iterable[Tuple[str, Any]], duplicates: str = "skip") -> Dict:
+        """
+        Import a stream of ('category' | 'transaction', data) records.
+        
+        Data is a dict as produced by to_dict() or an already built
+        Category or Transaction.
+        
+        Transactions are committed in batches of DEFAULT_IMPORT_CHUNK_SIZE.
+        One whose id already exists is the same transaction imported again,
+        e.g. from the app's own export, so it is skipped and reported as a
+        duplicate (an error with duplicates="allow"). Others that match an
+        existing transaction are handled per duplicates.
+        """
+        imported_transactions = 0
+        imported_categories = 0
+        errors = []
+        duplicate_ids = []
+        matcher = DuplicateMatcher(self._duplicates()) if duplicates != "allow" else None
+        unsaved_categories: List[Category] = []
+        pending: List[Any] = []
+        
+        def commit() -> None:
+            nonlocal imported_transactions
+            # Categories are saved first so imported transactions can reference them
+            if unsaved_categories:
+                self.save_categories()
+                for category in unsaved_categories:
+                    self._notify("add_category", category)
+                unsaved_categories.clear()
+            with self.batch():
+                for txn_data in pending:
+                    try:
+                        transaction = txn_data if isinstance(txn_data, Transaction) else Transaction.from_dict(txn_data)
+                        key = None
+                        if matcher is not None and transaction.id in self._id_index:
+                            duplicate_ids.append(transaction.id)
+                            continue
+                        if matcher is not None:
+                            key = fingerprint(transaction.amount, transaction.type, transaction.category,
+                                              transaction.description, transaction.date)
+                            if matcher.is_duplicate(key):
+                                duplicate_ids.append(transaction.id)
+                                if duplicates == "skip":
+                                    continue
+                        self._add_existing(transaction)
+                        imported_transactions += 1
+                        if key is not None:
+                            matcher.imported(key)
+                    except Exception as e:
+                        errors.append(f"Transaction import error: {str(e)}")
+            pending.clear()
+        
+        for kind, data in records:
+            if kind == 'category':
+                try:
+                    category = data if isinstance(data, Category) else Category.from_dict(data)
+                    if category.name not in self.categories:
+                        self.categories[category.name] = category
+                        imported_categories += 1
+                        unsaved_categories.append(category)
+                except Exception as e:
+                    errors.append(f"Category import error: {str(e)}")
+            else:
+                pending.append(data)
+                if len(pending) >= DEFAULT_IMPORT_CHUNK_SIZE:
+                    commit()
+        commit()
+        
+        return {
+            'imported_transactions': imported_transactions,
+            'imported_categories': imported_categories,
+            'errors': errors,
+            'duplicates': duplicate_ids,
+            'success': len(errors) == 0
+        }
@@ -11,6 +11,8 @@ class Category:
         is_predefined (bool): Whether this is a predefined category
     """
     
+    __slots__ = ('name', 'budget_limit', 'is_predefined')
+    
     # Predefined categories
     PREDEFINED_CATEGORIES = {
         "Food": None,
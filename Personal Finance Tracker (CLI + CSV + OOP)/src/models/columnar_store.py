@@ -0,0 +1,174 @@
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the store refuses to start without it
+    np = None
+
+from .transaction import Transaction
+
+
+TRANSACTION_TYPES = ("income", "expense", "transfer")
+_TYPE_CODES = {name: code for code, name in enumerate(TRANSACTION_TYPES)}
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class ColumnarStore:
+    """
+    Array-backed column store mirroring BudgetManager.transactions.
+
+    Each transaction occupies one row across parallel NumPy arrays: date
+    ordinals (int32), amounts (float64) and dictionary-encoded category and
+    type codes. Aggregations are computed with vectorized group-bys over
+    these columns instead of Python loops over Transaction objects, which
+    remain the object-level view of the same data.
+
+    Rows are removed by moving the last row into the freed slot, so
+    updates and deletes are constant time.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        if np is None:
+            raise ImportError("The columnar store requires numpy. Install it with 'pip install numpy'.")
+        self.size = 0
+        self.ordinals = np.empty(capacity, dtype=np.int32)
+        self.amounts = np.empty(capacity, dtype=np.float64)
+        self.category_codes = np.empty(capacity, dtype=np.int32)
+        self.type_codes = np.empty(capacity, dtype=np.int8)
+        self.category_names: List[str] = []
+        self._category_lookup: Dict[str, int] = {}
+        self._rows: Dict[str, int] = {}
+        self._row_ids: List[str] = []
+
+    @classmethod
+    def from_transactions(cls, transactions: Iterable[Transaction]) -> 'ColumnarStore':
+        """Build a store holding the given transactions."""
+        transactions = list(transactions)
+        store = cls(capacity=max(1024, len(transactions)))
+        for transaction in transactions:
+            store.append(transaction)
+        return store
+
+    def _category_code(self, name: str) -> int:
+        """Return the dictionary code for a category name, assigning one if needed."""
+        code = self._category_lookup.get(name)
+        if code is None:
+            code = len(self.category_names)
+            self.category_names.append(name)
+            self._category_lookup[name] = code
+        return code
+
+    def _grow(self) -> None:
+        """Double the capacity of every column."""
+        capacity = len(self.ordinals) * 2
+        for column in ("ordinals", "amounts", "category_codes", "type_codes"):
+            old = getattr(self, column)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, column, new)
+
+    def _write_row(self, row: int, transaction: Transaction) -> None:
+        """Store a transaction's values in the given row."""
+        self.ordinals[row] = transaction.date.toordinal()
+        self.amounts[row] = transaction.amount
+        self.category_codes[row] = self._category_code(transaction.category)
+        self.type_codes[row] = _TYPE_CODES[transaction.type]
+
+    def append(self, transaction: Transaction) -> None:
+        """Add a transaction as a new row."""
+        if self.size == len(self.ordinals):
+            self._grow()
+        self._write_row(self.size, transaction)
+        self._rows[transaction.id] = self.size
+        self._row_ids.append(transaction.id)
+        self.size += 1
+
+    def remove(self, transaction: Transaction) -> None:
+        """Remove a transaction's row."""
+        row = self._rows.pop(transaction.id)
+        last = self.size - 1
+        last_id = self._row_ids.pop()
+        if row != last:
+            for column in (self.ordinals, self.amounts, self.category_codes, self.type_codes):
+                column[row] = column[last]
+            self._row_ids[row] = last_id
+            self._rows[last_id] = row
+        self.size = last
+
+    def rename_category(self, old_name: str, new_name: str) -> None:
+        """Rename a category by relabelling its dictionary entry."""
+        code = self._category_lookup.pop(old_name, None)
+        if code is None:
+            return
+        self.category_names[code] = new_name
+        self._category_lookup[new_name] = code
+
+    def _range_mask(self, start_date: Optional[date], end_date: Optional[date]):
+        """Boolean mask of rows whose date falls within the inclusive range."""
+        ordinals = self.ordinals[:self.size]
+        mask = np.ones(self.size, dtype=bool)
+        if start_date:
+            mask &= ordinals >= start_date.toordinal()
+        if end_date:
+            mask &= ordinals <= end_date.toordinal()
+        return mask
+
+    def summarize(self, start_date: Optional[date] = None, end_date: Optional[date] = None) -> Dict:
+        """
+        Compute a summary with the same structure as BudgetManager.get_summary.
+
+        Totals are grouped by (category, type) with a single weighted bincount.
+        """
+        mask = self._range_mask(start_date, end_date)
+        type_count = len(TRANSACTION_TYPES)
+        groups = self.category_codes[:self.size][mask].astype(np.int64) * type_count + self.type_codes[:self.size][mask]
+        cells = max(len(self.category_names), 1) * type_count
+        totals = np.bincount(groups, weights=self.amounts[:self.size][mask], minlength=cells).reshape(-1, type_count)
+        counts = np.bincount(groups, minlength=cells).reshape(-1, type_count)
+
+        category_breakdown = {}
+        for code in np.flatnonzero(counts.sum(axis=1)):
+            category_breakdown[self.category_names[code]] = {
+                name: float(totals[code, type_code]) for type_code, name in enumerate(TRANSACTION_TYPES)
+            }
+
+        type_totals = totals.sum(axis=0)
+        total_income = float(type_totals[_TYPE_CODES["income"]])
+        total_expenses = float(type_totals[_TYPE_CODES["expense"]])
+        return {
+            'total_income': total_income,
+            'total_expenses': total_expenses,
+            'total_transfers': float(type_totals[_TYPE_CODES["transfer"]]),
+            'net_amount': total_income - total_expenses,
+            'category_breakdown': category_breakdown,
+            'transaction_count': int(mask.sum())
+        }
+
+    def monthly_totals(self, start_date: Optional[date] = None, end_date: Optional[date] = None) -> Dict[Tuple[int, int], Dict]:
+        """
+        Group amounts by calendar month and transaction type.
+
+        Returns:
+            (year, month) -> {'income': ..., 'expense': ..., 'transfer': ..., 'count': ...}
+            for every month in the range that has transactions
+        """
+        mask = self._range_mask(start_date, end_date)
+        if not mask.any():
+            return {}
+        days = (self.ordinals[:self.size][mask] - _EPOCH_ORDINAL).astype('datetime64[D]')
+        month_numbers = days.astype('datetime64[M]').astype(np.int64)
+        first_month = int(month_numbers.min())
+        type_count = len(TRANSACTION_TYPES)
+        cells = (int(month_numbers.max()) - first_month + 1) * type_count
+        groups = (month_numbers - first_month) * type_count + self.type_codes[:self.size][mask]
+        totals = np.bincount(groups, weights=self.amounts[:self.size][mask], minlength=cells).reshape(-1, type_count)
+        counts = np.bincount(groups, minlength=cells).reshape(-1, type_count).sum(axis=1)
+
+        result = {}
+        for offset in np.flatnonzero(counts):
+            month_number = first_month + int(offset)
+            key = (1970 + month_number // 12, month_number % 12 + 1)
+            result[key] = {name: float(totals[offset, code]) for code, name in enumerate(TRANSACTION_TYPES)}
+            result[key]['count'] = int(counts[offset])
+        return result
@@ -0,0 +1,97 @@
+from datetime import date, datetime
+from typing import Dict, Hashable, Iterable, Tuple, Union
+
+from .transaction import Transaction
+
+
+Fingerprint = Tuple[int, int, str, str, str]
+
+
+def fingerprint(amount: float, type: str, category: str, description: str,
+                when: Union[date, datetime]) -> Fingerprint:
+    """
+    Key under which two transactions count as duplicates.
+
+    Amounts are compared in cents and descriptions case-insensitively with
+    runs of whitespace collapsed, which is how the same bank statement line
+    differs between exports.
+    """
+    if isinstance(when, datetime):
+        when = when.date()
+    return (
+        when.toordinal(),
+        round(amount * 100),
+        type.lower(),
+        category,
+        " ".join(description.lower().split()),
+    )
+
+
+def transaction_fingerprint(transaction: Transaction) -> Fingerprint:
+    """Duplicate key of an existing transaction."""
+    return fingerprint(transaction.amount, transaction.type, transaction.category,
+                       transaction.description, transaction.date)
+
+
+class DuplicateIndex:
+    """
+    Hash index counting the transactions that share each fingerprint.
+
+    Only counts are kept, so the index costs one dict entry per distinct
+    fingerprint and answers lookups in O(1).
+    """
+
+    def __init__(self, transactions: Iterable[Transaction] = ()):
+        self._counts: Dict[Fingerprint, int] = {}
+        counts = self._counts
+        for transaction in transactions:
+            key = transaction_fingerprint(transaction)
+            counts[key] = counts.get(key, 0) + 1
+
+    def add(self, transaction: Transaction) -> None:
+        """Count a transaction under its current field values."""
+        key = transaction_fingerprint(transaction)
+        self._counts[key] = self._counts.get(key, 0) + 1
+
+    def remove(self, transaction: Transaction) -> None:
+        """Withdraw a transaction; call before mutating its fields."""
+        key = transaction_fingerprint(transaction)
+        count = self._counts.get(key, 0)
+        if count > 1:
+            self._counts[key] = count - 1
+        elif count:
+            del self._counts[key]
+
+    def count(self, key: Hashable) -> int:
+        """Number of indexed transactions with the given fingerprint."""
+        return self._counts.get(key, 0)
+
+
+class DuplicateMatcher:
+    """
+    Decides which rows of one import are already in the ledger.
+
+    A statement can legitimately contain identical lines (two coffees on the
+    same day), so each existing transaction absorbs at most one imported
+    row: re-importing a statement skips every line, while a new statement
+    with an extra identical line imports just that line. Rows imported
+    earlier in the same run are not counted as existing.
+    """
+
+    def __init__(self, index: DuplicateIndex):
+        self._index = index
+        self._matched: Dict[Fingerprint, int] = {}
+        self._added: Dict[Fingerprint, int] = {}
+
+    def is_duplicate(self, key: Fingerprint) -> bool:
+        """Whether a row matches an existing transaction not yet matched by this import."""
+        existing = self._index.count(key) - self._added.get(key, 0)
+        matched = self._matched.get(key, 0)
+        if matched < existing:
+            self._matched[key] = matched + 1
+            return True
+        return False
+
+    def imported(self, key: Fingerprint) -> None:
+        """Note that a row with this fingerprint was added to the ledger."""
+        self._added[key] = self._added.get(key, 0) + 1
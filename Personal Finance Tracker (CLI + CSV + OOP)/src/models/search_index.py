@@ -0,0 +1,135 @@
+from collections import defaultdict
+from typing import Dict, Iterable, Iterator, Set
+
+from .transaction import Transaction
+
+
+NGRAM_SIZE = 3
+
+
+def _ngrams(text: str) -> Iterator[str]:
+    """Yield the distinct character trigrams of a string."""
+    return iter({text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)})
+
+
+def matches(transaction: Transaction, query: str) -> bool:
+    """
+    Whether a transaction matches a lowercased, stripped query by the rules
+    of SearchIndex.search.
+
+    A query containing an earlier one only matches a subset of the earlier
+    results, so a query being typed can be answered by filtering the
+    previous results with this instead of consulting the index again.
+    """
+    return (
+        query in transaction.description.lower()
+        or query in transaction.category.lower()
+        or query in str(transaction.amount)
+        or query == str(int(transaction.amount))
+    )
+
+
+class SearchIndex:
+    """
+    Incrementally maintained inverted index for transaction search.
+
+    Every transaction contributes three searchable texts: its lowercased
+    description, its lowercased category and str(amount). Each distinct text
+    is stored once with the set of transactions that carry it, and a
+    trigram index maps every three-character substring to the texts that
+    contain it. A substring query intersects the posting lists of its
+    trigrams and only verifies the few candidate texts that survive.
+    Queries shorter than a trigram scan the distinct texts instead of the
+    transactions. Whole amounts are also indexed as str(int(amount)) for
+    exact matches.
+    """
+
+    def __init__(self, transactions: Iterable[Transaction] = ()):
+        self._postings: Dict[str, Set[Transaction]] = {}
+        self._ngrams: Dict[str, Set[str]] = defaultdict(set)
+        self._whole_amounts: Dict[str, Set[Transaction]] = defaultdict(set)
+        self._bulk_load(transactions)
+
+    def _bulk_load(self, transactions: Iterable[Transaction]) -> None:
+        """Index many transactions at once, computing trigrams once per distinct text."""
+        postings = defaultdict(set)
+        whole_amounts = self._whole_amounts
+        for transaction in transactions:
+            description = transaction.description.lower()
+            category = transaction.category.lower()
+            amount = str(transaction.amount)
+            postings[description].add(transaction)
+            postings[category].add(transaction)
+            postings[amount].add(transaction)
+            whole_amounts[str(int(transaction.amount))].add(transaction)
+
+        grams = self._ngrams
+        for text in postings:
+            for i in range(len(text) - NGRAM_SIZE + 1):
+                grams[text[i:i + NGRAM_SIZE]].add(text)
+        self._postings = dict(postings)
+
+    @staticmethod
+    def _texts(transaction: Transaction) -> Set[str]:
+        """Searchable texts for a transaction."""
+        return {transaction.description.lower(), transaction.category.lower(), str(transaction.amount)}
+
+    def add(self, transaction: Transaction) -> None:
+        """Index a transaction under its current field values."""
+        for text in self._texts(transaction):
+            holders = self._postings.get(text)
+            if holders is None:
+                holders = self._postings[text] = set()
+                for gram in _ngrams(text):
+                    self._ngrams[gram].add(text)
+            holders.add(transaction)
+        self._whole_amounts[str(int(transaction.amount))].add(transaction)
+
+    def remove(self, transaction: Transaction) -> None:
+        """Withdraw a transaction; call before mutating its fields."""
+        for text in self._texts(transaction):
+            holders = self._postings.get(text)
+            if holders is None:
+                continue
+            holders.discard(transaction)
+            if not holders:
+                del self._postings[text]
+                for gram in _ngrams(text):
+                    texts = self._ngrams[gram]
+                    texts.discard(text)
+                    if not texts:
+                        del self._ngrams[gram]
+        whole = str(int(transaction.amount))
+        holders = self._whole_amounts.get(whole)
+        if holders is not None:
+            holders.discard(transaction)
+            if not holders:
+                del self._whole_amounts[whole]
+
+    def _matching_texts(self, query: str) -> Iterable[str]:
+        """Distinct indexed texts containing the query."""
+        if len(query) < NGRAM_SIZE:
+            return [text for text in self._postings if query in text]
+        candidates = None
+        for gram in sorted(_ngrams(query), key=lambda g: len(self._ngrams.get(g, ()))):
+            texts = self._ngrams.get(gram)
+            if not texts:
+                return []
+            candidates = set(texts) if candidates is None else candidates & texts
+            if not candidates:
+                return []
+        return [text for text in candidates if query in text]
+
+    def search(self, query: str) -> Set[Transaction]:
+        """
+        Find transactions matching a lowercased, stripped query.
+
+        Returns:
+            Set of transactions whose description or category contains the
+            query, whose amount string contains it, or whose whole amount
+            equals it
+        """
+        results: Set[Transaction] = set(self._whole_amounts.get(query, ()))
+        for text in self._matching_texts(query):
+            results |= self._postings[text]
+        return results
@@ -1,6 +1,16 @@
+import sys
 import uuid
-from datetime import datetime
-from typing import Literal, Optional
+from datetime import date as _date, datetime
+from typing import Iterable, List, Literal, Optional, Sequence, Union
+
+
+def _to_date(value: Optional[Union[_date, datetime]]) -> _date:
+    """Normalize a date or datetime to a plain date (today when None)."""
+    if value is None:
+        return _date.today()
+    if isinstance(value, datetime):
+        return value.date()
+    return value
 
 
 class Transaction:
@@ -13,17 +23,22 @@ class Transaction:
         type (str): 'income', 'expense', or 'transfer'
         category (str): Category of the transaction
         description (str): Description or note for the transaction
-        date (datetime): Date of the transaction (ISO format)
+        date (date): Date of the transaction; datetimes are truncated to their date
         currency (str): Currency code (default: INR)
+    
+    Instances use __slots__ and intern their repeated strings (type,
+    category, currency) so large ledgers stay compact in memory.
     """
     
+    __slots__ = ('id', 'amount', 'type', 'category', 'description', 'date', 'currency')
+    
     def __init__(
         self,
         amount: float,
         type: Literal["income", "expense", "transfer"],
         category: str,
         description: str = "",
-        date: datetime | None = None,
+        date: _date | None = None,
         currency: str = "INR",
         id: str | None = None
     ):
@@ -36,11 +51,11 @@ class Transaction:
         
         self.id = id if id else str(uuid.uuid4())
         self.amount = amount
-        self.type = type
-        self.category = category.strip()
+        self.type = sys.intern(type)
+        self.category = sys.intern(category.strip())
         self.description = description
-        self.date = date if date else datetime.now()
-        self.currency = currency
+        self.date = _to_date(date)
+        self.currency = sys.intern(currency)
     
     def __str__(self) -> str:
         """String representation of the transaction."""
@@ -70,12 +85,103 @@ class Transaction:
             type=data['type'],
             category=data['category'],
             description=data.get('description', ''),
-            date=datetime.strptime(data['date'], '%Y-%m-%d'),
+            date=datetime.strptime(data['date'], '%Y-%m-%d').date(),
             currency=data.get('currency', 'INR'),
             id=data.get('id')
         )
     
-    def update_fields(self, amount: Optional[float] = None, type: Optional[str] = None, category: Optional[str] = None, description: Optional[str] = None, date: Optional[datetime] = None, currency: Optional[str] = None):
+    @classmethod
+    def bulk_from_rows(cls, rows: Iterable[Sequence[str]], fieldnames: Sequence[str]) -> List['Transaction']:
+        """
+        Build transactions from raw CSV rows in a single validating pass.
+        
+        This is the load path for large files. Each distinct date string is
+        parsed once, each distinct type, category and currency is validated
+        and interned once, and instances are filled in directly instead of
+        re-running the constructor checks for every row.
+        
+        Args:
+            rows: Sequences of strings, as produced by csv.reader
+            fieldnames: Column names matching the positions in each row
+            
+        Returns:
+            List of Transaction objects in row order
+        """
+        columns = {name: position for position, name in enumerate(fieldnames)}
+        for required in ('amount', 'type', 'category', 'date'):
+            if required not in columns:
+                raise ValueError(f"Missing required column '{required}'")
+        id_at = columns.get('id')
+        date_at = columns['date']
+        amount_at = columns['amount']
+        type_at = columns['type']
+        category_at = columns['category']
+        description_at = columns.get('description')
+        currency_at = columns.get('currency')
+        
+        dates: dict = {}
+        types: dict = {}
+        categories: dict = {}
+        currencies: dict = {}
+        new = cls.__new__
+        transactions = []
+        
+        width = len(fieldnames)
+        for line, row in enumerate(rows, start=2):
+            if not row:
+                continue
+            if len(row) < width:
+                row = list(row) + [''] * (width - len(row))
+            try:
+                date_text = row[date_at]
+                parsed_date = dates.get(date_text)
+                if parsed_date is None:
+                    # fromisoformat is faster but also takes forms such as 20240115
+                    # and 2024-W03-1, which from_dict's strptime rejects
+                    if len(date_text) == 10 and date_text[4] == date_text[7] == '-':
+                        parsed_date = _date.fromisoformat(date_text)
+                    else:
+                        parsed_date = datetime.strptime(date_text, '%Y-%m-%d').date()
+                    dates[date_text] = parsed_date
+                
+                type_text = row[type_at]
+                type_name = types.get(type_text)
+                if type_name is None:
+                    if type_text not in ("income", "expense", "transfer"):
+                        raise ValueError("Transaction type must be 'income', 'expense', or 'transfer'")
+                    type_name = types[type_text] = sys.intern(type_text)
+                
+                category_text = row[category_at]
+                category = categories.get(category_text)
+                if category is None:
+                    if not category_text.strip():
+                        raise ValueError("Category must be specified")
+                    category = categories[category_text] = sys.intern(category_text.strip())
+                
+                amount = float(row[amount_at])
+                if amount <= 0:
+                    raise ValueError("Amount must be positive")
+                
+                currency_text = row[currency_at] if currency_at is not None and row[currency_at] else 'INR'
+                currency = currencies.get(currency_text)
+                if currency is None:
+                    currency = currencies[currency_text] = sys.intern(currency_text)
+            except ValueError as e:
+                raise ValueError(f"Invalid transaction on line {line}: {e}") from e
+            
+            transaction = new(cls)
+            transaction.id = (row[id_at] if id_at is not None else None) or str(uuid.uuid4())
+            transaction.amount = amount
+            transaction.type = type_name
+            transaction.category = category
+            transaction.description = row[description_at] if description_at is not None else ''
+            transaction.date = parsed_date
+            transaction.currency = currency
+            transactions.append(transaction)
+        
+        return transactions
+    
+    def update_fields(self, amount: Optional[float] = None, type: Optional[str] = None, category: Optional[str] = None, description: Optional[str] = None, date: Optional[_date] = None, currency: Optional[str] = None):
         """Update transaction fields for editing."""
         if amount is not None:
             if amount <= 0:
@@ -84,17 +190,17 @@ class Transaction:
         if type is not None:
             if type not in ("income", "expense", "transfer"):
                 raise ValueError("Transaction type must be 'income', 'expense', or 'transfer'")
-            self.type = type
+            self.type = sys.intern(type)
         if category is not None:
             if not category or not category.strip():
                 raise ValueError("Category must be specified")
-            self.category = category.strip()
+            self.category = sys.intern(category.strip())
         if description is not None:
             self.description = description
         if date is not None:
-            self.date = date
+            self.date = _to_date(date)
         if currency is not None:
-            self.currency = currency
+            self.currency = sys.intern(currency)
     
     def get_display_amount(self) -> str:
         """Get formatted amount with currency symbol."""
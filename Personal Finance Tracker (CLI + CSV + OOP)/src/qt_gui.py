@@ -1,8 +1,9 @@
 import sys
+from operator import attrgetter
 from PyQt5.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QStackedWidget, QMessageBox, QTableWidget, QTableWidgetItem, QDialog, QFormLayout, QLineEdit, QComboBox, QDateEdit, QFrame, QScrollArea, QFileDialog, QCheckBox
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QStackedWidget, QMessageBox, QTableWidget, QTableWidgetItem, QTableView, QAbstractItemView, QDialog, QFormLayout, QLineEdit, QComboBox, QDateEdit, QFrame, QScrollArea, QFileDialog, QCheckBox, QProgressDialog
 )
-from PyQt5.QtCore import Qt, QDate
+from PyQt5.QtCore import Qt, QDate, QThread, pyqtSignal, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool, QTimer
 from PyQt5.QtGui import QColor
 AlignHCenter = getattr(Qt, "AlignHCenter", 0x0004)
 AlignCenter = getattr(Qt, "AlignCenter", 0x0004)
@@ -19,10 +20,15 @@ def get_alignment():
     # Fallback (should never be needed, but just in case)
     return Qt.Alignment(Qt.AlignmentFlag(4)) 
 from src.models.budget_manager import BudgetManager
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
-import numpy as np
-import matplotlib.dates as mdates
+from src.models.search_index import matches
+from src.utils.partitioned_storage import PartitionedCsvStorage
+
+
+def chart_service():
+    """Import matplotlib on first use; it dominates startup time when imported eagerly."""
+    from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+    from src.utils.charts import ChartService
+    return ChartService(FigureCanvas)
 
 # Modern styling constants
 MODERN_BUTTON_STYLE = """
@@ -285,7 +291,7 @@ QFrame:hover {
 
 # Enhanced table styles
 MODERN_TABLE_STYLE = """
-QTableWidget {
+QTableView {
     background-color: white;
     gridline-color: #e9ecef;
     border: 1px solid #dee2e6;
@@ -304,17 +310,17 @@ QHeaderView::section {
     font-size: 13px;
     font-family: 'Segoe UI', Arial, sans-serif;
 }
-QTableWidget::item {
+QTableView::item {
     padding: 10px;
     border-bottom: 1px solid #f8f9fa;
     font-family: 'Segoe UI', Arial, sans-serif;
 }
-QTableWidget::item:selected {
+QTableView::item:selected {
     background-color: #e3f2fd;
     color: #000000;
     font-weight: 500;
 }
-QTableWidget::item:hover {
+QTableView::item:hover {
     background-color: #f8f9fa;
 }
 """
@@ -359,294 +365,603 @@ QComboBox QAbstractItemView {
 }
 """
 
+# Foreground and background of the type and amount cells in the month table
+TYPE_COLORS = {
+    "income": ("#155724", "#e8f5e8"),
+    "expense": ("#721c24", "#ffeaea"),
+    "transfer": ("#0d47a1", "#e3f2fd"),
+}
+
+
+class MonthTransactionsModel(QAbstractTableModel):
+    """
+    Newest-first table model of one month's transactions for the dashboard.
+
+    Rows are added, updated and removed one at a time as the ledger
+    reports changes, so the table never has to be rebuilt.
+    """
+
+    HEADERS = ["Date", "Type", "Category", "Amount", "Description"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        t = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return t.date.strftime('%Y-%m-%d')
+            if column == 1:
+                return t.type.capitalize()
+            if column == 2:
+                return t.category
+            if column == 3:
+                return f"₹{t.amount:.2f}"
+            return t.description or ""
+        if role == Qt.TextAlignmentRole:
+            if column == 3:
+                return int(AlignRight | AlignVCenter)
+            if column == 4:
+                return int(AlignLeft | AlignVCenter)
+            return int(AlignCenter)
+        if role == Qt.ForegroundRole and column in (1, 3):
+            return QColor(TYPE_COLORS.get(t.type, TYPE_COLORS["transfer"])[0])
+        if role == Qt.BackgroundRole and column == 1:
+            return QColor(TYPE_COLORS.get(t.type, TYPE_COLORS["transfer"])[1])
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def set_transactions(self, transactions):
+        """Replace the rows with a newest-first list."""
+        self.beginResetModel()
+        self._rows = list(transactions)
+        self.endResetModel()
+
+    def add(self, transaction):
+        """Insert a transaction after any rows of the same or a later date."""
+        row = next((i for i, t in enumerate(self._rows) if t.date < transaction.date), len(self._rows))
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, transaction)
+        self.endInsertRows()
+
+    def remove(self, transaction):
+        row = self._row_of(transaction)
+        if row is not None:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            self.endRemoveRows()
+
+    def update(self, transaction):
+        """Repaint an edited transaction, moving it if its date changed."""
+        row = self._row_of(transaction)
+        if row is None:
+            self.add(transaction)
+        elif (row > 0 and self._rows[row - 1].date < transaction.date) or \
+                (row + 1 < len(self._rows) and self._rows[row + 1].date > transaction.date):
+            self.remove(transaction)
+            self.add(transaction)
+        else:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def repaint_all(self):
+        """Repaint every row, e.g. after a category was renamed."""
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._rows) - 1, len(self.HEADERS) - 1))
+
+    def _row_of(self, transaction):
+        return next((i for i, t in enumerate(self._rows) if t is transaction), None)
+
+
 class DashboardWidget(QWidget):
     def __init__(self, manager: BudgetManager, parent=None):
         super().__init__(parent)
         self.manager = manager
-        self.main_layout = QVBoxLayout()
-        self.setLayout(self.main_layout)
         # Set white background
         self.setStyleSheet("background-color: white;")
-        # Cache for performance
-        self._cached_summary = None
-        self._cache_timestamp = None
+        # (year, month) shown; the dashboard re-reads everything when it rolls over
+        self._month = None
+        self.init_ui()
         self.refresh_dashboard()
-    
-    def _get_cached_summary(self, force_refresh=False):
-        """Get cached summary data with optional force refresh."""
-        from datetime import datetime, timedelta
-        
-        current_time = datetime.now()
-        
-        # Check if cache is valid (5 minutes)
-        if (not force_refresh and 
-            self._cached_summary is not None and 
-            self._cache_timestamp is not None and
-            current_time - self._cache_timestamp < timedelta(minutes=5)):
-            return self._cached_summary
-        
-        # Get fresh data
-        current_month = current_time.month
-        current_year = current_time.year
-        
-        if self.manager.transactions:
-            summary = self.manager.get_monthly_summary(current_year, current_month)
-        else:
-            summary = self.manager.get_monthly_summary(2023, 1)
-        
-        # Update cache
-        self._cached_summary = summary
-        self._cache_timestamp = current_time
-        
-        return summary
 
-    def refresh_dashboard(self):
-        # Remove all widgets
-        while self.main_layout.count():
-            child = self.main_layout.takeAt(0)
-            if child is not None:
-                widget = child.widget()
-                if widget is not None:
-                    widget.deleteLater()
-        # Center content
+    def init_ui(self):
+        """Build the dashboard once; refreshes only update its contents."""
         center = QVBoxLayout()
         # Title
         title = QLabel("Dashboard")
         title.setStyleSheet("font-size: 32px; font-weight: 700; margin-bottom: 24px; color: #2c3e50; font-family: 'Segoe UI', Arial, sans-serif;")
         center.addWidget(title, alignment=get_alignment())
-        # Get current month and year
-        from datetime import datetime
-        current_month = datetime.now().month
-        current_year = datetime.now().year
         
         # Summary cards
-        summary = self._get_cached_summary()
         card_layout = QHBoxLayout()
-        
-        # Modern card styling
-        income_card = QFrame()
-        income_card.setStyleSheet(INCOME_CARD_STYLE)
-        income_label = QLabel(f"Total Income\n₹{summary['total_income']:.2f}")
-        income_label.setStyleSheet("font-size: 22px; font-weight: 600; color: #155724; font-family: 'Segoe UI', Arial, sans-serif; line-height: 1.4;")
-        income_label.setAlignment(get_alignment())
-        income_card_layout = QVBoxLayout()
-        income_card_layout.addWidget(income_label)
-        income_card.setLayout(income_card_layout)
-        
-        expense_card = QFrame()
-        expense_card.setStyleSheet(EXPENSE_CARD_STYLE)
-        expense_label = QLabel(f"Total Expenses\n₹{summary['total_expenses']:.2f}")
-        expense_label.setStyleSheet("font-size: 22px; font-weight: 600; color: #721c24; font-family: 'Segoe UI', Arial, sans-serif; line-height: 1.4;")
-        expense_label.setAlignment(get_alignment())
-        expense_card_layout = QVBoxLayout()
-        expense_card_layout.addWidget(expense_label)
-        expense_card.setLayout(expense_card_layout)
-        
-        net_card = QFrame()
-        net_card.setStyleSheet(NET_CARD_STYLE)
-        net_label = QLabel(f"Net Amount\n₹{summary['net_amount']:.2f}")
-        net_label.setStyleSheet("font-size: 22px; font-weight: 600; color: #0d47a1; font-family: 'Segoe UI', Arial, sans-serif; line-height: 1.4;")
-        net_label.setAlignment(get_alignment())
-        net_card_layout = QVBoxLayout()
-        net_card_layout.addWidget(net_label)
-        net_card.setLayout(net_card_layout)
-        
-        card_layout.addWidget(income_card)
-        card_layout.addWidget(expense_card)
-        card_layout.addWidget(net_card)
+        self.income_label = self._add_card(card_layout, INCOME_CARD_STYLE, "#155724")
+        self.expense_label = self._add_card(card_layout, EXPENSE_CARD_STYLE, "#721c24")
+        self.net_label = self._add_card(card_layout, NET_CARD_STYLE, "#0d47a1")
         center.addLayout(card_layout)
         # Transactions count
-        txn_count = QLabel(f"Transactions this month: <b>{summary['transaction_count']}</b>")
-        txn_count.setStyleSheet("font-size: 16px; margin-top: 24px; color: #6c757d; font-family: 'Segoe UI', Arial, sans-serif;")
-        center.addWidget(txn_count, alignment=get_alignment())
-        
-        # Add financial insights
-        insights = self.manager.get_financial_insights()
-        if insights['recommendations'] or insights['alerts']:
-            insights_frame = QFrame()
-            insights_frame.setStyleSheet("""
-                QFrame {
-                    background: #fff3cd;
-                    border: 1px solid #ffeaa7;
-                    border-radius: 12px;
-                    padding: 16px;
-                    margin: 16px 0px;
-                }
-            """)
-            insights_layout = QVBoxLayout()
-            
-            insights_title = QLabel("💡 Financial Insights")
-            insights_title.setStyleSheet("font-size: 18px; font-weight: 600; color: #856404; font-family: 'Segoe UI', Arial, sans-serif; margin-bottom: 8px;")
-            insights_layout.addWidget(insights_title)
-            
-            # Add recommendations
-            for recommendation in insights['recommendations']:
-                rec_label = QLabel(f"• {recommendation}")
-                rec_label.setStyleSheet("font-size: 14px; color: #856404; font-family: 'Segoe UI', Arial, sans-serif; margin: 2px 0px;")
-                rec_label.setWordWrap(True)
-                insights_layout.addWidget(rec_label)
-            
-            # Add alerts
-            for alert in insights['alerts']:
-                alert_label = QLabel(f"⚠️ {alert}")
-                alert_label.setStyleSheet("font-size: 14px; color: #721c24; font-family: 'Segoe UI', Arial, sans-serif; margin: 2px 0px;")
-                alert_label.setWordWrap(True)
-                insights_layout.addWidget(alert_label)
-            
-            insights_frame.setLayout(insights_layout)
-            center.addWidget(insights_frame)
-        
-        # Add budget performance summary
-        # Validate month and year before calling get_category_performance
-        if 1 <= current_month <= 12 and current_year > 0:
-            performance = self.manager.get_category_performance(current_year, current_month)
-            if performance:
-                performance_frame = QFrame()
-                performance_frame.setStyleSheet("""
-                    QFrame {
-                        background: #f8f9fa;
-                        border: 1px solid #dee2e6;
-                        border-radius: 12px;
-                        padding: 16px;
-                        margin: 16px 0px;
-                    }
-                """)
-                perf_layout = QVBoxLayout()
-                
-                perf_title = QLabel("📊 Budget Performance")
-                perf_title.setStyleSheet("font-size: 18px; font-weight: 600; color: #495057; font-family: 'Segoe UI', Arial, sans-serif; margin-bottom: 12px;")
-                perf_layout.addWidget(perf_title)
-                
-                # Show top 3 categories by utilization
-                sorted_performance = sorted(performance.items(), key=lambda x: x[1]['utilization_percent'], reverse=True)
-                for i, (category_name, data) in enumerate(sorted_performance[:3]):
-                    if data['status'] == 'no_budget_set':
-                        # Categories without budget limits
-                        perf_text = f"📊 {category_name}: {data['income_percentage']:.1f}% of income (₹{data['expense']:.0f})"
-                        perf_label = QLabel(perf_text)
-                        perf_label.setStyleSheet("font-size: 14px; color: #6c757d; font-family: 'Segoe UI', Arial, sans-serif; margin: 2px 0px;")
-                    else:
-                        # Categories with budget limits
-                        status_icon = "🔴" if data['status'] == 'over_budget' else "🟢"
-                        if data['budget_limit']:
-                            perf_text = f"{status_icon} {category_name}: {data['utilization_percent']:.1f}% used (₹{data['expense']:.0f}/{data['budget_limit']:.0f})"
-                        else:
-                            perf_text = f"{status_icon} {category_name}: {data['utilization_percent']:.1f}% of income (₹{data['expense']:.0f})"
-                        perf_label = QLabel(perf_text)
-                        perf_label.setStyleSheet("font-size: 14px; color: #495057; font-family: 'Segoe UI', Arial, sans-serif; margin: 2px 0px;")
-                    
-                    perf_layout.addWidget(perf_label)
-                
-                performance_frame.setLayout(perf_layout)
-                center.addWidget(performance_frame)
+        self.txn_count_label = QLabel()
+        self.txn_count_label.setStyleSheet("font-size: 16px; margin-top: 24px; color: #6c757d; font-family: 'Segoe UI', Arial, sans-serif;")
+        center.addWidget(self.txn_count_label, alignment=get_alignment())
+        
+        # Financial insights
+        self.insights_frame = QFrame()
+        self.insights_frame.setStyleSheet("""
+            QFrame {
+                background: #fff3cd;
+                border: 1px solid #ffeaa7;
+                border-radius: 12px;
+                padding: 16px;
+                margin: 16px 0px;
+            }
+        """)
+        insights_layout = QVBoxLayout()
+        insights_title = QLabel("💡 Financial Insights")
+        insights_title.setStyleSheet("font-size: 18px; font-weight: 600; color: #856404; font-family: 'Segoe UI', Arial, sans-serif; margin-bottom: 8px;")
+        insights_layout.addWidget(insights_title)
+        self.insights_items = QVBoxLayout()
+        insights_layout.addLayout(self.insights_items)
+        self.insights_frame.setLayout(insights_layout)
+        center.addWidget(self.insights_frame)
+        
+        # Budget performance summary
+        self.performance_frame = QFrame()
+        self.performance_frame.setStyleSheet("""
+            QFrame {
+                background: #f8f9fa;
+                border: 1px solid #dee2e6;
+                border-radius: 12px;
+                padding: 16px;
+                margin: 16px 0px;
+            }
+        """)
+        perf_layout = QVBoxLayout()
+        perf_title = QLabel("📊 Budget Performance")
+        perf_title.setStyleSheet("font-size: 18px; font-weight: 600; color: #495057; font-family: 'Segoe UI', Arial, sans-serif; margin-bottom: 12px;")
+        perf_layout.addWidget(perf_title)
+        self.performance_items = QVBoxLayout()
+        perf_layout.addLayout(self.performance_items)
+        self.performance_frame.setLayout(perf_layout)
+        center.addWidget(self.performance_frame)
         
         # Current Month Transactions Table
+        self.month_title = QLabel()
+        self.month_title.setStyleSheet("font-size: 20px; font-weight: 600; margin-top: 32px; margin-bottom: 16px; color: #2c3e50; font-family: 'Segoe UI', Arial, sans-serif;")
+        center.addWidget(self.month_title, alignment=get_alignment())
+        
+        self.month_model = MonthTransactionsModel(self)
+        self.month_table = QTableView()
+        self.month_table.setModel(self.month_model)
+        self.month_table.setStyleSheet(MODERN_TABLE_STYLE)
+        self.month_table.setAlternatingRowColors(True)
+        self.month_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.month_table.setEditTriggers(QAbstractItemView.NoEditTriggers)  # Read-only
+        # Set maximum height for table with scroll
+        self.month_table.setMaximumHeight(300)
+        center.addWidget(self.month_table)
+        
+        # No transactions message
+        self.no_txn_label = QLabel("No transactions for the current month")
+        self.no_txn_label.setStyleSheet("font-size: 16px; margin-top: 32px; color: #adb5bd; font-style: italic; font-family: 'Segoe UI', Arial, sans-serif;")
+        center.addWidget(self.no_txn_label, alignment=get_alignment())
         
-        # Get current month transactions
-        current_month_transactions = []
-        if self.manager.transactions:
-            current_month_transactions = [
-                t for t in self.manager.transactions 
-                if t.date.month == current_month and t.date.year == current_year
-            ]
+        center.addStretch()
+        self.setLayout(center)
+
+    @staticmethod
+    def _add_card(card_layout, style, color):
+        """Add a summary card to card_layout and return its label."""
+        card = QFrame()
+        card.setStyleSheet(style)
+        label = QLabel()
+        label.setStyleSheet(f"font-size: 22px; font-weight: 600; color: {color}; font-family: 'Segoe UI', Arial, sans-serif; line-height: 1.4;")
+        label.setAlignment(get_alignment())
+        layout = QVBoxLayout()
+        layout.addWidget(label)
+        card.setLayout(layout)
+        card_layout.addWidget(card)
+        return label
+
+    @staticmethod
+    def _set_labels(layout, entries):
+        """Replace the labels in layout with (text, style) entries."""
+        while layout.count():
+            widget = layout.takeAt(0).widget()
+            if widget is not None:
+                widget.deleteLater()
+        for text, style in entries:
+            label = QLabel(text)
+            label.setStyleSheet(style)
+            label.setWordWrap(True)
+            layout.addWidget(label)
+
+    def refresh_dashboard(self):
+        """Re-read the current month's summary and transactions."""
+        from datetime import date, datetime
+        now = datetime.now()
+        year, month = self._month = (now.year, now.month)
+        self.update_summary()
+        following = date(year + (month == 12), month % 12 + 1, 1)
+        self.month_model.set_transactions(self.manager.get_transactions(
+            date_from=date(year, month, 1), date_to=date.fromordinal(following.toordinal() - 1)
+        ))
+        self.month_title.setText(f"Current Month Transactions ({month}/{year})")
+        self.month_table.resizeColumnsToContents()
+        self._update_month_visibility()
+
+    def update_summary(self):
+        """Update the cards, insights and budget performance from the monthly aggregates."""
+        year, month = self._month
+        summary = self.manager.get_monthly_summary(year, month)
+        self.income_label.setText(f"Total Income\n₹{summary['total_income']:.2f}")
+        self.expense_label.setText(f"Total Expenses\n₹{summary['total_expenses']:.2f}")
+        self.net_label.setText(f"Net Amount\n₹{summary['net_amount']:.2f}")
+        self.txn_count_label.setText(f"Transactions this month: <b>{summary['transaction_count']}</b>")
         
-        if current_month_transactions:
-            # Table title
-            table_title = QLabel(f"Current Month Transactions ({current_month}/{current_year})")
-            table_title.setStyleSheet("font-size: 20px; font-weight: 600; margin-top: 32px; margin-bottom: 16px; color: #2c3e50; font-family: 'Segoe UI', Arial, sans-serif;")
-            center.addWidget(table_title, alignment=get_alignment())
-            
-            # Create table
-            table = QTableWidget()
-            table.setColumnCount(5)
-            table.setHorizontalHeaderLabels(["Date", "Type", "Category", "Amount", "Description"])
-            table.setRowCount(len(current_month_transactions))
-            
-            # Style the table
-            table.setStyleSheet(MODERN_TABLE_STYLE)
-            
-            # Populate table
-            for row, transaction in enumerate(current_month_transactions):
-                # Date
-                date_item = QTableWidgetItem(transaction.date.strftime('%Y-%m-%d'))
-                date_item.setTextAlignment(AlignCenter)
-                table.setItem(row, 0, date_item)
-                
-                # Type with color coding
-                type_item = QTableWidgetItem(transaction.type.capitalize())
-                type_item.setTextAlignment(AlignCenter)
-                if transaction.type == "income":
-                    type_item.setBackground(QColor("#e8f5e8"))
-                    type_item.setForeground(QColor("#155724"))
-                elif transaction.type == "expense":
-                    type_item.setBackground(QColor("#ffeaea"))
-                    type_item.setForeground(QColor("#721c24"))
-                else:  # transfer
-                    type_item.setBackground(QColor("#e3f2fd"))
-                    type_item.setForeground(QColor("#0d47a1"))
-                table.setItem(row, 1, type_item)
-                
-                # Category
-                category_item = QTableWidgetItem(transaction.category)
-                category_item.setTextAlignment(AlignCenter)
-                table.setItem(row, 2, category_item)
-                
-                # Amount with color coding
-                amount_text = f"₹{transaction.amount:.2f}"
-                amount_item = QTableWidgetItem(amount_text)
-                amount_item.setTextAlignment(AlignRight | AlignVCenter)
-                if transaction.type == "income":
-                    amount_item.setForeground(QColor("#155724"))
-                elif transaction.type == "expense":
-                    amount_item.setForeground(QColor("#721c24"))
-                else:  # transfer
-                    amount_item.setForeground(QColor("#0d47a1"))
-                table.setItem(row, 3, amount_item)
-                
-                # Description
-                desc_item = QTableWidgetItem(transaction.description or "")
-                desc_item.setTextAlignment(AlignLeft | AlignVCenter)
-                table.setItem(row, 4, desc_item)
-            
-            # Set table properties
-            table.setAlternatingRowColors(True)
-            table.setSelectionBehavior(QTableWidget.SelectRows)
-            table.setEditTriggers(QTableWidget.NoEditTriggers)  # Read-only
-            table.resizeColumnsToContents()
-            
-            # Set maximum height for table with scroll
-            table.setMaximumHeight(300)
-            
-            # Add table to layout
-            center.addWidget(table)
-        else:
-            # No transactions message
-            no_txn_label = QLabel("No transactions for the current month")
-            no_txn_label.setStyleSheet("font-size: 16px; margin-top: 32px; color: #adb5bd; font-style: italic; font-family: 'Segoe UI', Arial, sans-serif;")
-            center.addWidget(no_txn_label, alignment=get_alignment())
+        insights = self.manager.get_financial_insights()
+        self._set_labels(self.insights_items, [
+            (f"• {recommendation}", "font-size: 14px; color: #856404; font-family: 'Segoe UI', Arial, sans-serif; margin: 2px 0px;")
+            for recommendation in insights['recommendations']
+        ] + [
+            (f"⚠️ {alert}", "font-size: 14px; color: #721c24; font-family: 'Segoe UI', Arial, sans-serif; margin: 2px 0px;")
+            for alert in insights['alerts']
+        ])
+        self.insights_frame.setVisible(bool(insights['recommendations'] or insights['alerts']))
+        
+        # Show top 3 categories by utilization
+        performance = self.manager.get_category_performance(year, month)
+        sorted_performance = sorted(performance.items(), key=lambda x: x[1]['utilization_percent'], reverse=True)
+        entries = []
+        for category_name, data in sorted_performance[:3]:
+            if data['status'] == 'no_budget_set':
+                # Categories without budget limits
+                entries.append((
+                    f"📊 {category_name}: {data['income_percentage']:.1f}% of income (₹{data['expense']:.0f})",
+                    "font-size: 14px; color: #6c757d; font-family: 'Segoe UI', Arial, sans-serif; margin: 2px 0px;",
+                ))
+                continue
+            # Categories with budget limits
+            status_icon = "🔴" if data['status'] == 'over_budget' else "🟢"
+            if data['budget_limit']:
+                perf_text = f"{status_icon} {category_name}: {data['utilization_percent']:.1f}% used (₹{data['expense']:.0f}/{data['budget_limit']:.0f})"
+            else:
+                perf_text = f"{status_icon} {category_name}: {data['utilization_percent']:.1f}% of income (₹{data['expense']:.0f})"
+            entries.append((perf_text, "font-size: 14px; color: #495057; font-family: 'Segoe UI', Arial, sans-serif; margin: 2px 0px;"))
+        self._set_labels(self.performance_items, entries)
+        self.performance_frame.setVisible(bool(entries))
+
+    def on_ledger_changed(self, op, subject, previous):
+        """Apply one change reported by BudgetManager.subscribe() to the affected cards and rows."""
+        from datetime import datetime
+        now = datetime.now()
+        if op == "reset" or (now.year, now.month) != self._month:
+            self.refresh_dashboard()
+            return
+        if op.endswith("_category"):
+            # Budgets and category names feed the performance panel and the table
+            self.update_summary()
+            self.month_model.repaint_all()
+            return
         
-        center.addStretch()
-        self.main_layout.addLayout(center)
+        was_shown = op != "add" and self._in_month(previous['date'] if op == "edit" else subject.date)
+        is_shown = op != "delete" and self._in_month(subject.date)
+        if not (was_shown or is_shown):
+            return
+        if was_shown and is_shown:
+            self.month_model.update(subject)
+        elif was_shown:
+            self.month_model.remove(subject)
+        else:
+            self.month_model.add(subject)
+        self.update_summary()
+        self._update_month_visibility()
+
+    def _in_month(self, day) -> bool:
+        return (day.year, day.month) == self._month
+
+    def _update_month_visibility(self):
+        has_rows = self.month_model.rowCount() > 0
+        self.month_title.setVisible(has_rows)
+        self.month_table.setVisible(has_rows)
+        self.no_txn_label.setVisible(not has_rows)
 
     def clear_expenses(self):
         reply = QMessageBox.question(self, 'Confirm', 'Are you sure you want to delete all transactions?', QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
-            self.manager.transactions.clear()
-            self.manager.save_transactions()
+            self.manager.clear_transactions()
             QMessageBox.information(self, 'Cleared', 'All transactions have been deleted.')
-            self.refresh_dashboard()
+
+class TransactionTableModel(QAbstractTableModel):
+    """
+    Table model over the manager's transactions.
+
+    The model holds references to the Transaction objects and formats cells
+    in data() only when the view paints them, so memory does not grow with
+    widget items and a million-row ledger opens as fast as a small one.
+    Rows start newest first and cover the months the storage loaded at
+    startup; older months are fetched through fetchMore() as the view
+    scrolls to the bottom. Sorting on another column loads the whole ledger
+    and reorders a row index instead of the transactions themselves.
+    """
+
+    HEADERS = ["ID", "Date", "Type", "Category", "Amount", "Description"]
+    DATE_COLUMN = 1
+    AMOUNT_COLUMN = 4
+
+    # Months of history pulled in per fetchMore()
+    FETCH_MONTHS = 12
+
+    SORT_KEYS = [
+        attrgetter('id'),
+        attrgetter('date'),
+        attrgetter('type'),
+        lambda t: t.category.lower(),
+        attrgetter('amount'),
+        lambda t: t.description.lower(),
+    ]
+
+    def __init__(self, manager: BudgetManager, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self._rows = []
+        # Row -> position in _rows when sorted on a column other than date descending
+        self._order = None
+        self._sort_column = self.DATE_COLUMN
+        self._sort_order = Qt.DescendingOrder
+        # Oldest date shown (None for all), and whether _rows are search results
+        self._since = None
+        self._filtered = False
+        self._filled = False
+
+    # Qt model interface
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        column = index.column()
+        if role == Qt.DisplayRole:
+            t = self.transaction_at(index.row())
+            if column == 0:
+                return t.id
+            if column == 1:
+                return t.date.strftime('%Y-%m-%d')
+            if column == 2:
+                return t.type
+            if column == 3:
+                return t.category
+            if column == 4:
+                return f"₹{t.amount:.2f}"
+            return t.description
+        if role == Qt.TextAlignmentRole and column == self.AMOUNT_COLUMN:
+            return int(AlignRight | AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._filtered and self._since is not None
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Load the next FETCH_MONTHS months of older history and append them."""
+        if not self.canFetchMore(parent):
+            return
+        from datetime import date
+        months = self._since.year * 12 + self._since.month - 1 - self.FETCH_MONTHS
+        since = date(months // 12, months % 12 + 1, 1)
+        rows = self.manager.get_transactions(date_from=since)
+        if self.manager.storage.loaded_since is None:
+            since = None
+            rows = self.manager.get_transactions()
+        self._since = since
+        # Older rows sort after everything shown, but loading them rebuilds the
+        # manager's date index, which can reorder same-day rows already shown
+        shown = rows[:len(self._rows)]
+        if any(new is not old for new, old in zip(shown, self._rows)):
+            if not self._reorder_rows(shown):
+                self.beginResetModel()
+                self._rows = rows
+                self.endResetModel()
+                return
+        if len(rows) > len(self._rows):
+            self.beginInsertRows(QModelIndex(), len(self._rows), len(rows) - 1)
+            self._rows = rows
+            self.endInsertRows()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        if not self._natural_order() and self._since is not None and not self._filtered:
+            # A partial ledger would sort misleadingly, so load all of it first
+            self.beginResetModel()
+            self._since = None
+            self._rows = self.manager.get_transactions()
+            self._order = self._sorted_order()
+            self.endResetModel()
+            return
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        positions = [self._position(index.row()) for index in persistent]
+        self._order = self._sorted_order()
+        # Only the few selected or current indexes are mapped to their new rows
+        self.changePersistentIndexList(persistent, [
+            self.index(position if self._order is None else self._order.index(position), index.column())
+            for index, position in zip(persistent, positions)
+        ])
+        self.layoutChanged.emit()
+
+    # Contents
+
+    def transaction_at(self, row: int):
+        """Transaction shown in a view row."""
+        return self._rows[self._position(row)]
+
+    def refresh(self):
+        """Re-read the shown range of the ledger after it changed."""
+        self.beginResetModel()
+        if not self._filled:
+            # Start with the months the storage loaded eagerly
+            self._since = self.manager.storage.loaded_since
+            self._filled = True
+        if self.manager.storage.loaded_since is None or not self._natural_order():
+            self._since = None
+        self._filtered = False
+        self._rows = self.manager.get_transactions(date_from=self._since)
+        self._order = self._sorted_order()
+        self.endResetModel()
+
+    def set_transactions(self, transactions, ordered: bool = False):
+        """
+        Show a fixed list of transactions, e.g. search results, in the
+        current sort order. Pass ordered=True for a list that is already in
+        it, such as one from sorted_transactions().
+        """
+        self.beginResetModel()
+        self._filtered = True
+        self._rows = list(transactions)
+        self._order = None if ordered else self._sorted_order()
+        self.endResetModel()
+
+    def append_transactions(self, transactions):
+        """Add the next part of a streamed set_transactions(ordered=True) list."""
+        if not transactions:
+            return
+        if self._order is not None:
+            # The view was re-sorted while results were streaming in
+            self.beginResetModel()
+            self._rows.extend(transactions)
+            self._order = self._sorted_order()
+            self.endResetModel()
+            return
+        self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(transactions) - 1)
+        self._rows.extend(transactions)
+        self.endInsertRows()
+
+    def _reorder_rows(self, rows) -> bool:
+        """
+        Show the same transactions in a new order, keeping selected and
+        current indexes on their transactions. Returns False, changing
+        nothing, if rows are not a reordering of the shown ones.
+        """
+        rows_by_id = {id(t): row for row, t in enumerate(rows)}
+        if len(rows) != len(self._rows) or any(id(t) not in rows_by_id for t in self._rows):
+            return False
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        moved = [rows_by_id[id(self.transaction_at(index.row()))] for index in persistent]
+        self._rows = list(rows)
+        self._order = self._sorted_order()
+        self.changePersistentIndexList(persistent, [
+            self.index(position if self._order is None else self._order.index(position), index.column())
+            for index, position in zip(persistent, moved)
+        ])
+        self.layoutChanged.emit()
+        return True
+
+    def sorted_transactions(self, transactions):
+        """Transactions in the current sort order; safe to call from a worker thread."""
+        column, order = self._sort_column, self._sort_order
+        return sorted(transactions, key=self.SORT_KEYS[column], reverse=order == Qt.DescendingOrder)
+
+    def _natural_order(self) -> bool:
+        return self._sort_column == self.DATE_COLUMN and self._sort_order == Qt.DescendingOrder
+
+    def _position(self, row: int) -> int:
+        """Position in _rows of a view row."""
+        return row if self._order is None else self._order[row]
+
+    def _sorted_order(self):
+        """Row index for the current sort, or None when the rows are already in it."""
+        if self._natural_order() and not self._filtered:
+            return None
+        key = self.SORT_KEYS[self._sort_column]
+        values = [key(t) for t in self._rows]
+        descending = self._sort_order == Qt.DescendingOrder
+        return sorted(range(len(values)), key=values.__getitem__, reverse=descending)
+
+class SearchSignals(QObject):
+    """Signals of a SearchTask; QRunnable itself cannot emit."""
+    # (generation, query, matches in ledger order), kept to narrow the next query
+    matched = pyqtSignal(int, str, object)
+    # (generation, next rows in display order, whether they replace the shown rows)
+    rows = pyqtSignal(int, object, bool)
+
+
+class SearchTask(QRunnable):
+    """
+    Runs one search off the GUI thread and streams the results back.
+
+    When the query extends the previous one, its results are filtered
+    instead of searching the whole ledger. The task gives up as soon as
+    is_current() reports that a newer query superseded it.
+    """
+
+    # Transactions filtered, and rows sent to the view, per step
+    CHUNK_SIZE = 5000
+
+    def __init__(self, manager: BudgetManager, query: str, generation: int, is_current,
+                 sort_rows, within=None):
+        super().__init__()
+        self.manager = manager
+        self.query = query
+        self.generation = generation
+        self.is_current = is_current
+        self.sort_rows = sort_rows
+        self.within = within
+        self.signals = SearchSignals()
+
+    def run(self):
+        if not self.is_current(self.generation):
+            return
+        if self.within is None:
+            found = self.manager.search_transactions(self.query)
+        else:
+            found = []
+            for start in range(0, len(self.within), self.CHUNK_SIZE):
+                if not self.is_current(self.generation):
+                    return
+                found.extend(t for t in self.within[start:start + self.CHUNK_SIZE] if matches(t, self.query))
+        if not self.is_current(self.generation):
+            return
+        self.signals.matched.emit(self.generation, self.query, found)
+
+        rows = self.sort_rows(found)
+        for start in range(0, max(len(rows), 1), self.CHUNK_SIZE):
+            if not self.is_current(self.generation):
+                return
+            self.signals.rows.emit(self.generation, rows[start:start + self.CHUNK_SIZE], start == 0)
 
 class TransactionsWidget(QWidget):
+    # Pause in typing before a search starts
+    SEARCH_DELAY_MS = 250
+
     def __init__(self, manager: BudgetManager, parent=None):
         super().__init__(parent)
         self.manager = manager
         # Set white background
         self.setStyleSheet("background-color: white;")
-        # Performance optimizations
-        self._cached_transactions = None
-        self._filtered_transactions = None
-        self._current_page = 0
-        self._page_size = 50  # Show 50 transactions per page
+        # The table is filled when the page is first shown, so startup does not load the full history
+        self._needs_refresh = True
         self.init_ui()
 
     def init_ui(self):
@@ -659,18 +974,37 @@ class TransactionsWidget(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search by description, category, or amount...")
         self.search_input.setStyleSheet(MODERN_FORM_STYLE)
-        self.search_input.textChanged.connect(self.filter_transactions)
+        # Searches start once typing pauses, or right away on Enter
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self.filter_transactions)
+        self.search_input.textChanged.connect(self._search_timer.start)
+        self.search_input.returnPressed.connect(self.filter_transactions)
+        # One worker, so searches run one after another against the shared index
+        self._search_pool = QThreadPool(self)
+        self._search_pool.setMaxThreadCount(1)
+        self._search_generation = 0
+        self._search_task = None
+        # Last completed query and its matches, narrowed when the next query extends it
+        self._last_query = None
+        self._last_matches = None
         
         search_layout.addWidget(search_label)
         search_layout.addWidget(self.search_input)
         search_layout.addStretch()
         layout.addLayout(search_layout)
         
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["ID", "Date", "Type", "Category", "Amount", "Description"])
+        self.model = TransactionTableModel(self.manager, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        # Newest first is the model's natural order; set it before enabling sorting so nothing is re-sorted
+        self.table.horizontalHeader().setSortIndicator(TransactionTableModel.DATE_COLUMN, Qt.DescendingOrder)
+        self.table.setSortingEnabled(True)
         self.table.setStyleSheet(MODERN_TABLE_STYLE)
-        self.refresh_table()
         layout.addWidget(self.table)
         btn_layout = QHBoxLayout()
         add_btn = QPushButton("Add Transaction")
@@ -689,39 +1023,72 @@ class TransactionsWidget(QWidget):
         self.setLayout(layout)
     
     def filter_transactions(self):
-        """Filter transactions based on search query."""
-        query = self.search_input.text().strip()
+        """Filter transactions based on search query, on the search worker."""
+        self._search_timer.stop()
+        # Any search still queued or running is now stale
+        self._search_generation += 1
+        query = self.search_input.text().strip().lower()
         if not query:
-            self.refresh_table()
+            self.model.refresh()
+            self.table.resizeColumnsToContents()
             return
-        
-        # Get filtered transactions
-        filtered_transactions = self.manager.search_transactions(query)
-        
-        # Update table with filtered results
-        self.table.setRowCount(len(filtered_transactions))
-        for row, t in enumerate(filtered_transactions):
-            self.table.setItem(row, 0, QTableWidgetItem(t.id))
-            self.table.setItem(row, 1, QTableWidgetItem(t.date.strftime('%Y-%m-%d')))
-            self.table.setItem(row, 2, QTableWidgetItem(t.type))
-            self.table.setItem(row, 3, QTableWidgetItem(t.category))
-            self.table.setItem(row, 4, QTableWidgetItem(f"₹{t.amount:.2f}"))
-            self.table.setItem(row, 5, QTableWidgetItem(t.description))
-        
-        self.table.resizeColumnsToContents()
+        # Older months are merged into the ledger here, never on the worker, which only reads it
+        self.manager.load_all()
+        within = None
+        if self._last_query is not None and self._last_query in query:
+            within = self._last_matches
+        self._search_task = SearchTask(
+            self.manager, query, self._search_generation, self._is_current_search,
+            self.model.sorted_transactions, within,
+        )
+        self._search_task.signals.matched.connect(self._on_search_matched)
+        self._search_task.signals.rows.connect(self._on_search_rows)
+        self._search_pool.start(self._search_task)
+
+    def _is_current_search(self, generation: int) -> bool:
+        return generation == self._search_generation
+
+    def _on_search_matched(self, generation, query, found):
+        if generation == self._search_generation:
+            self._last_query = query
+            self._last_matches = found
+
+    def _on_search_rows(self, generation, rows, first):
+        if generation != self._search_generation:
+            return
+        if first:
+            self.model.set_transactions(rows, ordered=True)
+            self.table.resizeColumnsToContents()
+        else:
+            self.model.append_transactions(rows)
+
+    def stop_search(self):
+        """Cancel any search in progress and wait for the worker to finish."""
+        self._search_generation += 1
+        self._search_pool.clear()
+        self._search_pool.waitForDone()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._needs_refresh:
+            self.refresh_table()
 
     def refresh_table(self):
-        txns = self.manager.get_transactions()
-        self.table.setRowCount(len(txns))
-        for row, t in enumerate(txns):
-            self.table.setItem(row, 0, QTableWidgetItem(t.id))
-            self.table.setItem(row, 1, QTableWidgetItem(t.date.strftime('%Y-%m-%d')))
-            self.table.setItem(row, 2, QTableWidgetItem(t.type))
-            self.table.setItem(row, 3, QTableWidgetItem(t.category))
-            self.table.setItem(row, 4, QTableWidgetItem(f"₹{t.amount:.2f}"))
-            self.table.setItem(row, 5, QTableWidgetItem(t.description))
+        self._needs_refresh = False
+        # The ledger changed, so earlier matches can no longer be narrowed
+        self._last_query = None
+        self._last_matches = None
+        if self.search_input.text().strip():
+            self.filter_transactions()
+            return
+        self.model.refresh()
         self.table.resizeColumnsToContents()
 
+    def selected_transaction(self):
+        """Transaction in the current row, or None."""
+        row = self.table.currentIndex().row()
+        return self.model.transaction_at(row) if row >= 0 else None
+
     def add_transaction(self):
         dlg = TransactionDialog(self.manager, self)
         if dlg.exec_():
@@ -731,16 +1098,11 @@ class TransactionsWidget(QWidget):
             self.refresh_table()
 
     def edit_transaction(self):
-        row = self.table.currentRow()
-        if row < 0:
+        selected = self.selected_transaction()
+        if selected is None:
             QMessageBox.warning(self, "No selection", "Please select a transaction to edit.")
             return
-        item = self.table.item(row, 0)
-        if item is None:
-            QMessageBox.warning(self, "Not found", "Transaction not found.")
-            return
-        txn_id = item.text()
-        txn = self.manager.get_transaction_by_id(txn_id)
+        txn = self.manager.get_transaction_by_id(selected.id)
         if not txn:
             QMessageBox.warning(self, "Not found", "Transaction not found.")
             return
@@ -757,44 +1119,14 @@ class TransactionsWidget(QWidget):
             self.refresh_table()
 
     def delete_transaction(self):
-        row = self.table.currentRow()
-        if row < 0:
+        selected = self.selected_transaction()
+        if selected is None:
             QMessageBox.warning(self, "No selection", "Please select a transaction to delete.")
             return
-        item = self.table.item(row, 0)
-        if item is None:
-            QMessageBox.warning(self, "Not found", "Transaction not found.")
-            return
-        txn_id = item.text()
+        txn_id = selected.id
         if QMessageBox.question(self, "Confirm", "Delete this transaction?", QMessageBox.Yes | QMessageBox.No) == QMessageBox.Yes:
             self.manager.delete_transaction(txn_id)
             self.refresh_table()
-    
-    def previous_page(self):
-        """Go to the previous page of transactions."""
-        if self._current_page > 0:
-            self._current_page -= 1
-            self.refresh_table()
-    
-    def next_page(self):
-        """Go to the next page of transactions."""
-        total_transactions = len(self.manager.get_transactions())
-        max_pages = (total_transactions - 1) // self._page_size
-        if self._current_page < max_pages:
-            self._current_page += 1
-            self.refresh_table()
-    
-    def _update_pagination_controls(self):
-        """Update pagination controls based on current state."""
-        total_transactions = len(self.manager.get_transactions())
-        max_pages = (total_transactions - 1) // self._page_size
-        
-        self.prev_btn.setEnabled(self._current_page > 0)
-        self.next_btn.setEnabled(self._current_page < max_pages)
-        
-        current_page_num = self._current_page + 1
-        total_pages = max_pages + 1
-        self.page_label.setText(f"Page {current_page_num} of {total_pages}")
 
 class TransactionDialog(QDialog):
     def __init__(self, manager: BudgetManager, parent=None, txn=None):
@@ -1021,9 +1353,15 @@ class CategoryDialog(QDialog):
             raise ValueError("Invalid budget limit. Please enter a valid number.")
 
 class VisualizationsWidget(QWidget):
+    # Months of history in the trend chart, counting the current one
+    TREND_MONTHS = 12
+
     def __init__(self, manager: BudgetManager, parent=None):
         super().__init__(parent)
         self.manager = manager
+        # Created with the first chart, which is when matplotlib is imported
+        self._charts = None
+        self._chart_dialogs = {}
         # Set white background
         self.setStyleSheet("background-color: white;")
         self.init_ui()
@@ -1065,120 +1403,94 @@ class VisualizationsWidget(QWidget):
         layout.addStretch()
         self.setLayout(layout)
 
-    def show_pie_chart(self):
-        from datetime import datetime
-        now = datetime.now()
+    def _show_chart(self, name, window_title, draw):
+        """
+        Draw a chart into its dialog and show it. Each chart keeps one
+        dialog and figure for the session; reopening it updates the
+        figure in place instead of building a new one.
+        """
+        if self._charts is None:
+            self._charts = chart_service()
+        created = name not in self._charts
+        chart = draw(self._charts.chart(name))
+        win = self._chart_dialogs.get(name)
+        if win is None or created:
+            win = self._chart_dialogs[name] = QDialog(self)
+            win.setWindowTitle(window_title)
+            win.setStyleSheet("background-color: white;")
+            layout = QVBoxLayout()
+            layout.addWidget(chart.canvas)
+            win.setLayout(layout)
+        win.showMaximized()  # Open in fullscreen
+        win.exec_()
+
+    def release_charts(self):
+        """Free every chart figure and its dialog."""
+        if self._charts is not None:
+            self._charts.release()
+        for win in self._chart_dialogs.values():
+            win.deleteLater()
+        self._chart_dialogs = {}
+
+    def _month_expenses(self, now):
+        """Categories with expenses this month and their totals."""
         summary = self.manager.get_monthly_summary(now.year, now.month)
-        category_data = summary['category_breakdown']
         labels = []
         sizes = []
-        for cat, vals in category_data.items():
+        for cat, vals in summary['category_breakdown'].items():
             if vals.get('expense', 0) > 0:
                 labels.append(cat)
                 sizes.append(vals['expense'])
+        return labels, sizes
+
+    def show_pie_chart(self):
+        from datetime import datetime
+        now = datetime.now()
+        labels, sizes = self._month_expenses(now)
         if not sizes:
             QMessageBox.information(self, "No Data", "No expenses to visualize for this month.")
             return
-        win = QDialog(self)
-        win.setWindowTitle("Expense Breakdown (Pie Chart)")
-        win.showMaximized()  # Open in fullscreen
-        win.setStyleSheet("background-color: white;")
-        
-        # Use large figure size for better visibility
-        fig, ax = plt.subplots(figsize=(16, 12))
-        ax.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=140)
-        ax.set_title(f"Expense Breakdown by Category\n{now.year}-{now.month:02d}", fontsize=16, fontweight='bold')
-        canvas = FigureCanvas(fig)
-        layout = QVBoxLayout()
-        layout.addWidget(canvas)
-        win.setLayout(layout)
-        win.exec_()
+        self._show_chart("pie", "Expense Breakdown (Pie Chart)", lambda chart: chart.pie(
+            labels, sizes, f"Expense Breakdown by Category\n{now.year}-{now.month:02d}"
+        ))
 
     def show_bar_chart(self):
         from datetime import datetime
         now = datetime.now()
-        summary = self.manager.get_monthly_summary(now.year, now.month)
-        category_data = summary['category_breakdown']
-        labels = []
-        sizes = []
-        for cat, vals in category_data.items():
-            if vals.get('expense', 0) > 0:
-                labels.append(cat)
-                sizes.append(vals['expense'])
+        labels, sizes = self._month_expenses(now)
         if not sizes:
             QMessageBox.information(self, "No Data", "No expenses to visualize for this month.")
             return
-        win = QDialog(self)
-        win.setWindowTitle("Monthly Expenses by Category (Bar Chart)")
-        win.showMaximized()  # Open in fullscreen
-        win.setStyleSheet("background-color: white;")
-        
-        # Use large figure size for better visibility
-        fig, ax = plt.subplots(figsize=(16, 12))
-        bars = ax.bar(labels, sizes, color='skyblue', edgecolor='navy', linewidth=1)
-        ax.set_ylabel('Amount (₹)', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Category', fontsize=14, fontweight='bold')
-        ax.set_title(f"Monthly Expenses by Category\n{now.year}-{now.month:02d}", fontsize=16, fontweight='bold')
-        ax.tick_params(axis='x', rotation=30, labelsize=12)
-        ax.tick_params(axis='y', labelsize=12)
-        
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + max(sizes)*0.01,
-                   f"₹{height:.2f}", ha='center', va='bottom', fontsize=11, fontweight='bold')
-        
-        fig.tight_layout()
-        canvas = FigureCanvas(fig)
-        layout = QVBoxLayout()
-        layout.addWidget(canvas)
-        win.setLayout(layout)
-        win.exec_()
+        self._show_chart("bar", "Monthly Expenses by Category (Bar Chart)", lambda chart: chart.bars(
+            labels, {'Expenses': sizes}, f"Monthly Expenses by Category\n{now.year}-{now.month:02d}",
+            xlabel='Category', ylabel='Amount (₹)', value_labels=True,
+            styles={'Expenses': dict(color='skyblue', edgecolor='navy', linewidth=1)},
+        ))
 
     def show_trend_chart(self):
-        from datetime import datetime
-        now = datetime.now()
-        # Assuming you have a method to get historical data or need to fetch it
-        # For now, let's use a placeholder or fetch recent data
-        # This part would require a more robust data fetching mechanism
-        # For demonstration, let's use a dummy list of dates and amounts
-        dummy_dates = [
-            datetime(2023, 1, 1), datetime(2023, 2, 1), datetime(2023, 3, 1),
-            datetime(2023, 4, 1), datetime(2023, 5, 1), datetime(2023, 6, 1),
-            datetime(2023, 7, 1), datetime(2023, 8, 1), datetime(2023, 9, 1),
-            datetime(2023, 10, 1), datetime(2023, 11, 1), datetime(2023, 12, 1)
-        ]
-        dummy_amounts = [
-            1000, 1200, 1100, 1300, 1400, 1500, 1600, 1700, 1800, 1900, 2000, 2100
-        ]
+        from datetime import date
+        today = date.today()
+        first = today.year * 12 + today.month - self.TREND_MONTHS
+        trend = self.manager.get_time_series(
+            "month", start_date=date(first // 12, first % 12 + 1, 1), end_date=today, group_by="type"
+        )
+        periods = trend['periods']
+        expenses = trend['series'].get('expense', [0.0] * len(periods))
+        income = trend['series'].get('income', [0.0] * len(periods))
 
-        if len(dummy_dates) < 2:
-            QMessageBox.information(self, "Not Enough Data", "Need at least two data points for a trend chart.")
+        if not any(expenses) and not any(income):
+            QMessageBox.information(self, "No Data", f"No transactions in the last {self.TREND_MONTHS} months to chart.")
             return
 
-        win = QDialog(self)
-        win.setWindowTitle("Expense Trends (Line Chart)")
-        win.showMaximized()  # Open in fullscreen
-        win.setStyleSheet("background-color: white;")
-        
-        # Use large figure size for better visibility
-        fig, ax = plt.subplots(figsize=(16, 12))
-        # Convert datetime objects to matplotlib dates
-        dates_mpl = mdates.date2num(dummy_dates)
-        ax.plot(dates_mpl, dummy_amounts, marker='o', linestyle='-', color='blue', linewidth=3, markersize=8)
-        ax.set_ylabel('Amount (₹)', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Date', fontsize=14, fontweight='bold')
-        ax.set_title(f"Monthly Expense Trends\n{now.year}", fontsize=16, fontweight='bold')
-        ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-        ax.tick_params(axis='x', rotation=45, labelsize=12)
-        ax.tick_params(axis='y', labelsize=12)
-        ax.grid(True, linestyle='--', alpha=0.7)
-        fig.tight_layout()
-        canvas = FigureCanvas(fig)
-        layout = QVBoxLayout()
-        layout.addWidget(canvas)
-        win.setLayout(layout)
-        win.exec_()
+        self._show_chart("trend", "Expense Trends (Line Chart)", lambda chart: chart.lines(
+            periods, {'Expenses': expenses, 'Income': income},
+            f"Monthly Expense Trends\n{periods[0]:%Y-%m} to {periods[-1]:%Y-%m}",
+            xlabel='Month', ylabel='Amount (₹)', date_format='%Y-%m',
+            styles={
+                'Expenses': dict(marker='o', linestyle='-', color='#c0392b', linewidth=3, markersize=8),
+                'Income': dict(marker='o', linestyle='--', color='#27ae60', linewidth=2, markersize=6),
+            },
+        ))
 
     def show_budget_comparison(self):
         from datetime import datetime
@@ -1203,33 +1515,43 @@ class VisualizationsWidget(QWidget):
         budget_amounts = [categories_with_budgets[cat]['budget_limit'] for cat in categories]
         actual_amounts = [categories_with_budgets[cat]['expense'] for cat in categories]
 
-        win = QDialog(self)
-        win.setWindowTitle("Budget vs Actual Comparison")
-        win.showMaximized()  # Open in fullscreen
-        win.setStyleSheet("background-color: white;")
-        
-        # Use large figure size for better visibility
-        fig, ax = plt.subplots(figsize=(16, 12))
-        bar_width = 0.35
-        index = np.arange(len(categories))
-
-        budget_bars = ax.bar(index - bar_width/2, budget_amounts, bar_width, label='Budget', color='lightgreen', edgecolor='darkgreen', linewidth=1)
-        actual_bars = ax.bar(index + bar_width/2, actual_amounts, bar_width, label='Actual', color='lightcoral', edgecolor='darkred', linewidth=1)
-
-        ax.set_ylabel('Amount (₹)', fontsize=14, fontweight='bold')
-        ax.set_xlabel('Categories', fontsize=14, fontweight='bold')
-        ax.set_title(f"Budget vs Actual Expenses\n{now.year}-{now.month:02d}", fontsize=16, fontweight='bold')
-        ax.set_xticks(index)
-        ax.set_xticklabels(categories, fontsize=12)
-        ax.tick_params(axis='y', labelsize=12)
-        ax.legend(fontsize=12)
-        ax.grid(True, linestyle='--', alpha=0.7)
-        fig.tight_layout()
-        canvas = FigureCanvas(fig)
-        layout = QVBoxLayout()
-        layout.addWidget(canvas)
-        win.setLayout(layout)
-        win.exec_()
+        self._show_chart("budget", "Budget vs Actual Comparison", lambda chart: chart.bars(
+            categories, {'Budget': budget_amounts, 'Actual': actual_amounts},
+            f"Budget vs Actual Expenses\n{now.year}-{now.month:02d}",
+            xlabel='Categories', ylabel='Amount (₹)',
+            styles={
+                'Budget': dict(color='lightgreen', edgecolor='darkgreen', linewidth=1),
+                'Actual': dict(color='lightcoral', edgecolor='darkred', linewidth=1),
+            },
+        ))
+
+class LedgerLoader(QThread):
+    """Loads the ledger off the UI thread; nothing else touches the manager until it finishes."""
+    loaded = pyqtSignal()
+    failed = pyqtSignal(str)
+
+    def __init__(self, manager: BudgetManager, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+
+    def run(self):
+        try:
+            self.manager.load_data()
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.loaded.emit()
+
+class LedgerEvents(QObject):
+    """
+    Re-emits BudgetManager change notifications as a Qt signal, so slots run
+    on the GUI thread even when the change was made on a worker thread.
+    """
+    changed = pyqtSignal(str, object, object)
+
+    def __init__(self, manager: BudgetManager, parent=None):
+        super().__init__(parent)
+        self.unsubscribe = manager.subscribe(self.changed.emit)
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -1239,8 +1561,14 @@ class MainWindow(QMainWindow):
         self.showMaximized()
         # Set white background for main window
         self.setStyleSheet("background-color: white;")
-        self.manager = BudgetManager()
+        # Saves happen on a background thread so edits never block the UI
+        self.manager = BudgetManager(storage=PartitionedCsvStorage("data"), write_behind=0.5, load=False)
         self.init_ui()
+        # The window shows a loading page while the ledger is decrypted in the background
+        self.loader = LedgerLoader(self.manager, self)
+        self.loader.loaded.connect(self.on_ledger_loaded)
+        self.loader.failed.connect(self.on_ledger_failed)
+        self.loader.start()
 
     def init_ui(self):
         # Navigation
@@ -1322,10 +1650,35 @@ class MainWindow(QMainWindow):
         nav_layout.addWidget(self.btn_clear_expenses)
         nav_widget.setLayout(nav_layout)
         
-        # Stacked pages
+        # Stacked pages; until the ledger is loaded only the loading page exists
         self.stacked = QStackedWidget()
+        self.loading_label = QLabel("Loading your transactions...")
+        self.loading_label.setAlignment(AlignCenter)
+        self.loading_label.setStyleSheet("font-size: 20px; color: #6c757d; font-family: 'Segoe UI', Arial, sans-serif;")
+        self.stacked.addWidget(self.loading_label)
+        self.nav_buttons = [
+            self.btn_dashboard, self.btn_transactions, self.btn_categories, self.btn_visualizations,
+            self.btn_export_csv, self.btn_export_json, self.btn_import_csv, self.btn_import_json,
+            self.btn_clear_expenses
+        ]
+        for button in self.nav_buttons:
+            button.setEnabled(False)
+        # Main layout
+        main_widget = QWidget()
+        main_layout = QVBoxLayout()
+        main_layout.addWidget(nav_widget)
+        main_layout.addWidget(self.stacked)
+        main_widget.setLayout(main_layout)
+        self.setCentralWidget(main_widget)
+        self.btn_settings.clicked.connect(self.show_settings_dialog) # Connect settings button
+    
+    def on_ledger_loaded(self):
+        """Build the pages once the ledger is in memory."""
         self.dashboard_page = DashboardWidget(self.manager)
         self.stacked.addWidget(self.dashboard_page)
+        # The dashboard follows every change to the ledger as it happens
+        self.events = LedgerEvents(self.manager, self)
+        self.events.changed.connect(self.dashboard_page.on_ledger_changed)
         # Transactions page
         self.transactions_page = TransactionsWidget(self.manager)
         self.stacked.addWidget(self.transactions_page)
@@ -1335,20 +1688,22 @@ class MainWindow(QMainWindow):
         # Visualizations page
         self.visualizations_page = VisualizationsWidget(self.manager)
         self.stacked.addWidget(self.visualizations_page)
-        # Main layout
-        main_widget = QWidget()
-        main_layout = QVBoxLayout()
-        main_layout.addWidget(nav_widget)
-        main_layout.addWidget(self.stacked)
-        main_widget.setLayout(main_layout)
-        self.setCentralWidget(main_widget)
+        self.stacked.setCurrentWidget(self.dashboard_page)
+        self.stacked.removeWidget(self.loading_label)
+        self.loading_label.deleteLater()
+        for button in self.nav_buttons:
+            button.setEnabled(True)
         # Navigation actions
         self.btn_dashboard.clicked.connect(lambda: self.navigate_to_page(self.dashboard_page, self.btn_dashboard))
         self.btn_transactions.clicked.connect(lambda: self.navigate_to_page(self.transactions_page, self.btn_transactions))
         self.btn_categories.clicked.connect(lambda: self.navigate_to_page(self.categories_page, self.btn_categories))
         self.btn_visualizations.clicked.connect(lambda: self.navigate_to_page(self.visualizations_page, self.btn_visualizations))
         self.btn_clear_expenses.clicked.connect(self.dashboard_page.clear_expenses)
-        self.btn_settings.clicked.connect(self.show_settings_dialog) # Connect settings button
+    
+    def on_ledger_failed(self, message):
+        """Report a ledger that could not be loaded; the pages stay unavailable."""
+        self.loading_label.setText(f"Could not load your transactions:\n{message}")
+        QMessageBox.critical(self, "Load Failed", f"Could not load your transactions: {message}")
     
     def navigate_to_page(self, page, button):
         """Navigate to a page and update active button styling."""
@@ -1401,19 +1756,40 @@ class MainWindow(QMainWindow):
         """Import data from CSV file."""
         filepath, _ = QFileDialog.getOpenFileName(self, "Import CSV Data", "", "CSV Files (*.csv);;All Files (*)")
         if filepath:
+            dialog = QProgressDialog("Importing transactions...", "Cancel", 0, 100, self)
+            dialog.setWindowTitle("Import CSV")
+            dialog.setWindowModality(Qt.WindowModal)
+            dialog.setMinimumDuration(500)
+            
+            def report(rows, fraction):
+                dialog.setLabelText(f"Imported {rows:,} rows...")
+                dialog.setValue(int(fraction * 100))
+                QApplication.processEvents()
+                return not dialog.wasCanceled()
+            
             try:
-                self.manager.import_data(filepath, "csv")
-                QMessageBox.information(self, "Import Successful", f"Data imported from:\n{filepath}")
+                result = self.manager.import_data(filepath, "csv", progress=report)
+                dialog.close()
+                message = f"Imported {result['imported_count']:,} transactions from:\n{filepath}"
+                if result['cancelled']:
+                    message += "\n\nImport was cancelled; rows read before cancelling were kept."
+                if result['duplicate_count']:
+                    message += f"\n\n{result['duplicate_count']:,} rows matched existing transactions and were skipped."
+                if result['error_count']:
+                    message += f"\n\n{result['error_count']:,} rows were skipped:\n" + "\n".join(result['errors'][:10])
+                QMessageBox.information(self, "Import Finished", message)
                 self.refresh_all_widgets() # Refresh all widgets to show new data
             except Exception as e:
+                dialog.close()
                 QMessageBox.warning(self, "Import Failed", f"Failed to import data: {str(e)}")
     
     def import_json(self):
         """Import data from JSON file."""
-        filepath, _ = QFileDialog.getOpenFileName(self, "Import JSON Data", "", "JSON Files (*.json);;All Files (*)")
+        filepath, _ = QFileDialog.getOpenFileName(self, "Import JSON Data", "", "JSON Files (*.json *.jsonl *.ndjson);;All Files (*)")
         if filepath:
             try:
-                self.manager.import_data(filepath, "json")
+                json_format = "jsonl" if filepath.lower().endswith(('.jsonl', '.ndjson')) else "json"
+                self.manager.import_data(filepath, json_format)
                 QMessageBox.information(self, "Import Successful", f"Data imported from:\n{filepath}")
                 self.refresh_all_widgets() # Refresh all widgets to show new data
             except Exception as e:
@@ -1421,13 +1797,25 @@ class MainWindow(QMainWindow):
     
     def refresh_all_widgets(self):
         """Refresh all widgets in the main window to show updated data."""
-        self.dashboard_page.refresh_dashboard()
+        # The dashboard is kept current through self.events
         self.transactions_page.refresh_table()
         self.categories_page.refresh_table()
         # No direct refresh for VisualizationsWidget as it's a button-driven page
     
     def closeEvent(self, event):
-        # Clean exit
+        # Let a load still in progress finish before anything is written
+        self.loader.wait()
+        # Write any changes still queued for the background saver before exiting
+        try:
+            self.manager.flush()
+        except Exception as e:
+            QMessageBox.critical(self, "Save Failed", f"Could not save your changes: {e}")
+            event.ignore()
+            return
+        # Only tear pages down once the window is really closing
+        if hasattr(self, "transactions_page"):
+            self.transactions_page.stop_search()
+            self.visualizations_page.release_charts()
         event.accept()
 
     def show_settings_dialog(self):
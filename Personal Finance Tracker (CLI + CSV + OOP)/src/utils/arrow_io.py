@@ -0,0 +1,218 @@
+import json
+import os
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.models.transaction import Transaction
+from src.models.category import Category
+
+
+# File extension for each supported format
+EXTENSIONS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+# Extensions read as each format; Feather v2 files are Arrow IPC files
+READ_EXTENSIONS = {"parquet": (".parquet",), "arrow": (".arrow", ".feather")}
+
+# Ways to split a partitioned export into files
+PARTITIONS = ("year", "month")
+
+# Schema metadata key holding the exported categories
+CATEGORIES_KEY = b"finance_tracker.categories"
+
+
+def _pyarrow():
+    """Import pyarrow on first use; it is optional and slow to import."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Parquet and Arrow formats require pyarrow. Install it with 'pip install pyarrow'.")
+    return pyarrow
+
+
+def transaction_schema(categories: Iterable[Category] = ()):
+    """
+    Arrow schema of exported transactions.
+
+    Dates are date32, amounts decimal128(18, 2) and the low-cardinality
+    columns are dictionary-encoded. The categories are stored as JSON in
+    the schema metadata so budgets survive a round trip.
+    """
+    pa = _pyarrow()
+    metadata = {CATEGORIES_KEY: json.dumps([c.to_dict() for c in categories]).encode('utf-8')}
+    return pa.schema([
+        ("id", pa.string()),
+        ("date", pa.date32()),
+        ("type", pa.dictionary(pa.int8(), pa.string())),
+        ("category", pa.dictionary(pa.int32(), pa.string())),
+        ("amount", pa.decimal128(18, 2)),
+        ("description", pa.string()),
+        ("currency", pa.dictionary(pa.int8(), pa.string())),
+    ], metadata=metadata)
+
+
+def to_table(transactions: List[Transaction], categories: Iterable[Category] = ()):
+    """Build an Arrow table of transactions."""
+    pa = _pyarrow()
+    schema = transaction_schema(categories)
+    cents = Decimal("0.01")
+    columns = [
+        pa.array([t.id for t in transactions], pa.string()),
+        pa.array([t.date for t in transactions], pa.date32()),
+        pa.array([t.type for t in transactions], pa.string()).dictionary_encode().cast(schema.field("type").type),
+        pa.array([t.category for t in transactions], pa.string()).dictionary_encode().cast(schema.field("category").type),
+        pa.array([Decimal(repr(t.amount)).quantize(cents) for t in transactions], pa.decimal128(18, 2)),
+        pa.array([t.description for t in transactions], pa.string()),
+        pa.array([t.currency for t in transactions], pa.string()).dictionary_encode().cast(schema.field("currency").type),
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _write_table(table, path: str, format: str) -> None:
+    """Write one table as a Parquet file or an Arrow IPC file."""
+    from src.utils.atomic import AtomicWriter
+
+    pa = _pyarrow()
+    with AtomicWriter(path) as f:
+        if format == "parquet":
+            import pyarrow.parquet as pq
+            pq.write_table(table, f)
+        else:
+            with pa.ipc.new_file(f, table.schema) as writer:
+                writer.write_table(table)
+
+
+def _partition_key(transaction: Transaction, partition: str) -> str:
+    """Name of the partition a transaction belongs to, e.g. 2023 or 2023-04."""
+    if partition == "year":
+        return f"{transaction.date.year:04d}"
+    return f"{transaction.date.year:04d}-{transaction.date.month:02d}"
+
+
+def write_transactions(path: str, transactions: Iterable[Transaction], categories: Iterable[Category] = (),
+                       format: str = "parquet", partition: Optional[str] = None) -> List[str]:
+    """
+    Export transactions as Parquet or Arrow IPC.
+
+    Args:
+        path: Output file, or output directory when partitioning
+        transactions: Transactions to export
+        categories: Categories to store in the schema metadata
+        format: 'parquet' or 'arrow'
+        partition: None for a single file, or 'year' / 'month' to write one
+            file per period named transactions-<period><ext> into path
+
+    Returns:
+        Paths of the files written
+    """
+    if format not in EXTENSIONS:
+        raise ValueError("Columnar format must be 'parquet' or 'arrow'")
+    if partition is not None and partition not in PARTITIONS:
+        raise ValueError("partition must be 'year' or 'month'")
+    categories = list(categories)
+
+    if partition is None:
+        _write_table(to_table(list(transactions), categories), path, format)
+        return [path]
+
+    groups: Dict[str, List[Transaction]] = {}
+    for transaction in transactions:
+        groups.setdefault(_partition_key(transaction, partition), []).append(transaction)
+    os.makedirs(path, exist_ok=True)
+    written = []
+    for key in sorted(groups):
+        file_path = os.path.join(path, f"transactions-{key}{EXTENSIONS[format]}")
+        _write_table(to_table(groups[key], categories), file_path, format)
+        written.append(file_path)
+    return written
+
+
+def _period_bounds(name: str) -> Optional[Tuple[date, date]]:
+    """First and last day covered by a partition file name, or None if it is not one."""
+    stem = name.split(".", 1)[0]
+    if not stem.startswith("transactions-"):
+        return None
+    period = stem[len("transactions-"):]
+    try:
+        if len(period) == 4:
+            year = int(period)
+            return date(year, 1, 1), date(year, 12, 31)
+        year, month = (int(part) for part in period.split("-"))
+        end = date(year + (month == 12), month % 12 + 1, 1)
+        return date(year, month, 1), date.fromordinal(end.toordinal() - 1)
+    except ValueError:
+        return None
+
+
+def _files(path: str, format: str, date_from: Optional[date], date_to: Optional[date]) -> List[str]:
+    """Files to read: path itself, or the partitions in a directory overlapping the date range."""
+    if not os.path.isdir(path):
+        return [path]
+    names = [name for name in sorted(os.listdir(path)) if name.lower().endswith(READ_EXTENSIONS[format])]
+    if not names:
+        raise ValueError(f"No {format} files found in {path}")
+    selected = []
+    for name in names:
+        bounds = _period_bounds(name)
+        if bounds is not None:
+            first, last = bounds
+            if (date_from and last < date_from) or (date_to and first > date_to):
+                continue
+        selected.append(os.path.join(path, name))
+    return selected
+
+
+def _read_table(path: str, format: str):
+    """Read a table through a memory map, so pages are loaded on demand."""
+    pa = _pyarrow()
+    if format == "parquet":
+        import pyarrow.parquet as pq
+        return pq.read_table(path, memory_map=True)
+    with pa.memory_map(path, 'r') as source:
+        return pa.ipc.open_file(source).read_all()
+
+
+def detect_format(path: str) -> Optional[str]:
+    """Columnar format of a file or partition directory, judged by extension."""
+    names = os.listdir(path) if os.path.isdir(path) else [path]
+    for format, extensions in READ_EXTENSIONS.items():
+        if any(name.lower().endswith(extensions) for name in names):
+            return format
+    return None
+
+
+def read_transactions(path: str, format: str = "parquet", date_from: Optional[date] = None,
+                      date_to: Optional[date] = None) -> Iterator[Tuple[List[Category], List[Transaction]]]:
+    """
+    Read an export written by write_transactions, one file at a time.
+
+    Args:
+        path: Exported file or partition directory
+        format: 'parquet' or 'arrow'
+        date_from: Skip partitions and rows before this date
+        date_to: Skip partitions and rows after this date
+
+    Yields:
+        (categories from the file's metadata, its transactions)
+    """
+    if format not in EXTENSIONS:
+        raise ValueError("Columnar format must be 'parquet' or 'arrow'")
+    pa = _pyarrow()
+    import pyarrow.compute as pc
+
+    for file_path in _files(path, format, date_from, date_to):
+        table = _read_table(file_path, format)
+        if date_from is not None:
+            table = table.filter(pc.greater_equal(table["date"], pa.scalar(date_from, pa.date32())))
+        if date_to is not None:
+            table = table.filter(pc.less_equal(table["date"], pa.scalar(date_to, pa.date32())))
+
+        metadata = table.schema.metadata or {}
+        categories = [Category.from_dict(data) for data in json.loads(metadata.get(CATEGORIES_KEY, b"[]"))]
+
+        columns = [table[name].to_pylist() for name in ("id", "date", "type", "category", "amount", "description", "currency")]
+        transactions = [
+            Transaction(float(amount), type, category, description or "", day, currency or "INR", id)
+            for id, day, type, category, amount, description, currency in zip(*columns)
+        ]
+        yield categories, transactions
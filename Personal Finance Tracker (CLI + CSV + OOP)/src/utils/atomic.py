@@ -0,0 +1,232 @@
+import hashlib
+import io
+import json
+import os
+import secrets
+import stat
+from pathlib import Path
+from typing import IO, Dict, NamedTuple, Optional, Union
+
+
+PathLike = Union[str, Path]
+
+
+class FileDigest(NamedTuple):
+    """Checksum and size of a written file."""
+    sha256: str
+    size: int
+
+
+def backup_path(path: PathLike) -> Path:
+    """Path of the previous generation kept next to a data file."""
+    path = Path(path)
+    return path.with_name(path.name + ".bak")
+
+
+def file_digest(path: PathLike) -> FileDigest:
+    """Compute the SHA-256 checksum and size of a file."""
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+            size += len(block)
+    return FileDigest(digest.hexdigest(), size)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Make a rename in a directory durable (not supported on every platform)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class _HashingWriter(io.RawIOBase):
+    """Raw writer that checksums everything written through it."""
+
+    def __init__(self, dst: IO[bytes]):
+        super().__init__()
+        self._dst = dst
+        self.hash = hashlib.sha256()
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.hash.update(data)
+        self.size += len(data)
+        self._dst.write(data)
+        return len(data)
+
+
+class AtomicWriter:
+    """
+    Context manager that replaces a file atomically.
+
+    Data is written to a temporary file in the target directory, flushed
+    and fsync'd, then moved over the target with os.replace, so readers and
+    crash recovery only ever see the old or the new file, never a partial
+    one. If the block raises, the target is left untouched.
+
+    The new file keeps the mode of the file it replaces, or gets the
+    umask's default for a new file, like a file written with open().
+    Pass private=True for secrets such as keys to keep it owner-only.
+
+    Usage:
+        writer = AtomicWriter(path, keep_backup=True)
+        with writer as f:
+            f.write(data)
+        writer.digest  # FileDigest of what was written
+    """
+
+    def __init__(self, path: PathLike, mode: str = 'wb', encoding: Optional[str] = None,
+                 newline: Optional[str] = None, keep_backup: bool = False, private: bool = False):
+        """
+        Args:
+            path: File to replace
+            mode: 'wb' for a binary file object or 'w' for a text one
+            encoding: Text encoding for mode 'w' (default utf-8)
+            newline: Newline handling for mode 'w', as for open()
+            keep_backup: Keep the replaced file as <name>.bak
+            private: Leave the file readable by its owner only (mode 0600)
+        """
+        if mode not in ('wb', 'w'):
+            raise ValueError("AtomicWriter mode must be 'wb' or 'w'")
+        self.path = Path(path)
+        self.mode = mode
+        self.encoding = encoding or 'utf-8'
+        self.newline = newline
+        self.keep_backup = keep_backup
+        self.private = private
+        self.digest: Optional[FileDigest] = None
+
+    def __enter__(self) -> IO:
+        directory = self.path.parent
+        directory.mkdir(parents=True, exist_ok=True)
+        # Created with os.open rather than mkstemp, which always uses 0600, so the kernel applies the umask
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+        while True:
+            self._temp_path = str(directory / f".{self.path.name}.{secrets.token_hex(4)}.tmp")
+            try:
+                fd = os.open(self._temp_path, flags, 0o600 if self.private else 0o666)
+                break
+            except FileExistsError:
+                continue
+        self._file = os.fdopen(fd, 'wb')
+        self._hashing = _HashingWriter(self._file)
+        if self.mode == 'wb':
+            self._stream = self._hashing
+        else:
+            self._stream = io.TextIOWrapper(io.BufferedWriter(self._hashing), encoding=self.encoding, newline=self.newline)
+        return self._stream
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                self._stream.flush()
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            self._stream.close()
+            self._file.close()
+            if exc_type is not None:
+                return
+            replaced_mode = None if self.private else self._replaced_mode()
+            if replaced_mode is not None:
+                os.chmod(self._temp_path, replaced_mode)
+            if self.keep_backup and self.path.exists():
+                os.replace(self.path, backup_path(self.path))
+            os.replace(self._temp_path, self.path)
+            _fsync_directory(self.path.parent)
+            self.digest = FileDigest(self._hashing.hash.hexdigest(), self._hashing.size)
+        finally:
+            if os.path.exists(self._temp_path):
+                os.unlink(self._temp_path)
+
+    def _replaced_mode(self) -> Optional[int]:
+        """Mode of the file being replaced, or None for a new file."""
+        try:
+            return stat.S_IMODE(os.stat(self.path).st_mode)
+        except FileNotFoundError:
+            return None
+
+
+class DataManifest:
+    """
+    Checksums of the data files in a data directory.
+
+    Stored as manifest.json next to the data files. Each tracked file has
+    the SHA-256 of its current generation and of the previous one (kept as
+    <name>.bak), so a load can tell which copy is intact even when a crash
+    landed between replacing a file and updating the manifest.
+    """
+
+    FILENAME = "manifest.json"
+
+    def __init__(self, data_dir: PathLike):
+        self.path = Path(data_dir) / self.FILENAME
+        self.entries: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """Read the manifest; an unreadable manifest is treated as empty."""
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f).get('files', {})
+        except (ValueError, OSError, AttributeError):
+            return {}
+
+    def record(self, path: PathLike, digest: FileDigest) -> None:
+        """Record the checksum of a file that has just been written."""
+        name = Path(path).name
+        previous = self.entries.get(name)
+        self.entries[name] = {
+            'sha256': digest.sha256,
+            'size': digest.size,
+            'previous_sha256': previous['sha256'] if previous else None,
+        }
+        with AtomicWriter(self.path, mode='w') as f:
+            json.dump({'version': 1, 'files': self.entries}, f, indent=2)
+
+    def verify(self, path: PathLike) -> Optional[bool]:
+        """
+        Check a file against its manifest entry.
+
+        Returns:
+            True if it matches the current or previous generation, False if
+            not, None if the file is not tracked
+        """
+        path = Path(path)
+        base_name = path.name[:-len(".bak")] if path.name.endswith(".bak") else path.name
+        entry = self.entries.get(base_name)
+        if entry is None:
+            return None
+        return file_digest(path).sha256 in (entry['sha256'], entry.get('previous_sha256'))
+
+    def select(self, path: PathLike) -> Optional[Path]:
+        """
+        Choose which copy of a data file to load.
+
+        Returns:
+            The file itself if it verifies, otherwise its backup if that
+            verifies, or None if neither exists
+
+        Raises:
+            ValueError: If copies exist but none of them verifies
+        """
+        path = Path(path)
+        candidates = [p for p in (path, backup_path(path)) if p.exists()]
+        for candidate in candidates:
+            if self.verify(candidate) is not False:
+                return candidate
+        if candidates:
+            raise ValueError(f"{path.name} and its backup failed checksum verification")
+        return None
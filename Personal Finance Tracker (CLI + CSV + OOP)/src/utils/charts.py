@@ -0,0 +1,244 @@
+import math
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from matplotlib.figure import Figure
+
+
+# Pie layout, matching Axes.pie defaults and the start angle the GUIs use
+PIE_START_ANGLE = 140
+PIE_LABEL_DISTANCE = 1.1
+PIE_PCT_DISTANCE = 0.6
+
+# Headroom above the tallest bar for its value label
+BAR_HEADROOM = 1.15
+
+
+class Chart:
+    """
+    A reusable Figure with its canvas and the artists that show its data.
+
+    The data artists are animated, so a full draw renders the axes, ticks
+    and titles, saves them as the background and then draws the artists
+    on top. When new data keeps the same labels and fits the current
+    limits, the artists are updated in place and only they are redrawn
+    over the saved background (blitting); anything else triggers a full
+    draw.
+    """
+
+    def __init__(self, figure: Figure, canvas: Any, fontsize: int = 12):
+        self.figure = figure
+        self.canvas = canvas
+        self.fontsize = fontsize
+        self.ax = figure.add_subplot()
+        # What the artists currently show, e.g. ('bars', labels, series); None before the first chart
+        self.layout: Optional[Tuple] = None
+        self.artists: List[Any] = []
+        self._background = None
+        self._callback_ids = [
+            canvas.mpl_connect('draw_event', self._on_draw),
+            canvas.mpl_connect('resize_event', self._on_resize),
+        ]
+
+    def _on_draw(self, event) -> None:
+        """Save the freshly drawn background and draw the animated artists over it."""
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        for artist in self.artists:
+            self.figure.draw_artist(artist)
+
+    def _on_resize(self, event) -> None:
+        """A resized canvas needs a full draw before the next blit."""
+        self._background = None
+
+    def _set_artists(self, artists: Sequence[Any]) -> None:
+        for artist in artists:
+            artist.set_animated(True)
+        self.artists = list(artists)
+
+    def _set_title(self, title: str) -> bool:
+        """Set the title; returns True if it changed, which needs a full draw."""
+        if self.ax.get_title() == title:
+            return False
+        self.ax.set_title(title, fontsize=self.fontsize + 4, fontweight='bold')
+        return True
+
+    def _set_axis_labels(self, xlabel: str, ylabel: str) -> None:
+        self.ax.set_xlabel(xlabel, fontsize=self.fontsize + 2, fontweight='bold')
+        self.ax.set_ylabel(ylabel, fontsize=self.fontsize + 2, fontweight='bold')
+        self.ax.tick_params(axis='y', labelsize=self.fontsize)
+
+    def refresh(self, full: bool = False) -> None:
+        """Show the current data, blitting the artists unless a full draw is needed."""
+        if full or self._background is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._background)
+        for artist in self.artists:
+            self.figure.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)
+
+    def close(self) -> None:
+        """Drop the figure's contents and the saved background."""
+        for callback_id in self._callback_ids:
+            self.canvas.mpl_disconnect(callback_id)
+        self.artists = []
+        self._background = None
+        self.layout = None
+        self.figure.clear()
+
+    # Chart types
+
+    def pie(self, labels: Sequence[str], sizes: Sequence[float], title: str) -> 'Chart':
+        """Draw shares of a total, e.g. expenses by category."""
+        layout = ('pie', tuple(labels))
+        full = False
+        if layout != self.layout:
+            self.ax.clear()
+            wedges, texts, autotexts = self.ax.pie(sizes, labels=labels, autopct='%1.1f%%', startangle=PIE_START_ANGLE)
+            self._set_artists([*wedges, *texts, *autotexts])
+            self.layout = layout
+            full = True
+        else:
+            total = float(sum(sizes))
+            count = len(labels)
+            wedges, texts, autotexts = self.artists[:count], self.artists[count:2 * count], self.artists[2 * count:]
+            theta = PIE_START_ANGLE
+            for wedge, text, autotext, size in zip(wedges, texts, autotexts, sizes):
+                share = size / total if total else 0.0
+                wedge.set_theta1(theta)
+                theta += 360 * share
+                wedge.set_theta2(theta)
+                middle = math.radians((wedge.theta1 + wedge.theta2) / 2)
+                x, y = math.cos(middle), math.sin(middle)
+                text.set_position((PIE_LABEL_DISTANCE * x, PIE_LABEL_DISTANCE * y))
+                text.set_horizontalalignment('left' if x > 0 else 'right')
+                autotext.set_position((PIE_PCT_DISTANCE * x, PIE_PCT_DISTANCE * y))
+                autotext.set_text(f"{share * 100:.1f}%")
+        full = self._set_title(title) or full
+        self.refresh(full)
+        return self
+
+    def bars(self, labels: Sequence[str], series: Dict[str, Sequence[float]], title: str,
+             xlabel: str = "", ylabel: str = "", styles: Optional[Dict[str, Dict[str, Any]]] = None,
+             value_labels: bool = False) -> 'Chart':
+        """
+        Draw one bar per label for each series, side by side when there are
+        several (e.g. budget vs actual), optionally with the values on top.
+        """
+        layout = ('bars', tuple(labels), tuple(series), value_labels)
+        top = max((max(values, default=0) for values in series.values()), default=0) or 1.0
+        full = False
+        if layout != self.layout:
+            self.ax.clear()
+            width = 0.8 if len(series) == 1 else 0.7 / len(series)
+            artists = []
+            for position, (name, values) in enumerate(series.items()):
+                offset = (position - (len(series) - 1) / 2) * width
+                x = [index + offset for index in range(len(labels))]
+                artists.extend(self.ax.bar(x, values, width, label=name, **(styles or {}).get(name, {})))
+            if value_labels:
+                artists.extend(
+                    self.ax.text(0, 0, "", ha='center', va='bottom', fontsize=self.fontsize - 1, fontweight='bold')
+                    for _ in range(len(artists))
+                )
+            self.ax.set_xticks(range(len(labels)))
+            self.ax.set_xticklabels(labels, rotation=30, fontsize=self.fontsize)
+            self._set_axis_labels(xlabel, ylabel)
+            if len(series) > 1:
+                self.ax.legend(fontsize=self.fontsize)
+            self.ax.grid(True, axis='y', linestyle='--', alpha=0.7)
+            self._set_artists(artists)
+            self.layout = layout
+            full = True
+        # Rescale when the data outgrows the axis or shrinks to a sliver of it
+        limit = self.ax.get_ylim()[1]
+        if full or top > limit / BAR_HEADROOM or top < limit / (4 * BAR_HEADROOM):
+            self.ax.set_ylim(0, top * BAR_HEADROOM)
+            full = True
+        heights = [value for values in series.values() for value in values]
+        bars, texts = self.artists[:len(heights)], self.artists[len(heights):]
+        for bar, height in zip(bars, heights):
+            bar.set_height(height)
+        if value_labels:
+            for bar, text, height in zip(bars, texts, heights):
+                text.set_position((bar.get_x() + bar.get_width() / 2, height + top * 0.01))
+                text.set_text(f"₹{height:.2f}")
+        full = self._set_title(title) or full
+        self.refresh(full)
+        return self
+
+    def lines(self, x: Sequence[Any], series: Dict[str, Sequence[float]], title: str,
+              xlabel: str = "", ylabel: str = "", styles: Optional[Dict[str, Dict[str, Any]]] = None,
+              date_format: Optional[str] = None) -> 'Chart':
+        """Draw one line per series over shared x values, e.g. monthly totals."""
+        layout = ('lines', tuple(x), tuple(series))
+        top = max((max(values, default=0) for values in series.values()), default=0) or 1.0
+        full = False
+        if layout != self.layout:
+            self.ax.clear()
+            lines = [self.ax.plot(x, values, label=name, **(styles or {}).get(name, {}))[0]
+                     for name, values in series.items()]
+            if date_format:
+                from matplotlib.dates import DateFormatter
+                self.ax.xaxis.set_major_formatter(DateFormatter(date_format))
+            self.ax.tick_params(axis='x', rotation=45, labelsize=self.fontsize)
+            self._set_axis_labels(xlabel, ylabel)
+            self.ax.legend(fontsize=self.fontsize)
+            self.ax.grid(True, linestyle='--', alpha=0.7)
+            self._set_artists(lines)
+            self.layout = layout
+            full = True
+        else:
+            for line, values in zip(self.artists, series.values()):
+                line.set_ydata(values)
+        limit = self.ax.get_ylim()[1]
+        if full or top > limit or top < limit / 4:
+            self.ax.relim()
+            self.ax.autoscale_view()
+            full = True
+        full = self._set_title(title) or full
+        self.refresh(full)
+        return self
+
+
+class ChartService:
+    """
+    Keeps one Chart, and so one Figure and canvas, per chart name.
+
+    Figures are created with matplotlib.figure.Figure rather than pyplot,
+    so they never enter pyplot's global registry and are freed once
+    released. Opening a chart again updates the existing artists instead
+    of building a new figure.
+    """
+
+    def __init__(self, canvas_factory: Callable[[Figure], Any], figsize: Tuple[float, float] = (16, 12),
+                 fontsize: int = 12):
+        """
+        Args:
+            canvas_factory: Builds the toolkit canvas for a new figure,
+                e.g. FigureCanvasQTAgg
+            figsize: Size of new figures in inches
+            fontsize: Tick label size; titles and axis labels are larger
+        """
+        self._canvas_factory = canvas_factory
+        self._figsize = figsize
+        self._fontsize = fontsize
+        self._charts: Dict[str, Chart] = {}
+
+    def chart(self, name: str) -> Chart:
+        """The chart registered under name, created on first use."""
+        chart = self._charts.get(name)
+        if chart is None:
+            figure = Figure(figsize=self._figsize, layout='tight')
+            chart = self._charts[name] = Chart(figure, self._canvas_factory(figure), self._fontsize)
+        return chart
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._charts
+
+    def release(self, name: Optional[str] = None) -> None:
+        """Close one chart, or all of them, so their figures can be freed."""
+        names = [name] if name is not None else list(self._charts)
+        for chart_name in names:
+            chart = self._charts.pop(chart_name, None)
+            if chart is not None:
+                chart.close()
@@ -1,75 +1,73 @@
 import csv
-import tempfile
-import os
-from typing import List
+import io
+from typing import List, TextIO
 from pathlib import Path
 from src.models.transaction import Transaction
 from src.models.category import Category
-from src.utils.encryption import get_encryption
+from src.utils.encryption import get_encryption, DEFAULT_CHUNK_SIZE
+from src.utils.atomic import AtomicWriter, FileDigest
+
+TRANSACTION_FIELDNAMES = ['id', 'date', 'amount', 'type', 'category', 'description', 'currency']
+
+def _parse_transactions(f: TextIO) -> List[Transaction]:
+    """Parse Transaction objects from an open CSV text stream."""
+    reader = csv.reader(f)
+    fieldnames = next(reader, None)
+    if fieldnames is None:
+        return []
+    return Transaction.bulk_from_rows(reader, fieldnames)
 
 def read_transactions(csv_path: str) -> List[Transaction]:
     """
     Read transactions from an encrypted CSV file and return a list of Transaction objects.
+    
+    Chunked-format files are decrypted segment by segment straight into the
+    CSV reader; legacy single-token files are decrypted into an in-memory
+    buffer. Plaintext never touches the disk.
     """
-    transactions = []
     path = Path(csv_path)
     if not path.exists():
-        return transactions
+        return []
     
-    encryption = get_encryption()
-    
-    # Check if the file is encrypted (has .enc extension)
-    if csv_path.endswith('.enc'):
-        # Decrypt the file to a temporary location
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as temp_file:
-            temp_path = temp_file.name
+    # Check if the file is encrypted (has .enc extension, also for .enc.bak backups)
+    if '.enc' in path.suffixes:
+        encryption = get_encryption()
+        if encryption.is_chunked_file(csv_path):
+            with open(csv_path, mode='rb') as raw:
+                reader = io.BufferedReader(encryption.stream_reader(raw), buffer_size=DEFAULT_CHUNK_SIZE)
+                return _parse_transactions(io.TextIOWrapper(reader, encoding='utf-8', newline=''))
         
-        try:
-            encryption.decrypt_file(csv_path, temp_path)
-            
-            # Read from the decrypted temporary file
-            with open(temp_path, mode='r', newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    transactions.append(Transaction.from_dict(row))
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-    else:
-        # Handle legacy unencrypted files
-        with open(csv_path, mode='r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                transactions.append(Transaction.from_dict(row))
+        # Legacy format: one base64-wrapped Fernet token for the whole file
+        with open(csv_path, mode='r', encoding='utf-8') as f:
+            buffer = io.StringIO(encryption.decrypt_data(f.read()), newline='')
+        return _parse_transactions(buffer)
     
-    return transactions
+    # Handle legacy unencrypted files
+    with open(csv_path, mode='r', newline='', encoding='utf-8') as f:
+        return _parse_transactions(f)
 
-def write_transactions(csv_path: str, transactions: List[Transaction]) -> None:
+def write_transactions(csv_path: str, transactions: List[Transaction]) -> FileDigest:
     """
     Write a list of Transaction objects to an encrypted CSV file.
+    
+    Rows are streamed through the chunked encryption format, so memory use
+    stays bounded by the segment size rather than the ledger size. The file
+    is replaced atomically and the previous version is kept as a .bak file.
+    
+    Returns:
+        Checksum and size of the written file
     """
     encryption = get_encryption()
     
-    # Create a temporary CSV file
-    with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv') as temp_file:
-        temp_path = temp_file.name
-    
-    try:
-        # Write to the temporary CSV file
-        with open(temp_path, mode='w', newline='', encoding='utf-8') as f:
-            fieldnames = ['id', 'date', 'amount', 'type', 'category', 'description', 'currency']
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
+    atomic = AtomicWriter(csv_path, keep_backup=True)
+    with atomic as raw:
+        writer_stream = io.BufferedWriter(encryption.stream_writer(raw), buffer_size=DEFAULT_CHUNK_SIZE)
+        with io.TextIOWrapper(writer_stream, encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=TRANSACTION_FIELDNAMES)
             writer.writeheader()
             for transaction in transactions:
                 writer.writerow(transaction.to_dict())
-        
-        # Encrypt the temporary file to the final destination
-        encryption.encrypt_file(temp_path, csv_path)
-    finally:
-        # Clean up temporary file
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
+    return atomic.digest
 
 def read_categories(csv_path: str) -> List[Category]:
     """
@@ -85,13 +83,21 @@ def read_categories(csv_path: str) -> List[Category]:
             categories.append(Category.from_dict(row))
     return categories
 
-def write_categories(csv_path: str, categories: List[Category]) -> None:
+def write_categories(csv_path: str, categories: List[Category]) -> FileDigest:
     """
     Write a list of Category objects to a CSV file.
+    
+    The file is replaced atomically and the previous version is kept as a
+    .bak file.
+    
+    Returns:
+        Checksum and size of the written file
     """
-    with open(csv_path, mode='w', newline='', encoding='utf-8') as f:
+    atomic = AtomicWriter(csv_path, mode='w', newline='', keep_backup=True)
+    with atomic as f:
         fieldnames = ['name', 'budget_limit', 'is_predefined']
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
         for category in categories:
-            writer.writerow(category.to_dict()) 
\ No newline at end of file
+            writer.writerow(category.to_dict())
+    return atomic.digest 
\ No newline at end of file
@@ -0,0 +1,123 @@
+import csv
+import io
+from datetime import datetime
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+
+# Rows parsed per chunk; each chunk is also committed as one batch
+DEFAULT_IMPORT_CHUNK_SIZE = 5000
+
+# Number of row error messages kept in an import result
+DEFAULT_MAX_IMPORT_ERRORS = 100
+
+# (row number, amount, type, category, description, date or None)
+ParsedRow = Tuple[int, float, str, str, str, Optional[datetime]]
+RowError = Tuple[int, str]
+
+
+def iter_csv_chunks(csvfile: io.TextIOWrapper, chunk_size: int) -> Iterator[Tuple[List[str], int, List[List[str]], int]]:
+    """
+    Read an open CSV file in chunks of raw rows.
+
+    Yields:
+        (header, number of the first row in the chunk, rows, bytes read so far)
+    """
+    reader = csv.reader(csvfile)
+    header = next(reader, None)
+    if header is None:
+        return
+    row_num = 2  # Row 1 is the header
+    chunk: List[List[str]] = []
+    for row in reader:
+        # Blank rows stay in the chunk so row numbers line up; the parser skips them
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield header, row_num, chunk, csvfile.buffer.tell()
+            row_num += len(chunk)
+            chunk = []
+    if chunk:
+        yield header, row_num, chunk, csvfile.buffer.tell()
+
+
+def parse_import_chunk(header: Sequence[str], first_row: int, rows: List[List[str]]) -> Tuple[List[ParsedRow], List[RowError]]:
+    """
+    Parse exported-format CSV rows (Date, Type, Category, Amount, Description).
+
+    This is a module-level function so that it can run in a worker process.
+
+    Returns:
+        (parsed rows, (row number, message) errors)
+    """
+    columns = {name: position for position, name in enumerate(header)}
+
+    def field(row: List[str], name: str, default: str = '') -> str:
+        position = columns.get(name)
+        return row[position] if position is not None and position < len(row) else default
+
+    parsed: List[ParsedRow] = []
+    errors: List[RowError] = []
+    dates = {}
+    for offset, row in enumerate(rows):
+        row_num = first_row + offset
+        if not row:
+            continue
+        try:
+            amount = float(field(row, 'Amount', '0'))
+        except ValueError as e:
+            errors.append((row_num, str(e)))
+            continue
+        transaction_type = field(row, 'Type').lower()
+        category = field(row, 'Category').strip()
+        description = field(row, 'Description').strip()
+        date_str = field(row, 'Date')
+
+        if not category:
+            errors.append((row_num, "Missing category"))
+            continue
+        if transaction_type not in ('income', 'expense', 'transfer'):
+            errors.append((row_num, f"Invalid transaction type '{transaction_type}'"))
+            continue
+
+        date = None
+        if date_str:
+            date = dates.get(date_str)
+            if date is None:
+                try:
+                    date = dates[date_str] = datetime.strptime(date_str, '%Y-%m-%d')
+                except ValueError:
+                    errors.append((row_num, f"Invalid date format '{date_str}'"))
+                    continue
+
+        parsed.append((row_num, amount, transaction_type, category, description, date))
+    return parsed, errors
+
+
+def iter_parsed_chunks(csvfile: io.TextIOWrapper, chunk_size: int, workers: int = 0
+                       ) -> Iterator[Tuple[List[ParsedRow], List[RowError], int]]:
+    """
+    Stream parsed chunks of a CSV file in file order.
+
+    With workers > 0 chunks are parsed in a process pool, keeping at most
+    two chunks per worker in flight so memory stays bounded.
+
+    Yields:
+        (parsed rows, errors, bytes read so far)
+    """
+    chunks = iter_csv_chunks(csvfile, chunk_size)
+    if workers <= 0:
+        for header, first_row, rows, position in chunks:
+            yield (*parse_import_chunk(header, first_row, rows), position)
+        return
+
+    # Imported here: multiprocessing is slow to import and only needed for parallel imports
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = []
+        for header, first_row, rows, position in chunks:
+            in_flight.append((pool.submit(parse_import_chunk, header, first_row, rows), position))
+            if len(in_flight) >= workers * 2:
+                future, done_position = in_flight.pop(0)
+                yield (*future.result(), done_position)
+        for future, done_position in in_flight:
+            yield (*future.result(), done_position)
@@ -1,12 +1,103 @@
+import io
 import os
 import base64
 import json
+import shutil
+import struct
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import BinaryIO, Dict, Any, Iterator, Optional
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.backends import default_backend
+from src.utils.atomic import AtomicWriter
+
+
+# Chunked container format
+#
+#   header:  magic (6 bytes) | version (1 byte) | chunk size (uint32)
+#   segment: ciphertext length (uint32) | final flag (1 byte) | nonce (12 bytes) | AES-GCM ciphertext + tag
+#
+# Every segment is authenticated independently with the header, its index
+# and its final flag as associated data, so segments cannot be reordered,
+# dropped or truncated without detection. Lengths are checked against the
+# header's chunk size before anything is read, since they are only
+# authenticated once the segment has been decrypted.
+STREAM_MAGIC = b"PFTENC"
+STREAM_VERSION = 1
+DEFAULT_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 16 * 1024 * 1024
+STREAM_NONCE_SIZE = 12
+STREAM_TAG_SIZE = 16
+_STREAM_HEADER = struct.Struct(">6sBI")
+_SEGMENT_HEADER = struct.Struct(">IB")
+_SEGMENT_AAD = struct.Struct(">QB")
+
+
+class _EncryptingWriter(io.RawIOBase):
+    """Writable raw stream that emits authenticated segments of the chunked format."""
+
+    def __init__(self, aead: AESGCM, dst: BinaryIO, chunk_size: int):
+        super().__init__()
+        if not 0 < chunk_size <= MAX_CHUNK_SIZE:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_CHUNK_SIZE}")
+        self._aead = aead
+        self._dst = dst
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._index = 0
+        self._header = _STREAM_HEADER.pack(STREAM_MAGIC, STREAM_VERSION, chunk_size)
+        dst.write(self._header)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer += data
+        while len(self._buffer) > self._chunk_size:
+            self._emit(bytes(self._buffer[:self._chunk_size]), final=False)
+            del self._buffer[:self._chunk_size]
+        return len(data)
+
+    def _emit(self, chunk: bytes, final: bool) -> None:
+        nonce = os.urandom(STREAM_NONCE_SIZE)
+        aad = self._header + _SEGMENT_AAD.pack(self._index, final)
+        ciphertext = self._aead.encrypt(nonce, chunk, aad)
+        self._dst.write(_SEGMENT_HEADER.pack(len(ciphertext), final) + nonce + ciphertext)
+        self._index += 1
+
+    def close(self) -> None:
+        if not self.closed:
+            # The final segment is always written, even when empty, so that
+            # truncation at a segment boundary is detectable.
+            self._emit(bytes(self._buffer), final=True)
+            self._buffer.clear()
+        super().close()
+
+
+class _DecryptingReader(io.RawIOBase):
+    """Readable raw stream over the plaintext of a chunked container."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        super().__init__()
+        self._chunks = chunks
+        self._pending = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            self._pending = next(self._chunks, None)
+            if self._pending is None:
+                self._pending = b""
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
 
 
 class DataEncryption:
@@ -42,7 +133,7 @@ class DataEncryption:
             # Ensure the directory exists
             self.key_file.parent.mkdir(parents=True, exist_ok=True)
             # Save the key
-            with open(self.key_file, 'wb') as f:
+            with AtomicWriter(self.key_file, private=True) as f:
                 f.write(key)
             return key
     
@@ -99,7 +190,160 @@ class DataEncryption:
             return decrypted_data.decode()
         except Exception as e:
             raise ValueError(f"Failed to decrypt data: {e}")
-    
+
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """
+        Encrypt raw bytes into a single Fernet token.
+
+        Args:
+            data: Bytes to encrypt
+
+        Returns:
+            Fernet token (URL-safe base64, no newlines)
+        """
+        return self.cipher_suite.encrypt(data)
+
+    def decrypt_bytes(self, token: bytes) -> bytes:
+        """
+        Decrypt a Fernet token produced by encrypt_bytes.
+
+        Args:
+            token: Fernet token
+
+        Returns:
+            Decrypted bytes
+        """
+        try:
+            return self.cipher_suite.decrypt(token)
+        except Exception as e:
+            raise ValueError(f"Failed to decrypt data: {e}")
+
+    def _stream_cipher(self) -> AESGCM:
+        """Derive the AES-256-GCM cipher used by the chunked format from the stored key."""
+        hkdf = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b"pft-chunked-stream-v1",
+            backend=default_backend()
+        )
+        return AESGCM(hkdf.derive(base64.urlsafe_b64decode(self.key)))
+
+    @staticmethod
+    def is_chunked_file(path: str) -> bool:
+        """
+        Check whether a file uses the chunked container format.
+
+        Args:
+            path: Path to the file
+
+        Returns:
+            True if the file starts with the chunked format header
+        """
+        with open(path, 'rb') as f:
+            return f.read(len(STREAM_MAGIC)) == STREAM_MAGIC
+
+    def stream_writer(self, dst: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> io.RawIOBase:
+        """
+        Open a writable stream that encrypts into dst using the chunked format.
+
+        Closing the returned stream writes the final segment; dst itself is
+        left open.
+
+        Args:
+            dst: Binary file object to write the container to
+            chunk_size: Plaintext bytes per segment, at most MAX_CHUNK_SIZE
+
+        Returns:
+            Writable raw stream
+        """
+        return _EncryptingWriter(self._stream_cipher(), dst, chunk_size)
+
+    def stream_reader(self, src: BinaryIO) -> io.RawIOBase:
+        """
+        Open a readable stream over the plaintext of a chunked container.
+
+        Args:
+            src: Binary file object positioned at the container header
+
+        Returns:
+            Readable raw stream
+        """
+        return _DecryptingReader(self.iter_decrypted_chunks(src))
+
+    def iter_decrypted_chunks(self, src: BinaryIO) -> Iterator[bytes]:
+        """
+        Yield decrypted plaintext segments from a chunked container.
+
+        Only one segment is held in memory at a time.
+
+        Args:
+            src: Binary file object positioned at the container header
+
+        Returns:
+            Iterator of plaintext chunks
+        """
+        header = src.read(_STREAM_HEADER.size)
+        if len(header) != _STREAM_HEADER.size:
+            raise ValueError("Failed to decrypt data: missing stream header")
+        magic, version, chunk_size = _STREAM_HEADER.unpack(header)
+        if magic != STREAM_MAGIC:
+            raise ValueError("Failed to decrypt data: not a chunked encrypted stream")
+        if version != STREAM_VERSION:
+            raise ValueError(f"Failed to decrypt data: unsupported stream version {version}")
+        if not 0 < chunk_size <= MAX_CHUNK_SIZE:
+            raise ValueError(f"Failed to decrypt data: invalid chunk size {chunk_size}")
+
+        aead = self._stream_cipher()
+        index = 0
+        while True:
+            segment_header = src.read(_SEGMENT_HEADER.size)
+            if len(segment_header) != _SEGMENT_HEADER.size:
+                raise ValueError("Failed to decrypt data: stream is truncated")
+            length, final = _SEGMENT_HEADER.unpack(segment_header)
+            if length > chunk_size + STREAM_TAG_SIZE:
+                raise ValueError(f"Failed to decrypt data: segment {index} is larger than the chunk size")
+            nonce = src.read(STREAM_NONCE_SIZE)
+            ciphertext = src.read(length)
+            if len(nonce) != STREAM_NONCE_SIZE or len(ciphertext) != length:
+                raise ValueError("Failed to decrypt data: stream is truncated")
+            try:
+                chunk = aead.decrypt(nonce, ciphertext, header + _SEGMENT_AAD.pack(index, final))
+            except Exception:
+                raise ValueError(f"Failed to decrypt data: segment {index} failed authentication")
+            if chunk:
+                yield chunk
+            if final:
+                if src.read(1):
+                    raise ValueError("Failed to decrypt data: unexpected data after the final segment")
+                return
+            index += 1
+
+    def encrypt_stream(self, src: BinaryIO, dst: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Encrypt a binary stream into the chunked container format.
+
+        Memory use is bounded by chunk_size regardless of input size.
+
+        Args:
+            src: Binary file object to read plaintext from
+            dst: Binary file object to write the container to
+            chunk_size: Plaintext bytes per segment
+        """
+        with self.stream_writer(dst, chunk_size) as writer:
+            shutil.copyfileobj(src, writer, chunk_size)
+
+    def decrypt_stream(self, src: BinaryIO, dst: BinaryIO) -> None:
+        """
+        Decrypt a chunked container into a binary stream.
+
+        Args:
+            src: Binary file object positioned at the container header
+            dst: Binary file object to write plaintext to
+        """
+        for chunk in self.iter_decrypted_chunks(src):
+            dst.write(chunk)
+
     def encrypt_file(self, input_file: str, output_file: str) -> None:
         """
         Encrypt a file and save to output file.
@@ -113,23 +357,31 @@ class DataEncryption:
         
         encrypted_data = self.encrypt_data(data)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with AtomicWriter(output_file, mode='w') as f:
             f.write(encrypted_data)
     
     def decrypt_file(self, input_file: str, output_file: str) -> None:
         """
         Decrypt a file and save to output file.
         
+        Both the chunked container format and the legacy single-token
+        format are accepted.
+        
         Args:
             input_file: Path to encrypted input file
             output_file: Path to output decrypted file
         """
+        if self.is_chunked_file(input_file):
+            with open(input_file, 'rb') as src, AtomicWriter(output_file) as dst:
+                self.decrypt_stream(src, dst)
+            return
+        
         with open(input_file, 'r', encoding='utf-8') as f:
             encrypted_data = f.read()
         
         decrypted_data = self.decrypt_data(encrypted_data)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with AtomicWriter(output_file, mode='w') as f:
             f.write(decrypted_data)
     
     def encrypt_json(self, data: Dict[str, Any]) -> str:
@@ -168,7 +420,7 @@ class DataEncryption:
         backup_path = Path(backup_path)
         backup_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(self.key_file, 'rb') as src, open(backup_path, 'wb') as dst:
+        with open(self.key_file, 'rb') as src, AtomicWriter(backup_path, private=True) as dst:
             dst.write(src.read())
     
     def restore_key(self, backup_path: str) -> None:
@@ -182,7 +434,7 @@ class DataEncryption:
         if not backup_path.exists():
             raise FileNotFoundError(f"Backup key file not found: {backup_path}")
         
-        with open(backup_path, 'rb') as src, open(self.key_file, 'wb') as dst:
+        with open(backup_path, 'rb') as src, AtomicWriter(self.key_file, private=True) as dst:
             dst.write(src.read())
         
         # Reload the key
@@ -4,9 +4,12 @@ CLI utility for managing encryption keys and performing encryption operations.
 """
 
 import argparse
+import csv
 import sys
 from pathlib import Path
 from src.utils.encryption import get_encryption
+from src.utils.csv_handler import TRANSACTION_FIELDNAMES
+from src.utils.partitioned_storage import open_storage
 
 
 def backup_key(args):
@@ -77,6 +80,27 @@ def decrypt_file(args):
         sys.exit(1)
 
 
+def export_ledger(args):
+    """Decrypt the whole ledger, single snapshot or partitions, into one CSV file."""
+    try:
+        if not Path(args.data_dir).is_dir():
+            print(f"✗ Data directory not found: {args.data_dir}")
+            sys.exit(1)
+        
+        transactions = open_storage(args.data_dir).load_transactions()
+        with open(args.output_file, mode='w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=TRANSACTION_FIELDNAMES)
+            writer.writeheader()
+            for transaction in transactions:
+                writer.writerow(transaction.to_dict())
+        print(f"✓ Exported {len(transactions)} transactions to: {args.output_file}")
+        print("⚠️  The exported file is not encrypted - delete it when you no longer need it!")
+        
+    except Exception as e:
+        print(f"✗ Failed to export ledger: {e}")
+        sys.exit(1)
+
+
 def show_key_info(args):
     """Show information about the encryption key."""
     try:
@@ -121,6 +145,9 @@ Examples:
   # Decrypt a file
   python src/utils/encryption_cli.py decrypt --input-file sensitive_data.txt.enc
   
+  # Export all transactions, including partitioned ledgers, to a plain CSV file
+  python src/utils/encryption_cli.py export transactions.csv --data-dir data
+  
   # Show key information
   python src/utils/encryption_cli.py info
         """
@@ -150,6 +177,12 @@ Examples:
     decrypt_parser.add_argument('--output-file', help='Output file path (default: input_file without .enc)')
     decrypt_parser.set_defaults(func=decrypt_file)
     
+    # Export command
+    export_parser = subparsers.add_parser('export', help='Decrypt all transactions into one CSV file')
+    export_parser.add_argument('output_file', help='CSV file to write')
+    export_parser.add_argument('--data-dir', default='data', help='Directory holding the ledger (default: data)')
+    export_parser.set_defaults(func=export_ledger)
+    
     # Info command
     info_parser = subparsers.add_parser('info', help='Show encryption key information')
     info_parser.set_defaults(func=show_key_info)
@@ -0,0 +1,127 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Tuple
+from src.utils.encryption import get_encryption
+
+
+JOURNAL_OPERATIONS = ("add", "edit", "delete")
+
+
+class TransactionJournal:
+    """
+    Append-only, per-record encrypted log of transaction mutations.
+
+    The journal lives next to the encrypted snapshot and holds one line per
+    append: ``<count>:<token>``, where the token is an independent Fernet
+    token wrapping ``{"records": [{"op": ..., "data": ...}, ...]}``. A batch
+    of changes is therefore one line, and a write torn by a crash loses the
+    whole batch rather than replaying part of it. Recording a change costs
+    one small encryption and one fsync'd append regardless of ledger size.
+    Replaying the journal on top of the snapshot yields the current state;
+    compaction writes a fresh snapshot and clears the journal.
+
+    Lines written before batches were framed hold a bare token wrapping a
+    single ``{"op": ..., "data": ...}`` record and are still replayed.
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the journal.
+
+        Args:
+            path: Path of the journal file
+        """
+        self.path = Path(path)
+        self.entry_count = self._count_entries()
+
+    @staticmethod
+    def _split(line: bytes) -> Tuple[int, bytes]:
+        """Record count and token of a journal line (Fernet tokens never contain ':')."""
+        count, separator, token = line.partition(b':')
+        if not separator:
+            return 1, line
+        try:
+            return int(count), token
+        except ValueError:
+            return 1, line
+
+    def _count_entries(self) -> int:
+        """Count the records currently stored in the journal file."""
+        if not self.path.exists():
+            return 0
+        with open(self.path, 'rb') as f:
+            return sum(self._split(line.strip())[0] for line in f if line.strip())
+
+    def append(self, op: str, data: Dict[str, Any]) -> None:
+        """
+        Append a single mutation record and fsync it to disk.
+
+        Args:
+            op: One of 'add', 'edit' or 'delete'
+            data: Record payload (a transaction dict, or {'id': ...} for deletes)
+        """
+        self.append_many([(op, data)])
+
+    def append_many(self, records: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Append several mutation records as one line with a single write and fsync.
+
+        Either all records are appended or, if writing fails, the journal is
+        truncated back to its previous length and the error is re-raised.
+        Replay likewise yields all of them or, after a torn write, none.
+
+        Args:
+            records: (op, data) pairs as accepted by append()
+        """
+        entries = []
+        for op, data in records:
+            if op not in JOURNAL_OPERATIONS:
+                raise ValueError(f"Unsupported journal operation '{op}'")
+            entries.append({'op': op, 'data': data})
+        if not entries:
+            return
+        payload = json.dumps({'records': entries}, ensure_ascii=False).encode('utf-8')
+        line = b'%d:' % len(entries) + get_encryption().encrypt_bytes(payload) + b'\n'
+
+        with open(self.path, 'ab') as f:
+            start = f.tell()
+            try:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            except BaseException:
+                f.truncate(start)
+                raise
+        self.entry_count += len(entries)
+
+    def replay(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Yield (op, data) pairs in the order they were appended.
+
+        A trailing line that cannot be decrypted is treated as a torn write
+        from an interrupted append and skipped with all of its records;
+        corruption anywhere else raises ValueError.
+        """
+        if not self.path.exists():
+            return
+
+        encryption = get_encryption()
+        with open(self.path, 'rb') as f:
+            lines = [line.strip() for line in f if line.strip()]
+
+        for position, line in enumerate(lines):
+            try:
+                payload = json.loads(encryption.decrypt_bytes(self._split(line)[1]).decode('utf-8'))
+            except ValueError:
+                if position == len(lines) - 1:
+                    break
+                raise ValueError(f"Corrupt journal line {position + 1} in {self.path}")
+            for record in payload.get('records', [payload]):
+                yield record['op'], record['data']
+
+    def clear(self) -> None:
+        """Remove all records, typically right after a snapshot has been written."""
+        if self.path.exists():
+            os.remove(self.path)
+        self.entry_count = 0
@@ -0,0 +1,143 @@
+import json
+from typing import IO, Any, Callable, Iterator, Optional, Tuple
+
+
+# Characters read from the file per refill
+READ_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+
+class _Buffer:
+    """Sliding window over a text file for incremental decoding."""
+
+    def __init__(self, fileobj: IO[str], read_size: int):
+        self._file = fileobj
+        self._read_size = read_size
+        self._decoder = json.JSONDecoder()
+        self.text = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Read more text, dropping what has been consumed. Returns False at EOF."""
+        if self.eof:
+            return False
+        chunk = self._file.read(self._read_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.text, self.pos)
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at EOF)."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, chars: str) -> str:
+        """Consume the next character, which must be one of chars."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise self._error(f"Expected one of {chars!r}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A number or literal ending exactly at the buffer edge may continue in the next read
+            if end == len(self.text) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_members(fileobj: IO[str], read_size: int = READ_SIZE) -> Iterator[Tuple[str, Any]]:
+    """
+    Incrementally iterate the members of a top-level JSON object.
+
+    Array members are expanded: each element is yielded as its own
+    (key, element) pair, so an array of a million records is never held in
+    memory at once. Other members are yielded whole as (key, value).
+
+    Args:
+        fileobj: Text file positioned at the start of the document
+        read_size: Characters read per refill
+
+    Yields:
+        (member key, array element or value) in document order
+
+    Raises:
+        json.JSONDecodeError: If the document is malformed
+    """
+    buffer = _Buffer(fileobj, read_size)
+    buffer.expect('{')
+    if buffer.peek() == '}':
+        buffer.pos += 1
+        return
+    while True:
+        key = buffer.value()
+        if not isinstance(key, str):
+            raise json.JSONDecodeError("Expected a member name", buffer.text, buffer.pos)
+        buffer.expect(':')
+        if buffer.peek() == '[':
+            buffer.pos += 1
+            if buffer.peek() == ']':
+                buffer.pos += 1
+            else:
+                while True:
+                    yield key, buffer.value()
+                    if buffer.expect(',]') == ']':
+                        break
+        else:
+            yield key, buffer.value()
+        if buffer.expect(',}') == '}':
+            return
+
+
+def iter_json_lines(
+    fileobj: IO[str],
+    on_error: Optional[Callable[[int, json.JSONDecodeError], None]] = None
+) -> Iterator[Tuple[int, Any]]:
+    """
+    Iterate the records of a JSON Lines file.
+
+    Args:
+        fileobj: Text file positioned at the start of the document
+        on_error: Called with (line number, error) for a line that is not
+            valid JSON, which is then skipped; without it the error is raised
+
+    Yields:
+        (line number, decoded record) for every non-blank line
+
+    Raises:
+        json.JSONDecodeError: If a line is not valid JSON and on_error is None
+    """
+    for line_num, line in enumerate(fileobj, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            if on_error is None:
+                raise
+            on_error(line_num, e)
+            continue
+        yield line_num, record
@@ -10,6 +10,7 @@ from pathlib import Path
 from datetime import datetime
 from src.utils.encryption import get_encryption
 from src.utils.csv_handler import read_transactions, write_transactions
+from src.utils.partitioned_storage import PartitionedCsvStorage, open_storage
 
 
 def backup_original_file(file_path: str) -> str:
@@ -60,16 +61,29 @@ def migrate_transactions_file(file_path: str, create_backup: bool = True) -> boo
         transactions = read_transactions(file_path)
         print(f"Found {len(transactions)} transactions")
         
-        # Create encrypted file path
-        encrypted_path = str(path.with_suffix('.csv.enc'))
-        
-        # Write transactions to encrypted file
-        print(f"Writing encrypted transactions to: {encrypted_path}")
-        write_transactions(encrypted_path, transactions)
-        
-        # Verify the encrypted file can be read
-        print("Verifying encrypted file...")
-        encrypted_transactions = read_transactions(encrypted_path)
+        storage = open_storage(str(path.parent))
+        if isinstance(storage, PartitionedCsvStorage):
+            # The ledger is already partitioned, which would ignore a new snapshot;
+            # add the transactions to the partitions instead
+            print(f"Adding encrypted transactions to: {storage.partitions_dir}")
+            by_id = {t.id: t for t in storage.load_transactions()}
+            by_id.update((t.id, t) for t in transactions)
+            storage.save_transactions(list(by_id.values()))
+            transactions = list(by_id.values())
+            
+            print("Verifying encrypted partitions...")
+            encrypted_transactions = open_storage(str(path.parent)).load_transactions()
+        else:
+            # Create encrypted file path
+            encrypted_path = str(path.with_suffix('.csv.enc'))
+            
+            # Write transactions to encrypted file
+            print(f"Writing encrypted transactions to: {encrypted_path}")
+            write_transactions(encrypted_path, transactions)
+            
+            # Verify the encrypted file can be read
+            print("Verifying encrypted file...")
+            encrypted_transactions = read_transactions(encrypted_path)
         
         if len(encrypted_transactions) == len(transactions):
             print("✓ Migration successful! Encrypted file verified.")
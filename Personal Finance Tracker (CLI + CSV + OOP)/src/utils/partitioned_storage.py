@@ -0,0 +1,268 @@
+import json
+import os
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from src.models.transaction import Transaction
+from src.utils import csv_handler
+from src.utils.atomic import AtomicWriter, DataManifest, backup_path
+from src.utils.storage import CsvStorage
+
+
+# Supported partition sizes
+PARTITIONS = ("month", "year")
+
+# Suffix of a CsvStorage snapshot kept after it was migrated into partitions
+MIGRATED_SUFFIX = ".migrated"
+
+
+class PartitionedCsvStorage(CsvStorage):
+    """
+    CSV storage split into per-month (or per-year) encrypted partitions.
+
+    Partitions live in data_dir/partitions as <period>.csv.enc, e.g.
+    2024-03.csv.enc, next to index.json, which lists the partitions and
+    their sizes, and manifest.json with their checksums. Startup only
+    decrypts the partitions of the last recent_months months; older ones
+    are read by load_older() when a query reaches back to them. Because
+    loaded partitions always cover every day from loaded_since onwards,
+    the in-memory ledger is an exact suffix of the stored one.
+
+    Mutations go to the same encrypted journal as CsvStorage. Each record
+    names the partitions it touches, so a journal left over from an earlier
+    session can be applied to partitions that are not loaded. Compaction
+    rewrites the loaded partitions plus any such journal-touched ones.
+
+    A ledger stored by CsvStorage in the same data_dir is migrated into
+    partitions on first load. Its snapshot, and the .bak copy, are then
+    renamed with a .migrated suffix rather than deleted, so they stay
+    available as a backup.
+    """
+
+    def __init__(self, data_dir: str, partition: str = "month", recent_months: int = 3):
+        """
+        Args:
+            data_dir: Directory holding the ledger
+            partition: 'month' or 'year'
+            recent_months: Months (counting the current one) loaded at startup
+        """
+        if partition not in PARTITIONS:
+            raise ValueError("partition must be 'month' or 'year'")
+        if recent_months < 1:
+            raise ValueError("recent_months must be at least 1")
+        super().__init__(data_dir)
+        self.partition = partition
+        self.recent_months = recent_months
+        self.partitions_dir = os.path.join(data_dir, "partitions")
+        self.index_path = os.path.join(self.partitions_dir, "index.json")
+        os.makedirs(self.partitions_dir, exist_ok=True)
+        self.partition_manifest = DataManifest(self.partitions_dir)
+        self.loaded_since: Optional[date] = None
+
+        # Partition key -> {'count': n}, as stored in index.json
+        self._index: Dict[str, Dict] = {}
+        # Stored partition of every loaded transaction, to know which file an edit or delete touches
+        self._locations: Dict[str, str] = {}
+        # Outcome of journal records from earlier sessions (None for deletes) and the partitions they touch
+        self._journal_state: Dict[str, Optional[Transaction]] = {}
+        self._dirty: Set[str] = set()
+
+    # Partition keys
+
+    def partition_key(self, day: date) -> str:
+        """Key of the partition holding a date, e.g. '2024-03' or '2024'."""
+        if self.partition == "year":
+            return f"{day.year:04d}"
+        return f"{day.year:04d}-{day.month:02d}"
+
+    @staticmethod
+    def _key_start(key: str) -> date:
+        """First day covered by a partition key."""
+        if len(key) == 4:
+            return date(int(key), 1, 1)
+        return date(int(key[:4]), int(key[5:7]), 1)
+
+    def _key_end(self, key: str) -> date:
+        """Last day covered by a partition key."""
+        start = self._key_start(key)
+        if self.partition == "year":
+            return date(start.year, 12, 31)
+        following = date(start.year + (start.month == 12), start.month % 12 + 1, 1)
+        return date.fromordinal(following.toordinal() - 1)
+
+    def _partition_path(self, key: str) -> str:
+        return os.path.join(self.partitions_dir, f"{key}.csv.enc")
+
+    def _is_loaded(self, key: str) -> bool:
+        return self.loaded_since is None or self._key_start(key) >= self.loaded_since
+
+    def _known_keys(self) -> Set[str]:
+        """Every partition that holds transactions, on disk or only in the journal."""
+        keys = set(self._index)
+        keys.update(self.partition_key(t.date) for t in self._journal_state.values() if t is not None)
+        return keys
+
+    # Index
+
+    def _read_index(self) -> Optional[Dict[str, Dict]]:
+        """Partition entries from index.json, or None if the ledger is not partitioned yet."""
+        if not os.path.exists(self.index_path):
+            return None
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('partition') != self.partition:
+            raise ValueError(f"Ledger in {self.partitions_dir} is partitioned by {index.get('partition')}, not {self.partition}")
+        return index.get('partitions', {})
+
+    def _write_index(self) -> None:
+        with AtomicWriter(self.index_path, mode='w') as f:
+            json.dump({'version': 1, 'partition': self.partition, 'partitions': self._index}, f, indent=2, sort_keys=True)
+
+    # Loading
+
+    def _read_partition(self, key: str) -> List[Transaction]:
+        """Stored transactions of a partition with the replayed journal applied."""
+        path = self.partition_manifest.select(self._partition_path(key))
+        stored = csv_handler.read_transactions(str(path)) if path is not None else []
+        if not self._journal_state:
+            return stored
+        transactions = [t for t in stored if t.id not in self._journal_state]
+        transactions.extend(
+            t for t in self._journal_state.values()
+            if t is not None and self.partition_key(t.date) == key
+        )
+        return transactions
+
+    def _load_keys(self, keys: Iterable[str]) -> List[Transaction]:
+        """Read partitions and remember where each transaction is stored."""
+        transactions = []
+        for key in sorted(keys):
+            partition = self._read_partition(key)
+            for transaction in partition:
+                self._locations[transaction.id] = key
+            transactions.extend(partition)
+        return transactions
+
+    def _replay_partitioned_journal(self) -> None:
+        """Collect the outcome of journal records left by an earlier session."""
+        for op, data in self.journal.replay():
+            self._dirty.update(data.pop('partitions', ()))
+            self._journal_state[data['id']] = None if op == "delete" else Transaction.from_dict(data)
+
+    def _migrate(self) -> List[Transaction]:
+        """Move a ledger stored by CsvStorage into partitions, keeping its snapshot as a backup."""
+        transactions = CsvStorage.load_transactions(self)
+        self.loaded_since = None
+        self.save_transactions(transactions)
+        for path in (self.snapshot_path, str(backup_path(self.snapshot_path))):
+            if os.path.exists(path):
+                os.replace(path, path + MIGRATED_SUFFIX)
+        return transactions
+
+    def _recent_start(self) -> date:
+        """First day of the partition holding the oldest eagerly loaded month."""
+        today = date.today()
+        months = today.year * 12 + today.month - self.recent_months
+        return self._key_start(self.partition_key(date(months // 12, months % 12 + 1, 1)))
+
+    def load_recent(self) -> List[Transaction]:
+        index = self._read_index()
+        if index is None:
+            return self._migrate()
+
+        self._index = index
+        self._locations = {}
+        self._replay_partitioned_journal()
+        self.loaded_since = self._recent_start()
+        keys = self._known_keys()
+        transactions = self._load_keys(k for k in keys if self._is_loaded(k))
+        if not any(self._key_start(k) < self.loaded_since for k in keys):
+            self.loaded_since = None
+        return transactions
+
+    def load_older(self, since: Optional[date] = None) -> List[Transaction]:
+        if self.loaded_since is None or (since is not None and since >= self.loaded_since):
+            return []
+        keys = self._known_keys()
+        wanted = [
+            k for k in keys
+            if not self._is_loaded(k) and (since is None or self._key_end(k) >= since)
+        ]
+        transactions = self._load_keys(wanted)
+        self.loaded_since = None if since is None else self._key_start(self.partition_key(since))
+        if self.loaded_since is not None and not any(self._key_start(k) < self.loaded_since for k in keys):
+            self.loaded_since = None
+        return transactions
+
+    def load_transactions(self) -> List[Transaction]:
+        """Return every stored transaction, loading all partitions."""
+        transactions = self.load_recent()
+        return transactions + self.load_older(None)
+
+    # Writing
+
+    def _journal_record(self, op: str, transaction: Transaction) -> Tuple[str, Dict]:
+        op, data = super()._journal_record(op, transaction)
+        partitions = {self._locations.get(transaction.id)}
+        if op != "delete":
+            partitions.add(self.partition_key(transaction.date))
+        partitions.discard(None)
+        return op, {**data, 'partitions': sorted(partitions)}
+
+    def record_changes(self, changes: Iterable[Tuple[str, Transaction]]) -> None:
+        changes = list(changes)
+        records = [self._journal_record(op, t) for op, t in changes]
+        self.journal.append_many(records)
+        for (op, transaction), (_, data) in zip(changes, records):
+            self._dirty.update(data['partitions'])
+            if op == "delete":
+                self._locations.pop(transaction.id, None)
+            else:
+                self._locations[transaction.id] = self.partition_key(transaction.date)
+
+    def record_change(self, op: str, transaction: Transaction) -> None:
+        self.record_changes([(op, transaction)])
+
+    def save_transactions(self, transactions: Iterable[Transaction]) -> None:
+        """
+        Rewrite the loaded partitions from transactions, which must be
+        every transaction dated on or after loaded_since. Unloaded
+        partitions are kept, except that those touched by the journal are
+        rewritten with it applied. The journal is then cleared.
+        """
+        groups: Dict[str, List[Transaction]] = {}
+        for transaction in transactions:
+            groups.setdefault(self.partition_key(transaction.date), []).append(transaction)
+
+        keys = set(groups) | self._dirty | {k for k in self._known_keys() if self._is_loaded(k)}
+        for key in sorted(keys):
+            contents = groups.get(key, []) if self._is_loaded(key) else self._read_partition(key)
+            path = self._partition_path(key)
+            if contents:
+                digest = csv_handler.write_transactions(path, contents)
+                self.partition_manifest.record(path, digest)
+                self._index[key] = {'count': len(contents)}
+            else:
+                for stale in (path, str(backup_path(path))):
+                    if os.path.exists(stale):
+                        os.remove(stale)
+                self._index.pop(key, None)
+        self._write_index()
+        self.journal.clear()
+
+        self._journal_state = {}
+        self._dirty = set()
+        self._locations = {t.id: key for key, group in groups.items() for t in group}
+
+
+def open_storage(data_dir: str) -> CsvStorage:
+    """
+    Storage for the ledger already in data_dir: PartitionedCsvStorage with
+    the stored partition size if it is partitioned, else CsvStorage.
+    """
+    index_path = os.path.join(data_dir, "partitions", "index.json")
+    if not os.path.exists(index_path):
+        return CsvStorage(data_dir)
+    with open(index_path, 'r', encoding='utf-8') as f:
+        partition = json.load(f).get('partition', "month")
+    return PartitionedCsvStorage(data_dir, partition=partition)
@@ -0,0 +1,181 @@
+import sqlite3
+import threading
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.models.transaction import Transaction
+from src.models.category import Category
+from src.utils.encryption import get_encryption
+from src.utils.storage import StorageBackend
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transactions (
+    id TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    type TEXT NOT NULL,
+    category TEXT NOT NULL,
+    currency TEXT NOT NULL,
+    amount REAL,
+    amount_enc BLOB,
+    description_enc BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_transactions_date ON transactions(date);
+CREATE INDEX IF NOT EXISTS idx_transactions_category ON transactions(category);
+CREATE INDEX IF NOT EXISTS idx_transactions_type ON transactions(type);
+CREATE TABLE IF NOT EXISTS categories (
+    name TEXT PRIMARY KEY,
+    budget_limit REAL,
+    is_predefined INTEGER NOT NULL
+);
+"""
+
+
+class SqliteStorage(StorageBackend):
+    """
+    SQLite storage backend with per-row encrypted columns.
+
+    Each mutation is a single-row statement, so nothing is rewritten
+    wholesale. The database runs in WAL mode with indexes on date, category
+    and type. Descriptions are always stored as Fernet tokens under the
+    application key; amounts are encrypted too unless encrypt_amounts is
+    False, in which case they are kept in a plain REAL column and summaries
+    are computed by SQLite with GROUP BY.
+    """
+
+    def __init__(self, db_path: str, encrypt_amounts: bool = True):
+        """
+        Open (and if needed create) the database.
+
+        Args:
+            db_path: Path of the SQLite database file
+            encrypt_amounts: Encrypt the amount column; disables SQL summaries
+        """
+        self.db_path = db_path
+        self.encrypt_amounts = encrypt_amounts
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def _encode(self, transaction: Transaction) -> Tuple:
+        """Row values for a transaction, encrypting the sensitive columns."""
+        encryption = get_encryption()
+        if self.encrypt_amounts:
+            amount, amount_enc = None, encryption.encrypt_bytes(repr(transaction.amount).encode('ascii'))
+        else:
+            amount, amount_enc = transaction.amount, None
+        return (
+            transaction.id,
+            transaction.date.isoformat(),
+            transaction.type,
+            transaction.category,
+            transaction.currency,
+            amount,
+            amount_enc,
+            encryption.encrypt_bytes(transaction.description.encode('utf-8')),
+        )
+
+    def _decode(self, row: Tuple) -> Transaction:
+        """Build a transaction from a stored row."""
+        id, date_text, type, category, currency, amount, amount_enc, description_enc = row
+        encryption = get_encryption()
+        if amount_enc is not None:
+            amount = float(encryption.decrypt_bytes(amount_enc))
+        return Transaction(
+            amount=amount,
+            type=type,
+            category=category,
+            description=encryption.decrypt_bytes(description_enc).decode('utf-8'),
+            date=date.fromisoformat(date_text),
+            currency=currency,
+            id=id,
+        )
+
+    def load_transactions(self) -> List[Transaction]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, date, type, category, currency, amount, amount_enc, description_enc FROM transactions"
+            ).fetchall()
+        return [self._decode(row) for row in rows]
+
+    def _statement(self, op: str, transaction: Transaction) -> Tuple[str, Tuple]:
+        """SQL statement and parameters that persist one mutation."""
+        if op == "delete":
+            return "DELETE FROM transactions WHERE id = ?", (transaction.id,)
+        if op in ("add", "edit"):
+            return "INSERT OR REPLACE INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?, ?)", self._encode(transaction)
+        raise ValueError(f"Unsupported storage operation '{op}'")
+
+    def record_change(self, op: str, transaction: Transaction) -> None:
+        self.record_changes([(op, transaction)])
+
+    def record_changes(self, changes: Iterable[Tuple[str, Transaction]]) -> None:
+        statements = [self._statement(op, t) for op, t in changes]
+        with self._lock, self._conn:
+            for statement, values in statements:
+                self._conn.execute(statement, values)
+
+    def save_transactions(self, transactions: Iterable[Transaction]) -> None:
+        rows = [self._encode(t) for t in transactions]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM transactions")
+            self._conn.executemany("INSERT INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def load_categories(self) -> List[Category]:
+        with self._lock:
+            rows = self._conn.execute("SELECT name, budget_limit, is_predefined FROM categories").fetchall()
+        return [Category(name, budget_limit, bool(is_predefined)) for name, budget_limit, is_predefined in rows]
+
+    def save_categories(self, categories: Iterable[Category]) -> None:
+        rows = [(c.name, c.budget_limit, int(c.is_predefined)) for c in categories]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM categories")
+            self._conn.executemany("INSERT INTO categories VALUES (?, ?, ?)", rows)
+
+    def summarize(self, start_date: Optional[date] = None, end_date: Optional[date] = None) -> Optional[Dict]:
+        """
+        Compute a summary with a single GROUP BY over the date index.
+
+        Returns None while amounts are encrypted, since SQL cannot sum them.
+        """
+        if self.encrypt_amounts:
+            return None
+
+        conditions, params = [], []
+        if start_date:
+            conditions.append("date >= ?")
+            params.append(start_date.isoformat())
+        if end_date:
+            conditions.append("date <= ?")
+            params.append(end_date.isoformat())
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT category, type, SUM(amount), COUNT(*) FROM transactions {where} GROUP BY category, type",
+                params,
+            ).fetchall()
+
+        totals = {'income': 0.0, 'expense': 0.0, 'transfer': 0.0}
+        category_breakdown = defaultdict(lambda: {'income': 0.0, 'expense': 0.0, 'transfer': 0.0})
+        transaction_count = 0
+        for category, type_name, total, count in rows:
+            totals[type_name] += total
+            category_breakdown[category][type_name] += total
+            transaction_count += count
+
+        return {
+            'total_income': totals['income'],
+            'total_expenses': totals['expense'],
+            'total_transfers': totals['transfer'],
+            'net_amount': totals['income'] - totals['expense'],
+            'category_breakdown': dict(category_breakdown),
+            'transaction_count': transaction_count
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
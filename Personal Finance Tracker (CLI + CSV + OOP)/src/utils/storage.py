@@ -0,0 +1,185 @@
+import os
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.models.transaction import Transaction
+from src.models.category import Category
+from src.utils import csv_handler
+from src.utils.atomic import DataManifest
+from src.utils.journal import TransactionJournal
+
+
+class StorageBackend(ABC):
+    """
+    Persistence interface used by BudgetManager.
+
+    A backend loads the full ledger at startup, persists individual
+    mutations as they happen and can replace the stored ledger wholesale.
+    Backends that can aggregate without materializing transactions
+    override summarize().
+    """
+
+    # Transactions dated on or after this day are loaded; None once the whole
+    # ledger is in memory. Backends that load lazily lower it in load_older().
+    loaded_since: Optional[date] = None
+
+    @abstractmethod
+    def load_transactions(self) -> List[Transaction]:
+        """Return every stored transaction."""
+
+    def load_recent(self) -> List[Transaction]:
+        """
+        Return the transactions to have in memory at startup.
+        
+        Backends that load lazily return only recent ones and set
+        loaded_since; the default loads everything.
+        """
+        return self.load_transactions()
+    
+    def load_older(self, since: Optional[date] = None) -> List[Transaction]:
+        """
+        Load the not yet loaded transactions dated on or after since (all of
+        them when since is None) and lower loaded_since accordingly.
+        """
+        return []
+    
+    @abstractmethod
+    def record_change(self, op: str, transaction: Transaction) -> None:
+        """
+        Persist a single mutation.
+
+        Args:
+            op: One of 'add', 'edit' or 'delete'
+            transaction: The transaction after the change (before it, for deletes)
+        """
+
+    def record_changes(self, changes: Iterable[Tuple[str, Transaction]]) -> None:
+        """
+        Persist several mutations as one unit.
+
+        Backends override this to commit the whole batch with a single
+        write; the default records the changes one by one.
+        """
+        for op, transaction in changes:
+            self.record_change(op, transaction)
+
+    @abstractmethod
+    def save_transactions(self, transactions: Iterable[Transaction]) -> None:
+        """Replace the stored ledger with the given transactions."""
+
+    @abstractmethod
+    def load_categories(self) -> List[Category]:
+        """Return the stored categories."""
+
+    @abstractmethod
+    def save_categories(self, categories: Iterable[Category]) -> None:
+        """Replace the stored categories."""
+
+    @property
+    def pending_changes(self) -> int:
+        """Number of recorded changes not yet folded into a full snapshot."""
+        return 0
+
+    def summarize(self, start_date: Optional[date] = None, end_date: Optional[date] = None) -> Optional[Dict]:
+        """
+        Compute a summary with the same structure as BudgetManager.get_summary,
+        or return None to leave it to the manager's own aggregation.
+        """
+        return None
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class CsvStorage(StorageBackend):
+    """
+    The default backend: an encrypted CSV snapshot plus a mutation journal.
+
+    Files live in data_dir as transactions.csv.enc, transactions.journal and
+    categories.csv. A plaintext transactions.csv left by older versions is
+    migrated to the encrypted snapshot on first load.
+    
+    Snapshots and categories are replaced atomically, keep their previous
+    generation as .bak and are checksummed in manifest.json. Loading falls
+    back to the .bak copy when the current one fails verification; because
+    the journal is only cleared after the manifest is updated, replaying it
+    over the backup still yields the latest state.
+    """
+
+    def __init__(self, data_dir: str):
+        self.data_dir = data_dir
+        os.makedirs(data_dir, exist_ok=True)
+        self.snapshot_path = os.path.join(data_dir, "transactions.csv.enc")
+        self.categories_path = os.path.join(data_dir, "categories.csv")
+        self.journal = TransactionJournal(os.path.join(data_dir, "transactions.journal"))
+        self.manifest = DataManifest(data_dir)
+
+    @property
+    def pending_changes(self) -> int:
+        return self.journal.entry_count
+
+    def load_transactions(self) -> List[Transaction]:
+        unencrypted_path = os.path.join(self.data_dir, "transactions.csv")
+
+        snapshot = self.manifest.select(self.snapshot_path)
+        if snapshot is not None:
+            transactions = csv_handler.read_transactions(str(snapshot))
+        elif os.path.exists(unencrypted_path):
+            # Migrate unencrypted file to encrypted
+            transactions = csv_handler.read_transactions(unencrypted_path)
+            self._write_snapshot(transactions)
+            os.remove(unencrypted_path)
+        else:
+            transactions = []
+
+        return self._replay_journal(transactions)
+
+    def _replay_journal(self, transactions: List[Transaction]) -> List[Transaction]:
+        """Apply journal records written since the last snapshot.
+
+        Replay is idempotent: adds and edits upsert by id and deletes ignore
+        missing ids, so a journal left behind by an interrupted compaction
+        can safely be replayed over the newer snapshot.
+        """
+        if self.journal.entry_count == 0:
+            return transactions
+
+        by_id = {t.id: t for t in transactions}
+        for op, data in self.journal.replay():
+            if op == "delete":
+                by_id.pop(data['id'], None)
+            else:
+                transaction = Transaction.from_dict(data)
+                by_id[transaction.id] = transaction
+        return list(by_id.values())
+
+    @staticmethod
+    def _journal_record(op: str, transaction: Transaction) -> Tuple[str, Dict]:
+        """Journal payload for a mutation."""
+        return op, ({'id': transaction.id} if op == "delete" else transaction.to_dict())
+
+    def record_change(self, op: str, transaction: Transaction) -> None:
+        self.journal.append(*self._journal_record(op, transaction))
+
+    def record_changes(self, changes: Iterable[Tuple[str, Transaction]]) -> None:
+        self.journal.append_many(self._journal_record(op, t) for op, t in changes)
+
+    def _write_snapshot(self, transactions: Iterable[Transaction]) -> None:
+        """Atomically write the snapshot and record its checksum."""
+        digest = csv_handler.write_transactions(self.snapshot_path, transactions)
+        self.manifest.record(self.snapshot_path, digest)
+
+    def save_transactions(self, transactions: Iterable[Transaction]) -> None:
+        self._write_snapshot(transactions)
+        self.journal.clear()
+
+    def load_categories(self) -> List[Category]:
+        categories = self.manifest.select(self.categories_path)
+        if categories is None:
+            return []
+        return csv_handler.read_categories(str(categories))
+
+    def save_categories(self, categories: Iterable[Category]) -> None:
+        digest = csv_handler.write_categories(self.categories_path, list(categories))
+        self.manifest.record(self.categories_path, digest)
@@ -0,0 +1,80 @@
+import os
+import tempfile
+from datetime import date
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from src.models.budget_manager import BudgetManager
+from src.utils import arrow_io
+
+
+def _ledger(tmpdir):
+    manager = BudgetManager(data_dir=os.path.join(tmpdir, 'source'))
+    manager.add_category('Pets', 25)
+    for i in range(24):
+        manager.add_transaction(10.1 + i, 'expense' if i % 3 else 'income', 'Pets' if i % 2 else 'Food',
+                                f'Item {i}', date(2023, 1 + i % 12, 1 + i))
+    return manager
+
+
+def _rows(manager):
+    return sorted((t.id, t.amount, t.type, t.category, t.description, t.date) for t in manager.transactions)
+
+
+@pytest.mark.parametrize("format", ["parquet", "arrow"])
+def test_round_trip_keeps_types_and_categories(format):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = _ledger(tmpdir)
+        path = source.export_data(format, os.path.join(tmpdir, 'export' + arrow_io.EXTENSIONS[format]))
+
+        table = arrow_io._read_table(path, format)
+        assert table.schema.field('date').type == pa.date32()
+        assert table.schema.field('amount').type == pa.decimal128(18, 2)
+        assert pa.types.is_dictionary(table.schema.field('category').type)
+
+        target = BudgetManager(data_dir=os.path.join(tmpdir, 'target'))
+        result = target.import_data(path)
+        assert result['imported_transactions'] == 24
+        assert target.categories['Pets'].budget_limit == 25
+        assert _rows(target) == _rows(source)
+
+        again = target.import_data(path)
+        assert again['imported_transactions'] == 0
+        assert len(again['duplicates']) == 24
+        assert again['success']
+
+
+def test_partitioned_export_prunes_by_date_range():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = _ledger(tmpdir)
+        path = source.export_data('parquet', os.path.join(tmpdir, 'partitions'), partition='month')
+        assert len(os.listdir(path)) == 12
+        assert arrow_io._files(path, 'parquet', date(2023, 3, 15), date(2023, 4, 30)) == [
+            os.path.join(path, 'transactions-2023-03.parquet'),
+            os.path.join(path, 'transactions-2023-04.parquet'),
+        ]
+
+        target = BudgetManager(data_dir=os.path.join(tmpdir, 'target'))
+        result = target.import_data(path, date_from=date(2023, 3, 15), date_to=date(2023, 4, 30))
+        expected = [t for t in source.transactions if date(2023, 3, 15) <= t.date <= date(2023, 4, 30)]
+        assert result['imported_transactions'] == len(expected)
+        assert {t.id for t in target.transactions} == {t.id for t in expected}
+        assert target.import_data(path)['imported_transactions'] == 24 - len(expected)
+
+
+def test_directory_of_feather_files_is_imported_as_arrow():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        source = _ledger(tmpdir)
+        path = source.export_data('arrow', os.path.join(tmpdir, 'partitions'), partition='year')
+        for name in os.listdir(path):
+            os.rename(os.path.join(path, name), os.path.join(path, name.replace('.arrow', '.feather')))
+        assert arrow_io.detect_format(path) == 'arrow'
+
+        target = BudgetManager(data_dir=os.path.join(tmpdir, 'target'))
+        assert target.import_data(path)['imported_transactions'] == 24
+        assert _rows(target) == _rows(source)
+
+        with pytest.raises(ValueError, match="No parquet files"):
+            target.import_data(path, format='parquet')
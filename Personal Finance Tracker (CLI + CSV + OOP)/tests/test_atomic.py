@@ -0,0 +1,101 @@
+import os
+from datetime import datetime
+import pytest
+from src.models.budget_manager import BudgetManager
+from src.utils import csv_handler
+from src.utils.atomic import AtomicWriter, DataManifest, backup_path, file_digest
+
+
+def test_failed_write_leaves_target_untouched(tmp_path):
+    target = tmp_path / 'data.bin'
+    target.write_bytes(b'original')
+    with pytest.raises(RuntimeError):
+        with AtomicWriter(target) as f:
+            f.write(b'partial')
+            raise RuntimeError("crash")
+    assert target.read_bytes() == b'original'
+    assert list(tmp_path.iterdir()) == [target]
+
+def test_replace_keeps_backup_and_reports_digest(tmp_path):
+    target = tmp_path / 'data.csv'
+    target.write_text('old')
+    writer = AtomicWriter(target, mode='w', keep_backup=True)
+    with writer as f:
+        f.write('new')
+    assert target.read_text() == 'new'
+    assert backup_path(target).read_text() == 'old'
+    assert writer.digest == file_digest(target)
+
+@pytest.mark.skipif(os.name != 'posix', reason="file modes are POSIX")
+def test_replacement_keeps_mode_and_private_files_stay_owner_only(tmp_path):
+    created = tmp_path / 'export.json'
+    with AtomicWriter(created, mode='w') as f:
+        f.write('{}')
+    umask = os.umask(0)
+    os.umask(umask)
+    assert created.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    created.chmod(0o640)
+    with AtomicWriter(created, mode='w') as f:
+        f.write('[]')
+    assert created.stat().st_mode & 0o777 == 0o640
+
+    key = tmp_path / 'secret.key'
+    key.write_bytes(b'old')
+    key.chmod(0o644)
+    with AtomicWriter(key, private=True) as f:
+        f.write(b'key')
+    assert key.stat().st_mode & 0o777 == 0o600
+
+    # The umask in effect when the file is written applies, not one read earlier
+    previous = os.umask(0o027)
+    try:
+        with AtomicWriter(tmp_path / 'later.json', mode='w') as f:
+            f.write('{}')
+    finally:
+        os.umask(previous)
+    assert (tmp_path / 'later.json').stat().st_mode & 0o777 == 0o640
+    assert not list(tmp_path.glob('.*.tmp'))
+
+def _ledger(tmpdir):
+    manager = BudgetManager(data_dir=tmpdir)
+    first = manager.add_transaction(100, 'expense', 'Food', 'Lunch', datetime(2023, 1, 1))
+    manager.save_transactions()
+    second = manager.add_transaction(200, 'income', 'Salary', 'Pay', datetime(2023, 1, 2))
+    manager.save_transactions()
+    third = manager.add_transaction(30, 'expense', 'Food', 'Snack', datetime(2023, 1, 3))
+    return manager, {first.id, second.id, third.id}
+
+def test_corrupt_snapshot_falls_back_to_backup(tmp_path):
+    manager, ids = _ledger(str(tmp_path))
+    snapshot = tmp_path / 'transactions.csv.enc'
+    data = bytearray(snapshot.read_bytes())
+    data[-5] ^= 0xFF
+    snapshot.write_bytes(bytes(data))
+    # The backup plus the journal are one save behind, so only the last
+    # snapshot's contents are missing
+    reloaded = BudgetManager(data_dir=str(tmp_path))
+    assert {t.id for t in reloaded.transactions} < ids
+
+def test_crash_before_manifest_update_recovers_full_state(tmp_path):
+    manager, ids = _ledger(str(tmp_path))
+    # Snapshot replaced, but the manifest and journal were never updated
+    csv_handler.write_transactions(str(tmp_path / 'transactions.csv.enc'), manager.transactions)
+    assert DataManifest(tmp_path).verify(tmp_path / 'transactions.csv.enc') is False
+    assert {t.id for t in BudgetManager(data_dir=str(tmp_path)).transactions} == ids
+
+def test_unverifiable_copies_raise(tmp_path):
+    _ledger(str(tmp_path))
+    for path in (tmp_path / 'transactions.csv.enc', backup_path(tmp_path / 'transactions.csv.enc')):
+        path.write_bytes(b'garbage')
+    with pytest.raises(ValueError, match="checksum"):
+        BudgetManager(data_dir=str(tmp_path))
+
+def test_categories_are_checksummed(tmp_path):
+    manager = BudgetManager(data_dir=str(tmp_path))
+    manager.add_category('Travel', 500)
+    manager.add_category('Pets')
+    assert DataManifest(tmp_path).verify(tmp_path / 'categories.csv') is True
+    (tmp_path / 'categories.csv').write_text('name,budget_limit,is_predefined\ntorn')
+    reloaded = BudgetManager(data_dir=str(tmp_path))
+    assert 'Travel' in reloaded.categories
@@ -1,7 +1,7 @@
 import pytest
 import os
 import tempfile
-from datetime import datetime
+from datetime import date, datetime
 from src.models.budget_manager import BudgetManager
 
 def test_add_and_get_transaction():
@@ -47,4 +47,422 @@ def test_summary_and_alerts():
         summary = manager.get_monthly_summary(2023, 1)
         assert summary['total_expenses'] == 110
         alerts = manager.check_budget_alerts(2023, 1)
-        assert any('exceeded' in a for a in alerts) 
\ No newline at end of file
+        assert any('exceeded' in a for a in alerts) 
+
+def test_id_index_stays_consistent_through_deletes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        txns = [manager.add_transaction(10 + i, 'expense', 'Food') for i in range(10)]
+        for t in txns[::3]:
+            assert manager.delete_transaction(t.id)
+        assert not manager.delete_transaction(txns[0].id)
+        remaining = [t for i, t in enumerate(txns) if i % 3]
+        assert len(manager.transactions) == len(remaining)
+        for t in remaining:
+            assert manager.get_transaction_by_id(t.id) is t
+        for t in txns[::3]:
+            assert manager.get_transaction_by_id(t.id) is None
+        reloaded = BudgetManager(data_dir=tmpdir)
+        assert {t.id for t in reloaded.transactions} == {t.id for t in remaining}
+        assert all(reloaded.get_transaction_by_id(t.id).amount == t.amount for t in remaining)
+
+def test_deletes_keep_insertion_order():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        txns = [manager.add_transaction(10 + i, 'expense', 'Food', date=datetime(2023, 1, 5 - i)) for i in range(5)]
+        manager.delete_transaction(txns[2].id)
+        expected = [txns[0].id, txns[1].id, txns[3].id, txns[4].id]
+        assert [t.id for t in manager.transactions] == expected
+        assert all(manager.get_transaction_by_id(t.id) is t for t in manager.transactions)
+        assert manager.get_latest_date() == date(2023, 1, 5)
+
+        # A rolled back delete returns to its old position
+        with pytest.raises(RuntimeError):
+            with manager.batch():
+                manager.delete_transaction(txns[1].id)
+                raise RuntimeError("abandon the batch")
+        assert [t.id for t in manager.transactions] == expected
+        assert manager.get_transaction_by_id(txns[3].id) is txns[3]
+
+        manager.save_transactions()
+        assert [t.id for t in BudgetManager(data_dir=tmpdir).transactions] == expected
+
+def test_clear_transactions_resets_index():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        t = manager.add_transaction(100, 'expense', 'Food')
+        manager.clear_transactions()
+        assert manager.get_transaction_by_id(t.id) is None
+        assert BudgetManager(data_dir=tmpdir).transactions == []
+
+def test_json_import_skips_existing_ids_as_duplicates():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        t = manager.add_transaction(100, 'expense', 'Food', date=datetime(2023, 1, 1))
+        for format in ('json', 'jsonl'):
+            path = manager.export_data(format, os.path.join(tmpdir, f'export.{format}'))
+            result = manager.import_data(path)
+            assert result['imported_transactions'] == 0
+            assert result['duplicates'] == [t.id]
+            assert result['errors'] == []
+            assert result['success']
+        assert len(manager.transactions) == 1
+        assert manager.get_transaction_by_id(t.id) is t
+
+        result = manager.import_data(path, duplicates="allow")
+        assert len(result['errors']) == 1
+        assert len(manager.transactions) == 1
+
+def test_date_range_queries_match_full_scan():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        txns = [
+            manager.add_transaction(10 + i, 'expense' if i % 2 else 'income', 'Food', date=datetime(2023, 1 + i % 12, 1 + i % 28))
+            for i in range(40)
+        ]
+        manager.edit_transaction(txns[0].id, date=datetime(2024, 6, 15))
+        manager.delete_transaction(txns[1].id)
+
+        from datetime import date
+        date_from, date_to = date(2023, 3, 1), date(2023, 8, 31)
+        expected = {t.id for t in manager.transactions if date_from <= t.date <= date_to}
+        result = manager.get_transactions(date_from=date_from, date_to=date_to)
+        assert {t.id for t in result} == expected
+        assert [t.date for t in result] == sorted((t.date for t in result), reverse=True)
+        assert manager.get_transactions(date_from=date(2024, 6, 15))[0].id == txns[0].id
+
+        summary = manager.get_monthly_summary(2023, 3)
+        march = [t for t in manager.transactions if (t.date.year, t.date.month) == (2023, 3)]
+        assert summary['transaction_count'] == len(march)
+        assert summary['total_expenses'] == sum(t.amount for t in march if t.type == 'expense')
+
+def _scan_summary(transactions, year, month):
+    month_txns = [t for t in transactions if (t.date.year, t.date.month) == (year, month)]
+    breakdown = {}
+    for t in month_txns:
+        breakdown.setdefault(t.category, {'income': 0.0, 'expense': 0.0, 'transfer': 0.0})[t.type] += t.amount
+    return len(month_txns), breakdown
+
+def test_monthly_aggregates_follow_mutations():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        manager.add_category('Gym', 500)
+        a = manager.add_transaction(100, 'expense', 'Food', date=datetime(2023, 1, 5))
+        b = manager.add_transaction(200, 'expense', 'Gym', date=datetime(2023, 1, 6))
+        c = manager.add_transaction(1000, 'income', 'Salary', date=datetime(2023, 2, 1))
+        manager.edit_transaction(a.id, amount=150, type='income', category='Salary', date=datetime(2023, 2, 3))
+        manager.delete_transaction(c.id)
+        manager.edit_category('Gym', new_name='Fitness')
+
+        for year, month in [(2023, 1), (2023, 2)]:
+            count, breakdown = _scan_summary(manager.transactions, year, month)
+            summary = manager.get_monthly_summary(year, month)
+            assert summary['transaction_count'] == count
+            assert summary['category_breakdown'] == breakdown
+        assert manager.get_monthly_summary(2023, 1)['category_breakdown'] == {
+            'Fitness': {'income': 0.0, 'expense': 200.0, 'transfer': 0.0}
+        }
+
+        # Invalid edits leave both the transaction and the aggregates untouched
+        with pytest.raises(ValueError):
+            manager.edit_transaction(b.id, amount=999, type='bogus')
+        assert b.amount == 200
+        assert manager.get_monthly_summary(2023, 1)['total_expenses'] == 200
+
+        reloaded = BudgetManager(data_dir=tmpdir)
+        assert reloaded.get_monthly_summary(2023, 2) == manager.get_monthly_summary(2023, 2)
+        with pytest.raises(ValueError, match="used in transactions"):
+            reloaded.delete_category('Fitness')
+
+def test_yearly_and_range_summaries():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        manager.add_transaction(100, 'expense', 'Food', date=datetime(2023, 1, 31))
+        manager.add_transaction(300, 'income', 'Salary', date=datetime(2023, 7, 1))
+        manager.add_transaction(50, 'expense', 'Food', date=datetime(2024, 1, 1))
+        yearly = manager.get_yearly_summary(2023)
+        assert yearly['total_expenses'] == 100
+        assert yearly['total_income'] == 300
+        assert yearly['transaction_count'] == 2
+
+        from datetime import date
+        assert manager.get_summary()['transaction_count'] == 3
+        assert manager.get_summary(date(2023, 1, 31), date(2023, 7, 1))['transaction_count'] == 2
+        assert manager.get_summary(date(2023, 2, 1), date(2024, 1, 31))['transaction_count'] == 2
+
+def test_batch_persists_once_on_exit():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        with manager.batch():
+            t = manager.add_transaction(100, 'expense', 'Food', date=datetime(2023, 1, 1))
+            manager.add_transaction(200, 'income', 'Salary', date=datetime(2023, 1, 2))
+            manager.edit_transaction(t.id, amount=150)
+            assert manager.journal.entry_count == 0
+        assert manager.journal.entry_count == 3
+        reloaded = BudgetManager(data_dir=tmpdir)
+        assert reloaded.get_transaction_by_id(t.id).amount == 150
+        assert len(reloaded.transactions) == 2
+
+def test_batch_rolls_back_when_save_fails(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        kept = manager.add_transaction(100, 'expense', 'Food', 'Lunch', datetime(2023, 1, 1))
+        removed = manager.add_transaction(40, 'expense', 'Food', 'Snack', datetime(2023, 1, 3))
+        before = manager.get_summary()
+
+        def failing_save(changes):
+            raise OSError("disk full")
+        monkeypatch.setattr(manager.storage, 'record_changes', failing_save)
+        with pytest.raises(OSError):
+            with manager.batch():
+                manager.add_transaction(300, 'expense', 'Rent', date=datetime(2023, 2, 1))
+                manager.edit_transaction(kept.id, amount=999, description='Dinner', date=datetime(2023, 3, 1))
+                manager.delete_transaction(removed.id)
+
+        assert {t.id for t in manager.transactions} == {kept.id, removed.id}
+        assert (kept.amount, kept.description, kept.date) == (100, 'Lunch', datetime(2023, 1, 1).date())
+        assert manager.get_summary() == before
+        assert [t.id for t in manager.get_transactions(date_from=datetime(2023, 3, 1).date())] == []
+        assert BudgetManager(data_dir=tmpdir).get_transaction_by_id(removed.id) is not None
+
+def test_add_transactions_is_all_or_nothing():
+    from src.models.transaction import Transaction
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        good = Transaction(10, 'expense', 'Food')
+        bad = Transaction(20, 'expense', 'Unknown')
+        with pytest.raises(ValueError):
+            manager.add_transactions([good, bad])
+        assert manager.transactions == []
+        assert manager.add_transactions([good]) == [good]
+        assert manager.journal.entry_count == 1
+
+def test_csv_import_validates_categories():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        path = os.path.join(tmpdir, 'import.csv')
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            f.write("Date,Type,Category,Amount,Description\n")
+            f.write("2023-01-01,expense,Food,12.5,Lunch\n")
+            f.write("2023-01-02,expense,Nonexistent,5,Mystery\n")
+        result = manager.import_data(path)
+        assert result['imported_count'] == 1
+        assert len(result['errors']) == 1
+        assert manager.journal.entry_count == 1
+
+def _write_import_csv(path, rows):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        f.write("Date,Type,Category,Amount,Description\n")
+        for i in range(rows):
+            category = 'Food' if i % 10 else 'Nonexistent'
+            f.write(f"2023-01-{i % 28 + 1:02d},expense,{category},{i}.5,Row {i}\n")
+
+def test_csv_import_streams_chunks_and_caps_errors():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        path = os.path.join(tmpdir, 'import.csv')
+        _write_import_csv(path, 100)
+        calls = []
+        result = manager.import_data(path, chunk_size=15, max_errors=3,
+                                     progress=lambda rows, fraction: calls.append((rows, fraction)))
+        assert result['imported_count'] == 90
+        assert result['error_count'] == 10
+        assert result['errors'][0].startswith("Row 2:")
+        assert len(result['errors']) == 3
+        assert [rows for rows, _ in calls] == [15, 30, 45, 60, 75, 90, 100]
+        assert calls[-1][1] == 1.0
+        assert manager.journal.entry_count == 90
+
+def test_csv_import_can_be_cancelled():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        path = os.path.join(tmpdir, 'import.csv')
+        _write_import_csv(path, 100)
+        result = manager.import_data(path, chunk_size=20, progress=lambda rows, fraction: rows < 40)
+        assert result['cancelled']
+        assert result['imported_count'] == 36
+        assert len(manager.transactions) == 36
+
+def test_csv_import_with_worker_processes_matches_serial():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'import.csv')
+        _write_import_csv(path, 50)
+        serial = BudgetManager(data_dir=os.path.join(tmpdir, 'serial'))
+        parallel = BudgetManager(data_dir=os.path.join(tmpdir, 'parallel'))
+        expected = serial.import_data(path, chunk_size=7)
+        result = parallel.import_data(path, chunk_size=7, workers=2)
+        assert result == expected
+        assert ([(t.amount, t.description, t.date) for t in parallel.transactions]
+                == [(t.amount, t.description, t.date) for t in serial.transactions])
+
+def test_reimporting_a_statement_skips_duplicates():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        path = os.path.join(tmpdir, 'statement.csv')
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            f.write("Date,Type,Category,Amount,Description\n")
+            f.write("2023-01-01,expense,Food,4.5,Coffee\n")
+            f.write("2023-01-01,expense,Food,4.5,Coffee\n")
+            f.write("2023-01-02,expense,Food,12,Lunch\n")
+        assert manager.import_data(path)['imported_count'] == 3
+        result = manager.import_data(path)
+        assert result['imported_count'] == 0
+        assert result['duplicate_count'] == 3
+        assert len(manager.transactions) == 3
+
+        manager.delete_transaction(manager.search_transactions('lunch')[0].id)
+        flagged = manager.import_data(path, duplicates="flag")
+        assert flagged['imported_count'] == 3
+        assert flagged['duplicates'] == ["Row 2: matches an existing transaction", "Row 3: matches an existing transaction"]
+        assert manager.count_duplicates(4.5, 'expense', 'Food', 'COFFEE', datetime(2023, 1, 1)) == 4
+
+def test_json_import_skips_duplicates_with_new_ids():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        manager.add_transaction(100, 'expense', 'Food', 'Dinner', date=datetime(2023, 1, 1))
+        path = manager.export_data('json', os.path.join(tmpdir, 'export.json'))
+        other = BudgetManager(data_dir=os.path.join(tmpdir, 'other'))
+        other.add_transaction(100, 'expense', 'Food', 'dinner ', date=datetime(2023, 1, 1))
+        result = other.import_data(path)
+        assert result['imported_transactions'] == 0
+        assert len(result['duplicates']) == 1
+        assert other.import_data(path, duplicates="allow")['imported_transactions'] == 1
+
+def test_streaming_json_and_jsonl_round_trip():
+    import json
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        manager.add_category('Hobbies', 50)
+        for i in range(30):
+            manager.add_transaction(10 + i, 'expense', 'Hobbies' if i % 2 else 'Food', f'Item "{i}"', datetime(2023, 1, 1 + i % 28))
+        json_path = manager.export_data('json', os.path.join(tmpdir, 'export.json'))
+        jsonl_path = manager.export_data('jsonl', os.path.join(tmpdir, 'export.jsonl'))
+        with open(json_path, encoding='utf-8') as f:
+            document = json.load(f)
+        assert document['total_transactions'] == 30
+        assert len(document['transactions']) == 30
+
+        expected = sorted((t.id, t.amount, t.category, t.description, t.date) for t in manager.transactions)
+        for path in (json_path, jsonl_path):
+            target = BudgetManager(data_dir=path + '.data')
+            result = target.import_data(path)
+            assert result['imported_transactions'] == 30
+            assert result['imported_categories'] == 1
+            assert result['success']
+            assert sorted((t.id, t.amount, t.category, t.description, t.date) for t in target.transactions) == expected
+
+def test_jsonl_import_reports_invalid_lines_and_keeps_going():
+    import json
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'mixed.jsonl')
+        valid = {'record': 'transaction', 'amount': 5, 'type': 'expense', 'category': 'Food', 'date': '2023-01-01'}
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({**valid, 'id': 'first'}) + '\n')
+            f.write(json.dumps({'record': 'budget', 'name': 'Food'}) + '\n')
+            f.write('{"record": "transaction", \n')
+            f.write(json.dumps({**valid, 'id': 'negative', 'amount': -5}) + '\n')
+            f.write(json.dumps({**valid, 'id': 'last'}) + '\n')
+        manager = BudgetManager(data_dir=tmpdir)
+        result = manager.import_data(path)
+        assert result['imported_transactions'] == 2
+        assert sorted(t.id for t in manager.transactions) == ['first', 'last']
+        assert [error.split(':')[0] for error in result['errors']] == ['Row 2', 'Row 3', 'Row 4']
+        assert "unknown record type 'budget'" in result['errors'][0]
+        assert not result['success']
+
+def test_json_import_reads_categories_listed_after_transactions():
+    import json
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'legacy.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'transactions': [{'id': 'a1', 'amount': 5, 'type': 'expense', 'category': 'Pets',
+                                  'description': 'Food', 'date': '2023-01-01', 'currency': 'INR'}],
+                'categories': [{'name': 'Pets', 'budget_limit': None, 'is_predefined': False}],
+            }, f, indent=2)
+        manager = BudgetManager(data_dir=tmpdir)
+        result = manager.import_data(path)
+        assert result['success']
+        assert manager.get_transaction_by_id('a1').category == 'Pets'
+
+def test_deferred_load():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        BudgetManager(data_dir=tmpdir).add_transaction(10, 'expense', 'Food', date=datetime(2023, 1, 1))
+        manager = BudgetManager(data_dir=tmpdir, load=False)
+        assert manager.transactions == []
+        assert 'Food' in manager.categories
+        manager.load_data()
+        assert len(manager.transactions) == 1
+
+def test_listeners_hear_committed_changes(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        events = []
+        unsubscribe = manager.subscribe(lambda op, subject, previous: events.append((op, subject, previous)))
+
+        t = manager.add_transaction(100, 'expense', 'Food', 'Lunch', datetime(2023, 1, 1))
+        manager.edit_transaction(t.id, amount=120, date=datetime(2023, 2, 1))
+        manager.delete_transaction(t.id)
+        assert [op for op, _, _ in events] == ['add', 'edit', 'delete']
+        assert all(subject is t for _, subject, _ in events)
+        assert events[1][2]['amount'] == 100 and events[1][2]['date'] == datetime(2023, 1, 1).date()
+
+        events.clear()
+        with manager.batch():
+            manager.add_transaction(10, 'expense', 'Food', date=datetime(2023, 1, 1))
+            assert events == []
+        assert [op for op, _, _ in events] == ['add']
+
+        events.clear()
+        def failing_save(changes):
+            raise OSError("disk full")
+        monkeypatch.setattr(manager.storage, 'record_changes', failing_save)
+        with pytest.raises(OSError):
+            with manager.batch():
+                manager.add_transaction(10, 'expense', 'Food', date=datetime(2023, 1, 1))
+        assert events == []
+        monkeypatch.undo()
+
+        manager.add_category('Pets', 50)
+        manager.edit_category('Pets', new_name='Animals')
+        manager.delete_category('Animals')
+        assert [op for op, _, _ in events] == ['add_category', 'edit_category', 'delete_category']
+        assert events[1][2] == {'name': 'Pets', 'budget_limit': 50}
+
+        events.clear()
+        manager.clear_transactions()
+        assert events == [('reset', None, None)]
+        unsubscribe()
+        manager.add_transaction(5, 'expense', 'Food')
+        assert len(events) == 1
+
+def test_time_series_resamples_by_day_week_and_month():
+    from datetime import date
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        manager.add_transaction(10, 'expense', 'Food', date=datetime(2023, 1, 30))   # Monday
+        manager.add_transaction(20, 'expense', 'Rent', date=datetime(2023, 2, 1))
+        manager.add_transaction(5, 'expense', 'Food', date=datetime(2023, 2, 6))
+        manager.add_transaction(100, 'income', 'Salary', date=datetime(2023, 3, 15))
+
+        daily = manager.get_time_series('day', date(2023, 1, 30), date(2023, 2, 1))
+        assert daily == {
+            'periods': [date(2023, 1, 30), date(2023, 1, 31), date(2023, 2, 1)],
+            'series': {'expense': [10.0, 0.0, 20.0]},
+        }
+
+        weekly = manager.get_time_series('week', date(2023, 1, 31), date(2023, 2, 12), group_by='category')
+        assert weekly['periods'] == [date(2023, 1, 30), date(2023, 2, 6)]
+        assert weekly['series'] == {'Rent': [20.0, 0.0], 'Food': [0.0, 5.0]}
+
+        monthly = manager.get_time_series('month')
+        assert monthly['periods'] == [date(2023, 1, 1), date(2023, 2, 1), date(2023, 3, 1)]
+        assert monthly['series'] == {'expense': [10.0, 25.0, 0.0], 'income': [0.0, 0.0, 100.0]}
+
+        # Months cut by the range are summed from the date index, whole ones from the aggregates
+        partial = manager.get_time_series('month', date(2023, 1, 31), date(2023, 2, 5), type_filter='expense')
+        assert partial['series'] == {'expense': [0.0, 20.0]}
+        assert manager.get_time_series('month', category_filter='Food')['series'] == {'expense': [10.0, 5.0, 0.0]}
+
+        with pytest.raises(ValueError):
+            manager.get_time_series('quarter')
@@ -0,0 +1,101 @@
+import gc
+import tracemalloc
+import weakref
+from datetime import date
+
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from matplotlib._pylab_helpers import Gcf
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from src.utils.charts import ChartService
+
+
+LABELS = ['Food', 'Rent', 'Utilities']
+
+
+def _service():
+    return ChartService(FigureCanvasAgg, figsize=(4, 3))
+
+
+def test_same_labels_update_artists_in_place_and_blit():
+    charts = _service()
+    chart = charts.chart('pie').pie(LABELS, [10, 20, 30], "Breakdown")
+    wedges = list(chart.artists)
+    background = chart._background
+    assert background is not None
+
+    blits = []
+    chart.canvas.blit = blits.append
+    charts.chart('pie').pie(LABELS, [30, 20, 10], "Breakdown")
+    assert chart.artists == wedges
+    assert chart._background is background
+    assert len(blits) == 1
+    assert wedges[0].theta2 - wedges[0].theta1 == pytest.approx(180)
+    assert wedges[2 * len(LABELS)].get_text() == '50.0%'
+
+    # New labels rebuild the artists with a full draw
+    charts.chart('pie').pie(LABELS + ['Shopping'], [1, 2, 3, 4], "Breakdown")
+    assert chart.artists[0] is not wedges[0]
+    assert len(blits) == 1
+
+
+def test_bars_rescale_only_when_data_leaves_the_axis():
+    charts = _service()
+    chart = charts.chart('bar').bars(LABELS, {'Budget': [100, 100, 100], 'Actual': [50, 80, 20]}, "Budget", value_labels=True)
+    bars = list(chart.artists)
+    assert chart.ax.get_ylim()[1] == pytest.approx(115)
+
+    charts.chart('bar').bars(LABELS, {'Budget': [100, 100, 100], 'Actual': [60, 90, 30]}, "Budget", value_labels=True)
+    assert chart.artists == bars
+    assert chart.ax.get_ylim()[1] == pytest.approx(115)
+    assert bars[3].get_height() == 60
+    assert bars[6].get_text() == '₹100.00'
+
+    charts.chart('bar').bars(LABELS, {'Budget': [100, 100, 100], 'Actual': [60, 200, 30]}, "Budget", value_labels=True)
+    assert chart.ax.get_ylim()[1] == pytest.approx(230)
+
+
+def test_lines_update_y_values_for_the_same_periods():
+    charts = _service()
+    periods = [date(2024, month, 1) for month in range(1, 7)]
+    chart = charts.chart('trend').lines(periods, {'Expenses': [1, 2, 3, 4, 5, 6]}, "Trend", date_format='%Y-%m')
+    line = chart.artists[0]
+    charts.chart('trend').lines(periods, {'Expenses': [6, 5, 4, 3, 2, 1]}, "Trend", date_format='%Y-%m')
+    assert chart.artists[0] is line
+    assert list(line.get_ydata()) == [6, 5, 4, 3, 2, 1]
+
+
+def test_redrawing_reuses_one_figure_and_does_not_leak():
+    charts = _service()
+    first = charts.chart('bar').bars(LABELS, {'Expenses': [1, 2, 3]}, "Expenses", value_labels=True)
+    figure, canvas = first.figure, first.canvas
+
+    def redraw(rounds):
+        for i in range(rounds):
+            sizes = [1 + i % 7, 2 + i % 5, 3 + i % 3]
+            chart = charts.chart('bar').bars(LABELS, {'Expenses': sizes}, f"Expenses {i // 10}", value_labels=True)
+            assert chart.figure is figure and chart.canvas is canvas
+            charts.chart('pie').pie(LABELS, sizes, "Breakdown")
+
+    # Mostly blitted updates plus a full draw every ten rounds; warm up font and text caches first
+    redraw(20)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        redraw(50)
+        gc.collect()
+        growth = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    assert growth < 1_000_000
+    assert Gcf.get_num_fig_managers() == 0
+
+    figures = [weakref.ref(charts.chart(name).figure) for name in ('bar', 'pie')]
+    del first, figure, canvas
+    charts.release()
+    gc.collect()
+    assert all(ref() is None for ref in figures)
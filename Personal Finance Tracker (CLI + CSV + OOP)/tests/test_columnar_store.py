@@ -0,0 +1,73 @@
+import pytest
+import tempfile
+from datetime import date, datetime
+
+np = pytest.importorskip("numpy")
+
+from src.models.budget_manager import BudgetManager
+from src.models.columnar_store import ColumnarStore
+
+
+def _populate(manager):
+    manager.add_transaction(1000, 'income', 'Salary', 'Pay', datetime(2023, 1, 1))
+    manager.add_transaction(120.5, 'expense', 'Food', 'Lunch', datetime(2023, 1, 15))
+    manager.add_transaction(300, 'expense', 'Rent', 'Flat', datetime(2023, 2, 3))
+    manager.add_transaction(50, 'transfer', 'Salary', 'Move', datetime(2023, 2, 20))
+    return manager.add_transaction(75.25, 'expense', 'Food', 'Dinner', datetime(2023, 3, 9))
+
+def _assert_same_summary(columnar, plain, start, end):
+    expected = plain.get_summary(start, end)
+    actual = columnar.get_summary(start, end)
+    assert actual['transaction_count'] == expected['transaction_count']
+    for key in ('total_income', 'total_expenses', 'total_transfers', 'net_amount'):
+        assert actual[key] == pytest.approx(expected[key])
+    assert set(actual['category_breakdown']) == set(expected['category_breakdown'])
+    for category, totals in expected['category_breakdown'].items():
+        for type_name, amount in totals.items():
+            assert actual['category_breakdown'][category][type_name] == pytest.approx(amount)
+
+def test_summary_matches_object_path_through_mutations():
+    with tempfile.TemporaryDirectory() as columnar_dir, tempfile.TemporaryDirectory() as plain_dir:
+        columnar = BudgetManager(data_dir=columnar_dir, use_columnar=True)
+        plain = BudgetManager(data_dir=plain_dir)
+        for manager in (columnar, plain):
+            last = _populate(manager)
+            manager.edit_transaction(last.id, amount=80, date=datetime(2023, 1, 20))
+            manager.delete_transaction(manager.transactions[0].id)
+            manager.edit_category('Food', new_name='Groceries')
+
+        assert columnar._columns.size == len(columnar.transactions)
+        for start, end in [(date(2023, 1, 10), date(2023, 2, 25)), (None, date(2023, 1, 31)), (None, None)]:
+            _assert_same_summary(columnar, plain, start, end)
+
+def test_monthly_totals_group_by_month_and_type():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir, use_columnar=True)
+        _populate(manager)
+        totals = manager._columns.monthly_totals(date(2023, 2, 1))
+        assert set(totals) == {(2023, 2), (2023, 3)}
+        assert totals[(2023, 2)]['expense'] == pytest.approx(300)
+        assert totals[(2023, 2)]['transfer'] == pytest.approx(50)
+        assert totals[(2023, 2)]['count'] == 2
+        assert totals[(2023, 3)]['expense'] == pytest.approx(75.25)
+
+def test_expense_trends_match_object_path():
+    today = datetime.now().replace(day=1)
+    with tempfile.TemporaryDirectory() as columnar_dir, tempfile.TemporaryDirectory() as plain_dir:
+        columnar = BudgetManager(data_dir=columnar_dir, use_columnar=True)
+        plain = BudgetManager(data_dir=plain_dir)
+        for manager in (columnar, plain):
+            manager.add_transaction(40, 'expense', 'Food', date=today)
+            manager.add_transaction(500, 'income', 'Salary', date=today)
+        assert columnar.get_expense_trends(3) == plain.get_expense_trends(3)
+
+def test_store_grows_and_removes_rows():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        added = [manager.add_transaction(i + 1, 'expense', 'Food', date=datetime(2023, 1, 1)) for i in range(5)]
+        store = ColumnarStore(capacity=2)
+        for t in added:
+            store.append(t)
+        store.remove(added[1])
+        assert store.size == 4
+        assert store.summarize()['total_expenses'] == pytest.approx(1 + 3 + 4 + 5)
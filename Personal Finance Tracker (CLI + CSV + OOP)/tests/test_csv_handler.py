@@ -26,4 +26,45 @@ def test_write_and_read_categories():
         assert len(cats) == 2
         assert cats[0].name == 'Food'
         assert cats[1].budget_limit == 1000
-    os.remove(tmp.name) 
\ No newline at end of file
+    os.remove(tmp.name) 
+
+def test_encrypted_round_trip_uses_no_temp_files(monkeypatch, tmp_path):
+    import tempfile as tempfile_module
+    def fail(*args, **kwargs):
+        raise AssertionError("plaintext temp file created")
+    monkeypatch.setattr(tempfile_module, 'NamedTemporaryFile', fail)
+    path = str(tmp_path / 'transactions.csv.enc')
+    t = Transaction(75, 'expense', 'Food', 'Comma, "quoted" text', datetime(2023, 3, 4))
+    csv_handler.write_transactions(path, [t])
+    txns = csv_handler.read_transactions(path)
+    assert len(txns) == 1
+    assert txns[0].description == 'Comma, "quoted" text'
+    assert list(tmp_path.iterdir()) == [tmp_path / 'transactions.csv.enc']
+
+def test_bulk_parser_matches_from_dict():
+    rows = [
+        {'id': 'a', 'date': '2023-01-05', 'amount': '12.5', 'type': 'expense', 'category': ' Food ', 'description': 'Lunch', 'currency': 'INR'},
+        {'id': 'b', 'date': '2023-01-05', 'amount': '1000', 'type': 'income', 'category': 'Salary', 'description': '', 'currency': ''},
+    ]
+    fieldnames = list(rows[0])
+    bulk = Transaction.bulk_from_rows(([row[name] for name in fieldnames] for row in rows), fieldnames)
+    for parsed, row in zip(bulk, rows):
+        expected = Transaction.from_dict(dict(row, currency=row['currency'] or 'INR'))
+        assert parsed.to_dict() == expected.to_dict()
+    assert bulk[0].date is bulk[1].date
+
+def test_bulk_parser_reports_invalid_line():
+    fieldnames = ['date', 'amount', 'type', 'category']
+    with pytest.raises(ValueError, match="line 3"):
+        Transaction.bulk_from_rows([['2023-01-01', '5', 'expense', 'Food'], ['2023-01-01', '-5', 'expense', 'Food']], fieldnames)
+
+@pytest.mark.parametrize('date_text', ['2023-01-05', '2023-1-5', '20230105', '2023-W01-4', '2023-01-05T00:00', '2023-02-30', ''])
+def test_bulk_parser_accepts_the_same_dates_as_from_dict(date_text):
+    row = {'date': date_text, 'amount': '5', 'type': 'expense', 'category': 'Food'}
+    try:
+        expected = Transaction.from_dict(row).date
+    except ValueError:
+        with pytest.raises(ValueError, match="line 2"):
+            Transaction.bulk_from_rows([list(row.values())], list(row))
+    else:
+        assert Transaction.bulk_from_rows([list(row.values())], list(row))[0].date == expected
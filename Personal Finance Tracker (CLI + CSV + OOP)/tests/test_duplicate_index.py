@@ -0,0 +1,35 @@
+from datetime import date, datetime
+
+from src.models.duplicate_index import DuplicateIndex, DuplicateMatcher, fingerprint, transaction_fingerprint
+from src.models.transaction import Transaction
+
+
+def test_fingerprint_normalizes_description_amount_and_date():
+    a = fingerprint(12.5, 'expense', 'Food', '  Coffee   SHOP ', datetime(2023, 1, 1, 9, 30))
+    b = fingerprint(12.500000001, 'Expense', 'Food', 'coffee shop', date(2023, 1, 1))
+    assert a == b
+    assert a != fingerprint(12.51, 'expense', 'Food', 'coffee shop', date(2023, 1, 1))
+
+
+def test_index_counts_follow_add_and_remove():
+    t1 = Transaction(5, 'expense', 'Food', 'Coffee', date(2023, 1, 1))
+    t2 = Transaction(5, 'expense', 'Food', 'coffee', date(2023, 1, 1))
+    index = DuplicateIndex([t1, t2])
+    key = transaction_fingerprint(t1)
+    assert index.count(key) == 2
+    index.remove(t1)
+    assert index.count(key) == 1
+    index.remove(t2)
+    assert index.count(key) == 0
+
+
+def test_matcher_lets_each_existing_transaction_absorb_one_row():
+    existing = Transaction(5, 'expense', 'Food', 'Coffee', date(2023, 1, 1))
+    index = DuplicateIndex([existing])
+    matcher = DuplicateMatcher(index)
+    key = transaction_fingerprint(existing)
+    assert matcher.is_duplicate(key)
+    assert not matcher.is_duplicate(key)
+    index.add(Transaction(5, 'expense', 'Food', 'Coffee', date(2023, 1, 1)))
+    matcher.imported(key)
+    assert not matcher.is_duplicate(key)
@@ -237,8 +237,8 @@ class TestEncryptionIntegration:
         write_transactions(str(encrypted_file), transactions)
         
         # Verify file is encrypted
-        encrypted_content = encrypted_file.read_text()
-        assert "id,date,amount,type,category,description,currency" not in encrypted_content
+        encrypted_content = encrypted_file.read_bytes()
+        assert b"id,date,amount,type,category,description,currency" not in encrypted_content
         
         # Read encrypted transactions
         read_transactions_list = read_transactions(str(encrypted_file))
@@ -297,4 +297,124 @@ class TestEncryptionSecurity:
         decrypted1 = encryption.decrypt_data(encrypted1)
         decrypted2 = encryption.decrypt_data(encrypted2)
         
-        assert decrypted1 == decrypted2 == data 
\ No newline at end of file
+        assert decrypted1 == decrypted2 == data 
+
+class TestChunkedStream:
+    """Test cases for the chunked streaming container format."""
+    
+    def test_stream_round_trip_multiple_chunks(self, tmp_path):
+        """Test that data spanning many segments round-trips intact."""
+        import io
+        encryption = DataEncryption(str(tmp_path / "test_key"))
+        original = os.urandom(10_000)
+        
+        encrypted = io.BytesIO()
+        encryption.encrypt_stream(io.BytesIO(original), encrypted, chunk_size=1024)
+        assert encrypted.getvalue().startswith(b"PFTENC")
+        
+        decrypted = io.BytesIO()
+        encryption.decrypt_stream(io.BytesIO(encrypted.getvalue()), decrypted)
+        assert decrypted.getvalue() == original
+    
+    def test_stream_is_compact(self, tmp_path):
+        """Test that the binary layout adds only per-segment overhead."""
+        import io
+        encryption = DataEncryption(str(tmp_path / "test_key"))
+        original = b"x" * 200_000
+        
+        encrypted = io.BytesIO()
+        encryption.encrypt_stream(io.BytesIO(original), encrypted)
+        assert len(encrypted.getvalue()) < len(original) * 1.01
+    
+    def test_tampered_segment_rejected(self, tmp_path):
+        """Test that modifying a ciphertext byte fails authentication."""
+        import io
+        encryption = DataEncryption(str(tmp_path / "test_key"))
+        encrypted = io.BytesIO()
+        encryption.encrypt_stream(io.BytesIO(b"sensitive" * 100), encrypted)
+        data = bytearray(encrypted.getvalue())
+        data[-1] ^= 0x01
+        
+        with pytest.raises(ValueError):
+            encryption.decrypt_stream(io.BytesIO(bytes(data)), io.BytesIO())
+    
+    def test_truncated_stream_rejected(self, tmp_path):
+        """Test that dropping the final segment is detected."""
+        import io
+        encryption = DataEncryption(str(tmp_path / "test_key"))
+        encrypted = io.BytesIO()
+        encryption.encrypt_stream(io.BytesIO(b"a" * 3000), encrypted, chunk_size=1024)
+        data = encrypted.getvalue()
+        # Header (11 bytes) followed by full segments of 5 + 12 + 1024 + 16 bytes
+        truncated = data[:11 + 2 * (5 + 12 + 1024 + 16)]
+        
+        with pytest.raises(ValueError, match="truncated"):
+            encryption.decrypt_stream(io.BytesIO(truncated), io.BytesIO())
+    
+    def test_oversized_segment_rejected_before_reading(self, tmp_path):
+        """Test that a segment length beyond the chunk size is rejected up front."""
+        import io
+        import struct
+        encryption = DataEncryption(str(tmp_path / "test_key"))
+        encrypted = io.BytesIO()
+        encryption.encrypt_stream(io.BytesIO(b"a" * 100), encrypted, chunk_size=1024)
+        data = bytearray(encrypted.getvalue())
+        data[11:15] = struct.pack(">I", 0xFFFFFFFF)
+        
+        class Source(io.BytesIO):
+            def read(self, size=-1):
+                assert size <= 1024 + 16 + 12, "read an unbounded segment"
+                return super().read(size)
+        
+        with pytest.raises(ValueError, match="larger than the chunk size"):
+            encryption.decrypt_stream(Source(bytes(data)), io.BytesIO())
+        
+        data = bytearray(encrypted.getvalue())
+        data[7:11] = struct.pack(">I", 0xFFFFFFFF)
+        with pytest.raises(ValueError, match="invalid chunk size"):
+            encryption.decrypt_stream(io.BytesIO(bytes(data)), io.BytesIO())
+    
+    def test_trailing_data_after_final_segment_rejected(self, tmp_path):
+        """Test that bytes appended after the final segment are not ignored."""
+        import io
+        encryption = DataEncryption(str(tmp_path / "test_key"))
+        encrypted = io.BytesIO()
+        encryption.encrypt_stream(io.BytesIO(b"a" * 3000), encrypted, chunk_size=1024)
+        
+        with pytest.raises(ValueError, match="after the final segment"):
+            encryption.decrypt_stream(io.BytesIO(encrypted.getvalue() + b"x"), io.BytesIO())
+    
+    def test_legacy_transactions_file_still_readable(self, tmp_path, monkeypatch):
+        """Test that files written in the single-token format can still be loaded."""
+        import src.utils.encryption as encryption_module
+        from src.utils.csv_handler import read_transactions, write_transactions
+        
+        encryption = DataEncryption(str(tmp_path / "test_key"))
+        monkeypatch.setattr(encryption_module, "_encryption_instance", encryption)
+        legacy_file = tmp_path / "transactions.csv.enc"
+        legacy_file.write_text(encryption.encrypt_data(
+            "id,date,amount,type,category,description,currency\n"
+            "123,2025-01-01,100.0,expense,Food,Grocery,INR\n"
+        ))
+        
+        transactions = read_transactions(str(legacy_file))
+        assert [t.id for t in transactions] == ["123"]
+        
+        # Re-saving migrates the file to the chunked format
+        write_transactions(str(legacy_file), transactions)
+        assert encryption.is_chunked_file(str(legacy_file))
+        assert read_transactions(str(legacy_file))[0].amount == 100.0
+    
+    def test_decrypt_file_accepts_chunked_format(self, tmp_path):
+        """Test that decrypt_file handles files written with encrypt_stream."""
+        encryption = DataEncryption(str(tmp_path / "test_key"))
+        plain = tmp_path / "plain.txt"
+        encrypted = tmp_path / "plain.txt.enc"
+        decrypted = tmp_path / "decrypted.txt"
+        plain.write_bytes(b"line 1\nline 2\n")
+        
+        with open(plain, "rb") as src, open(encrypted, "wb") as dst:
+            encryption.encrypt_stream(src, dst)
+        encryption.decrypt_file(str(encrypted), str(decrypted))
+        
+        assert decrypted.read_bytes() == b"line 1\nline 2\n"
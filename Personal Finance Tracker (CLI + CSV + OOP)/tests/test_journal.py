@@ -0,0 +1,183 @@
+import pytest
+import os
+import tempfile
+from datetime import datetime
+from src.models.budget_manager import BudgetManager
+from src.utils.journal import TransactionJournal
+
+
+def test_mutations_append_to_journal_without_rewriting_snapshot():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        t = manager.add_transaction(100, 'expense', 'Food', 'Lunch', datetime(2023, 1, 1))
+        manager.edit_transaction(t.id, amount=150)
+        manager.add_transaction(200, 'income', 'Salary', 'Pay', datetime(2023, 1, 2))
+        assert manager.journal.entry_count == 3
+        assert not os.path.exists(os.path.join(tmpdir, 'transactions.csv.enc'))
+
+def test_reload_replays_journal():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        t1 = manager.add_transaction(100, 'expense', 'Food', 'Lunch', datetime(2023, 1, 1))
+        t2 = manager.add_transaction(200, 'income', 'Salary', 'Pay', datetime(2023, 1, 2))
+        manager.save_transactions()
+        manager.edit_transaction(t1.id, amount=150, description='Dinner')
+        manager.delete_transaction(t2.id)
+
+        reloaded = BudgetManager(data_dir=tmpdir)
+        assert len(reloaded.transactions) == 1
+        assert reloaded.transactions[0].id == t1.id
+        assert reloaded.transactions[0].amount == 150
+        assert reloaded.transactions[0].description == 'Dinner'
+
+def test_journal_compacts_into_snapshot():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        manager.JOURNAL_COMPACT_THRESHOLD = 3
+        for i in range(3):
+            manager.add_transaction(10 + i, 'expense', 'Food')
+        assert manager.journal.entry_count == 0
+        assert os.path.exists(os.path.join(tmpdir, 'transactions.csv.enc'))
+        assert len(BudgetManager(data_dir=tmpdir).transactions) == 3
+
+def test_replay_is_idempotent_after_interrupted_compaction():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        t = manager.add_transaction(100, 'expense', 'Food')
+        # Simulate a crash between writing the snapshot and clearing the journal
+        from src.utils import csv_handler
+        csv_handler.write_transactions(os.path.join(tmpdir, 'transactions.csv.enc'), manager.transactions)
+        reloaded = BudgetManager(data_dir=tmpdir)
+        assert [x.id for x in reloaded.transactions] == [t.id]
+
+def test_torn_trailing_record_is_ignored():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        journal = TransactionJournal(os.path.join(tmpdir, 'transactions.journal'))
+        journal.append('delete', {'id': 'abc'})
+        with open(journal.path, 'ab') as f:
+            f.write(b'gAAAAAB-truncated')
+        assert list(journal.replay()) == [('delete', {'id': 'abc'})]
+
+def test_torn_batch_is_dropped_whole():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        journal = TransactionJournal(os.path.join(tmpdir, 'transactions.journal'))
+        journal.append('delete', {'id': 'abc'})
+        journal.append_many([('delete', {'id': f'batch-{i}'}) for i in range(3)])
+        assert journal.entry_count == 4
+        # Simulate a crash partway through writing the batch
+        with open(journal.path, 'rb+') as f:
+            f.truncate(os.path.getsize(journal.path) - 40)
+        assert list(journal.replay()) == [('delete', {'id': 'abc'})]
+
+def test_journal_from_before_batch_framing_replays():
+    import json
+    from src.utils.encryption import get_encryption
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, 'transactions.journal')
+        with open(path, 'wb') as f:
+            for i in range(2):
+                payload = json.dumps({'op': 'delete', 'data': {'id': f'old-{i}'}}).encode('utf-8')
+                f.write(get_encryption().encrypt_bytes(payload) + b'\n')
+        journal = TransactionJournal(path)
+        journal.append_many([('delete', {'id': 'new'})])
+        assert journal.entry_count == 3
+        assert [data['id'] for _, data in journal.replay()] == ['old-0', 'old-1', 'new']
+
+def test_invalid_operation_rejected():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        journal = TransactionJournal(os.path.join(tmpdir, 'transactions.journal'))
+        with pytest.raises(ValueError):
+            journal.append('truncate', {})
+
+def test_write_behind_coalesces_changes_until_flush():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir, write_behind=60)
+        t = manager.add_transaction(100, 'expense', 'Food', 'Lunch', datetime(2023, 1, 1))
+        manager.edit_transaction(t.id, amount=150)
+        manager.edit_transaction(t.id, description='Dinner')
+        other = manager.add_transaction(5, 'expense', 'Food')
+        manager.delete_transaction(other.id)
+        assert manager.journal.entry_count == 0
+
+        manager.flush()
+        assert manager.journal.entry_count == 2
+        reloaded = BudgetManager(data_dir=tmpdir)
+        assert [(x.id, x.amount, x.description) for x in reloaded.transactions] == [(t.id, 150, 'Dinner')]
+
+def test_write_behind_thread_saves_after_debounce_window():
+    import time
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir, write_behind=0.05)
+        manager.add_transaction(100, 'expense', 'Food')
+        manager.add_transaction(200, 'expense', 'Food')
+        deadline = time.monotonic() + 5
+        while manager.journal.entry_count < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert manager.journal.entry_count == 2
+        assert len(BudgetManager(data_dir=tmpdir).transactions) == 2
+
+def test_write_behind_keeps_changes_when_save_fails(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir, write_behind=60)
+        manager.add_transaction(100, 'expense', 'Food')
+        def failing_save(changes):
+            raise OSError("disk full")
+        monkeypatch.setattr(manager.storage, 'record_changes', failing_save)
+        with pytest.raises(OSError):
+            manager.flush()
+        monkeypatch.undo()
+        manager.flush()
+        assert len(BudgetManager(data_dir=tmpdir).transactions) == 1
+
+def test_compaction_waits_for_open_batch():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir, write_behind=60)
+        manager.JOURNAL_COMPACT_THRESHOLD = 2
+        for i in range(2):
+            manager.add_transaction(10 + i, 'expense', 'Food')
+        snapshot = os.path.join(tmpdir, 'transactions.csv.enc')
+        with pytest.raises(RuntimeError):
+            with manager.batch():
+                manager.add_transaction(99, 'expense', 'Food', 'Uncommitted')
+                # What the write-behind thread does while the batch is open
+                manager.flush()
+                assert manager.journal.entry_count == 2
+                assert not os.path.exists(snapshot)
+                raise RuntimeError("abandon the batch")
+        manager.flush()
+        assert manager.journal.entry_count == 0
+        reloaded = BudgetManager(data_dir=tmpdir)
+        assert len(reloaded.transactions) == 2
+        assert not reloaded.search_transactions('uncommitted')
+
+        # Without write-behind a committed batch compacts on exit
+        manager = BudgetManager(data_dir=os.path.join(tmpdir, 'sync'))
+        manager.JOURNAL_COMPACT_THRESHOLD = 2
+        with manager.batch():
+            for i in range(3):
+                manager.add_transaction(10 + i, 'expense', 'Food')
+        assert manager.journal.entry_count == 0
+
+def test_writer_thread_does_not_compact_an_open_batch():
+    import time
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir, write_behind=0.1)
+        manager.JOURNAL_COMPACT_THRESHOLD = 2
+        snapshot = os.path.join(tmpdir, 'transactions.csv.enc')
+        for i in range(2):
+            manager.add_transaction(10 + i, 'expense', 'Food', f'Committed {i}')
+        with pytest.raises(RuntimeError):
+            with manager.batch():
+                manager.add_transaction(99, 'expense', 'Food', 'Uncommitted')
+                # The writer thread saves the queued changes and reaches the threshold meanwhile
+                deadline = time.monotonic() + 5
+                while manager.journal.entry_count < 2 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                time.sleep(0.05)
+                assert manager.journal.entry_count == 2
+                assert not os.path.exists(snapshot)
+                raise RuntimeError("abandon the batch")
+        manager.flush()
+        assert os.path.exists(snapshot)
+        reloaded = BudgetManager(data_dir=tmpdir)
+        assert sorted(t.description for t in reloaded.transactions) == ['Committed 0', 'Committed 1']
@@ -0,0 +1,44 @@
+import io
+import json
+
+import pytest
+
+from src.utils.json_stream import iter_json_lines, iter_json_members
+
+
+def test_members_are_streamed_across_small_reads():
+    document = {
+        'export_date': '2023-01-01T00:00:00',
+        'total': 12345,
+        'empty': [],
+        'transactions': [{'id': str(i), 'amount': i * 1.5, 'description': 'x ] , } "q"'} for i in range(50)],
+        'nested': {'a': [1, 2]},
+    }
+    text = json.dumps(document, indent=2)
+    members = list(iter_json_members(io.StringIO(text), read_size=7))
+    assert members[:2] == [('export_date', '2023-01-01T00:00:00'), ('total', 12345)]
+    assert [value for key, value in members if key == 'transactions'] == document['transactions']
+    assert members[-1] == ('nested', {'a': [1, 2]})
+    assert list(iter_json_members(io.StringIO('{}'))) == []
+
+
+def test_malformed_documents_raise():
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_members(io.StringIO('{"transactions": [{"id": 1}')))
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_members(io.StringIO('[1, 2]')))
+
+
+def test_json_lines_skip_blank_lines():
+    records = list(iter_json_lines(io.StringIO('{"a": 1}\n\n{"b": 2}\n')))
+    assert records == [(1, {'a': 1}), (3, {'b': 2})]
+
+
+def test_json_lines_report_malformed_lines_to_on_error():
+    text = '{"a": 1}\n{"b": \n{"c": 3}\n'
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_lines(io.StringIO(text)))
+    errors = []
+    records = list(iter_json_lines(io.StringIO(text), on_error=lambda line_num, e: errors.append(line_num)))
+    assert records == [(1, {'a': 1}), (3, {'c': 3})]
+    assert errors == [2]
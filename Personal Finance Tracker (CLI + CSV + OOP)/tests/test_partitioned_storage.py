@@ -0,0 +1,111 @@
+import argparse
+import csv
+import os
+import tempfile
+from datetime import date, timedelta
+
+from src.models.budget_manager import BudgetManager
+from src.models.transaction import Transaction
+from src.utils.csv_handler import TRANSACTION_FIELDNAMES, read_transactions
+from src.utils.encryption_cli import export_ledger
+from src.utils.migrate_to_encryption import migrate_transactions_file
+from src.utils.partitioned_storage import PartitionedCsvStorage, open_storage
+
+
+def _open(tmpdir, **options):
+    return BudgetManager(data_dir=tmpdir, storage=PartitionedCsvStorage(tmpdir, **options))
+
+
+def _state(manager):
+    return sorted((t.id, t.amount, t.category, t.description, t.date) for t in manager.get_transactions())
+
+
+def _populate(manager):
+    today = date.today()
+    recent = manager.add_transaction(100, 'expense', 'Food', 'Recent', today)
+    old = [
+        manager.add_transaction(10 + i, 'expense', 'Food', f'Old {i}', today - timedelta(days=400 + 31 * i))
+        for i in range(6)
+    ]
+    return recent, old
+
+
+def test_startup_loads_recent_partitions_and_older_ones_on_demand():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = _open(tmpdir)
+        recent, old = _populate(manager)
+        manager.save_transactions()
+        expected = _state(manager)
+        assert os.path.exists(os.path.join(tmpdir, 'partitions', 'index.json'))
+        assert len([n for n in os.listdir(os.path.join(tmpdir, 'partitions')) if n.endswith('.csv.enc')]) == 7
+
+        reopened = _open(tmpdir)
+        assert [t.id for t in reopened.transactions] == [recent.id]
+        assert reopened.storage.loaded_since is not None
+
+        since = old[1].date
+        assert {t.id for t in reopened.get_transactions(date_from=since)} == {recent.id, old[0].id, old[1].id}
+        assert len(reopened.transactions) == 3
+        assert reopened.get_monthly_summary(old[5].date.year, old[5].date.month)['transaction_count'] == 1
+        assert _state(reopened) == expected
+        assert reopened.storage.loaded_since is None
+
+
+def test_journal_from_earlier_session_is_applied_to_unloaded_partitions():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = _open(tmpdir)
+        recent, old = _populate(manager)
+        manager.save_transactions()
+
+        session = _open(tmpdir)
+        session.edit_transaction(old[0].id, amount=55, date=old[3].date)
+        session.delete_transaction(old[1].id)
+        session.add_transaction(7, 'expense', 'Food', 'Backfilled', old[4].date)
+        expected = _state(session)
+        assert session.journal.entry_count == 3
+
+        lazy = _open(tmpdir)
+        assert len(lazy.transactions) == 1
+        lazy.save_transactions()
+        assert lazy.journal.entry_count == 0
+        assert _state(_open(tmpdir)) == expected
+        assert _state(lazy) == expected
+
+
+def test_existing_csv_ledger_is_migrated():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        legacy = BudgetManager(data_dir=tmpdir)
+        _populate(legacy)
+        legacy.save_transactions()
+        expected = _state(legacy)
+
+        migrated = _open(tmpdir, partition='year')
+        assert _state(migrated) == expected
+        assert not os.path.exists(os.path.join(tmpdir, 'transactions.csv.enc'))
+        assert _state(_open(tmpdir, partition='year')) == expected
+
+        # The old snapshot is kept as a backup
+        kept = read_transactions(os.path.join(tmpdir, 'transactions.csv.enc.migrated'))
+        assert sorted((t.id, t.amount, t.category, t.description, t.date) for t in kept) == expected
+
+
+def test_tools_read_and_extend_a_partitioned_ledger():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = _open(tmpdir, partition='year')
+        _populate(manager)
+        manager.save_transactions()
+
+        plain = Transaction(5, 'income', 'Gift', 'From the old CSV', date.today())
+        with open(os.path.join(tmpdir, 'transactions.csv'), 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=TRANSACTION_FIELDNAMES)
+            writer.writeheader()
+            writer.writerow(plain.to_dict())
+        assert migrate_transactions_file(os.path.join(tmpdir, 'transactions.csv'), create_backup=False)
+        assert isinstance(open_storage(tmpdir), PartitionedCsvStorage)
+        expected = _state(_open(tmpdir, partition='year'))
+        assert plain.id in {row[0] for row in expected}
+
+        output = os.path.join(tmpdir, 'export.csv')
+        export_ledger(argparse.Namespace(data_dir=tmpdir, output_file=output))
+        exported = read_transactions(output)
+        assert sorted((t.id, t.amount, t.category, t.description, t.date) for t in exported) == expected
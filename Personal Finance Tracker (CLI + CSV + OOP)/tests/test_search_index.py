@@ -0,0 +1,56 @@
+import tempfile
+from datetime import datetime
+from src.models.budget_manager import BudgetManager
+from src.models.search_index import SearchIndex, matches
+
+
+def _scan(transactions, query):
+    """Reference implementation: the original linear search."""
+    query = query.lower().strip()
+    return [
+        t for t in transactions
+        if query in t.description.lower()
+        or query in t.category.lower()
+        or query == str(int(t.amount))
+        or query in str(t.amount)
+    ]
+
+QUERIES = ['lunch', 'LU', 'f', 'food', 'groc', '120', '12', '.5', 'salary', 'nothing here', 'nch d']
+
+def test_search_matches_linear_scan_through_mutations():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        lunch = manager.add_transaction(120.5, 'expense', 'Food', 'Lunch date', datetime(2023, 1, 1))
+        manager.add_transaction(12, 'expense', 'Food', 'Lunch', datetime(2023, 1, 2))
+        pay = manager.add_transaction(5000, 'income', 'Salary', 'Monthly pay', datetime(2023, 1, 3))
+        manager.add_transaction(300, 'expense', 'Rent', 'Flat', datetime(2023, 1, 4))
+        for query in QUERIES:
+            assert manager.search_transactions(query) == _scan(manager.transactions, query)
+
+        manager.edit_transaction(lunch.id, description='Groceries', amount=75)
+        manager.delete_transaction(pay.id)
+        manager.edit_category('Food', new_name='Dining')
+        manager.add_transaction(1200, 'expense', 'Rent', 'Deposit', datetime(2023, 2, 1))
+        for query in QUERIES + ['dining', '75']:
+            assert manager.search_transactions(query) == _scan(manager.transactions, query)
+
+def test_removed_texts_leave_no_postings():
+    index = SearchIndex()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        t = manager.add_transaction(10, 'expense', 'Food', 'Snack')
+    index.add(t)
+    index.remove(t)
+    assert index.search('snack') == set()
+    assert not index._postings and not index._ngrams and not index._whole_amounts
+
+def test_matches_agrees_with_index_for_narrowing():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        manager.add_transaction(120.5, 'expense', 'Food', 'Lunch date', datetime(2023, 1, 1))
+        manager.add_transaction(12, 'expense', 'Food', 'Lunch', datetime(2023, 1, 2))
+        manager.add_transaction(300, 'expense', 'Rent', 'Flat', datetime(2023, 1, 4))
+        previous = manager.search_transactions('l')
+        for query in ['lu', 'lunch', 'lunch d', 'fla', 'nothing']:
+            narrowed = [t for t in previous if matches(t, query)]
+            assert narrowed == manager.search_transactions(query)
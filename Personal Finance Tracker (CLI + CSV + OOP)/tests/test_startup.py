@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that must only be imported when a chart or optional format is used
+HEAVY_MODULES = ("matplotlib", "numpy", "pyarrow", "multiprocessing")
+
+
+def import_profile(module):
+    """Import a module in a fresh interpreter with -X importtime; return {module: cumulative seconds}."""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = int(cumulative) / 1e6
+    return profile
+
+
+def assert_lightweight(profile, module):
+    loaded = sorted(name for name in profile if name.split(".")[0] in HEAVY_MODULES)
+    assert not loaded, f"importing {module} pulled in {loaded}"
+    print(f"{module}: {profile[module] * 1000:.1f} ms cumulative import time")
+
+
+def test_budget_manager_import_is_lightweight():
+    assert_lightweight(import_profile("src.models.budget_manager"), "src.models.budget_manager")
+
+
+def test_qt_gui_defers_charting_imports():
+    pytest.importorskip("PyQt5")
+    assert_lightweight(import_profile("src.qt_gui"), "src.qt_gui")
+
+
+def test_tk_gui_defers_charting_imports():
+    pytest.importorskip("tkinter")
+    assert_lightweight(import_profile("src.gui"), "src.gui")
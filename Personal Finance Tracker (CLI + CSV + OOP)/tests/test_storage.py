@@ -0,0 +1,99 @@
+import os
+import sqlite3
+import tempfile
+from datetime import date, datetime
+from src.models.budget_manager import BudgetManager
+from src.utils.storage import CsvStorage
+from src.utils.sqlite_storage import SqliteStorage
+
+
+def _populate(manager):
+    manager.add_transaction(1000, 'income', 'Salary', 'Monthly pay', datetime(2023, 1, 1))
+    lunch = manager.add_transaction(120.5, 'expense', 'Food', 'Secret lunch', datetime(2023, 1, 15))
+    manager.add_transaction(300, 'expense', 'Rent', 'Flat', datetime(2023, 2, 3))
+    manager.add_transaction(50, 'transfer', 'Salary', 'Move', datetime(2023, 2, 20))
+    return lunch
+
+def test_default_storage_is_csv():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = BudgetManager(data_dir=tmpdir)
+        assert isinstance(manager.storage, CsvStorage)
+        assert manager.journal is manager.storage.journal
+
+def test_sqlite_storage_round_trip():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, 'ledger.db')
+        manager = BudgetManager(data_dir=tmpdir, storage=SqliteStorage(db_path))
+        lunch = _populate(manager)
+        manager.edit_transaction(lunch.id, amount=99.5, description='Dinner')
+        manager.delete_transaction(manager.transactions[0].id)
+        manager.add_category('Travel', 500)
+        expected = sorted(t.id for t in manager.transactions)
+        manager.storage.close()
+
+        reopened = BudgetManager(data_dir=tmpdir, storage=SqliteStorage(db_path))
+        assert sorted(t.id for t in reopened.transactions) == expected
+        assert reopened.get_transaction_by_id(lunch.id).description == 'Dinner'
+        assert reopened.get_transaction_by_id(lunch.id).amount == 99.5
+        assert reopened.categories['Travel'].budget_limit == 500
+        assert not os.path.exists(os.path.join(tmpdir, 'transactions.csv.enc'))
+        reopened.storage.close()
+
+def test_sqlite_columns_are_encrypted_and_indexed():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, 'ledger.db')
+        storage = SqliteStorage(db_path)
+        _populate(BudgetManager(data_dir=tmpdir, storage=storage))
+        storage.close()
+
+        conn = sqlite3.connect(db_path)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+            rows = conn.execute("SELECT amount, amount_enc, description_enc FROM transactions").fetchall()
+            assert all(amount is None for amount, _, _ in rows)
+            assert not any(b'Secret' in description for _, _, description in rows)
+            indexes = {name for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+            assert {'idx_transactions_date', 'idx_transactions_category', 'idx_transactions_type'} <= indexes
+        finally:
+            conn.close()
+
+def test_sqlite_summaries_pushed_down_when_amounts_plain():
+    with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as plain_dir:
+        storage = SqliteStorage(os.path.join(tmpdir, 'ledger.db'), encrypt_amounts=False)
+        manager = BudgetManager(data_dir=tmpdir, storage=storage)
+        plain = BudgetManager(data_dir=plain_dir)
+        for m in (manager, plain):
+            _populate(m)
+        for start, end in [(date(2023, 1, 10), date(2023, 2, 25)), (None, date(2023, 1, 20))]:
+            assert storage.summarize(start, end) == plain.get_summary(start, end)
+            assert manager.get_summary(start, end) == plain.get_summary(start, end)
+        storage.close()
+
+def test_sqlite_summaries_include_unwritten_changes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage = SqliteStorage(os.path.join(tmpdir, 'ledger.db'), encrypt_amounts=False)
+        manager = BudgetManager(data_dir=tmpdir, storage=storage, write_behind=5)
+        manager.add_transaction(100, 'expense', 'Food', 'Queued', datetime(2023, 1, 10))
+        start, end = date(2023, 1, 5), date(2023, 1, 20)
+        assert manager.get_summary(start, end)['total_expenses'] == 100
+        manager.flush()
+
+        with manager.batch():
+            manager.add_transaction(50, 'expense', 'Food', 'In batch', datetime(2023, 1, 12))
+            assert manager.get_summary(start, end)['total_expenses'] == 150
+            assert manager.get_summary(date(2023, 1, 1), date(2023, 1, 31))['total_expenses'] == 150
+        manager.flush()
+        assert manager.get_summary(start, end)['total_expenses'] == 150
+        storage.close()
+
+def test_sqlite_summaries_fall_back_with_encrypted_amounts():
+    with tempfile.TemporaryDirectory() as tmpdir, tempfile.TemporaryDirectory() as plain_dir:
+        storage = SqliteStorage(os.path.join(tmpdir, 'ledger.db'))
+        assert storage.summarize() is None
+        manager = BudgetManager(data_dir=tmpdir, storage=storage)
+        plain = BudgetManager(data_dir=plain_dir)
+        for m in (manager, plain):
+            _populate(m)
+        start, end = date(2023, 1, 10), date(2023, 2, 25)
+        assert manager.get_summary(start, end) == plain.get_summary(start, end)
+        storage.close()
@@ -1,5 +1,5 @@
 import pytest
-from datetime import datetime
+from datetime import date, datetime
 from src.models.transaction import Transaction
 
 def test_transaction_creation():
@@ -10,7 +10,7 @@ def test_transaction_creation():
     assert t.description == 'Test income'
     assert t.currency == 'INR'
     assert isinstance(t.id, str)
-    assert isinstance(t.date, datetime)
+    assert type(t.date) is date
 
 def test_transaction_to_dict_and_from_dict():
     t = Transaction(500, 'expense', 'Food', 'Lunch', datetime(2023, 2, 2), 'INR')
@@ -30,4 +30,13 @@ def test_transaction_update_fields():
     assert t.type == 'income'
     assert t.category == 'Salary'
     assert t.description == 'Updated'
-    assert t.currency == 'USD' 
\ No newline at end of file
+    assert t.currency == 'USD' 
+
+def test_transaction_is_compact():
+    t = Transaction(100, 'expense', 'Food', date=datetime(2023, 1, 1, 15, 30))
+    assert not hasattr(t, '__dict__')
+    assert t.date == date(2023, 1, 1)
+    t.update_fields(date=datetime(2023, 2, 3, 8, 0))
+    assert type(t.date) is date
+    loaded = Transaction.from_dict({'amount': '5', 'type': 'expense', 'category': ''.join(['Fo', 'od']), 'date': '2023-01-01'})
+    assert loaded.category is t.category
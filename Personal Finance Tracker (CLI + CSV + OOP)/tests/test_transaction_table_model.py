@@ -0,0 +1,174 @@
+import tempfile
+from datetime import date, timedelta
+
+import pytest
+
+pytest.importorskip("PyQt5.QtWidgets")
+
+from PyQt5.QtCore import QModelIndex, QPersistentModelIndex, Qt
+
+from src.models.budget_manager import BudgetManager
+from src.qt_gui import MonthTransactionsModel, SearchTask, TransactionTableModel
+from src.utils.partitioned_storage import PartitionedCsvStorage
+
+
+def _open(tmpdir):
+    return BudgetManager(data_dir=tmpdir, storage=PartitionedCsvStorage(tmpdir))
+
+
+def _populate(tmpdir):
+    manager = _open(tmpdir)
+    today = date.today()
+    manager.add_transaction(30, 'expense', 'Food', 'Lunch', today)
+    manager.add_transaction(500, 'income', 'Salary', 'Pay', today - timedelta(days=1))
+    for i in range(3):
+        manager.add_transaction(10 + i, 'expense', 'Utilities', f'Old {i}', today - timedelta(days=400 + 200 * i))
+    manager.save_transactions()
+    return _open(tmpdir)
+
+
+def _column(model, column):
+    return [model.data(model.index(row, column)) for row in range(model.rowCount())]
+
+
+def test_model_shows_recent_rows_and_fetches_older_months_on_demand():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        model = TransactionTableModel(_populate(tmpdir))
+        model.refresh()
+        assert _column(model, 5) == ['Lunch', 'Pay']
+        assert _column(model, 4) == ['₹30.00', '₹500.00']
+        assert model.data(model.index(0, 1)) == date.today().strftime('%Y-%m-%d')
+
+        assert model.canFetchMore()
+        while model.canFetchMore():
+            model.fetchMore()
+        assert _column(model, 5) == ['Lunch', 'Pay', 'Old 0', 'Old 1', 'Old 2']
+        assert model.manager.storage.loaded_since is None
+
+
+def test_fetching_older_months_keeps_selected_rows_on_their_transactions():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = _populate(tmpdir)
+        today = date.today()
+        manager.add_transaction(7, 'expense', 'Food', 'Snack', today)
+        # Moving Lunch away and back puts it after Snack among today's rows until the indexes are rebuilt
+        lunch = next(t for t in manager.transactions if t.description == 'Lunch')
+        manager.edit_transaction(lunch.id, date=today - timedelta(days=2))
+        manager.edit_transaction(lunch.id, date=today)
+        model = TransactionTableModel(manager)
+        model.refresh()
+        assert _column(model, 5) == ['Snack', 'Lunch', 'Pay']
+
+        selected = QPersistentModelIndex(model.index(0, 5))
+        current = QPersistentModelIndex(model.index(1, 0))
+        model.fetchMore()
+        assert _column(model, 5)[:3] == ['Lunch', 'Snack', 'Pay']
+        assert model.data(QModelIndex(selected)) == 'Snack'
+        assert model.transaction_at(current.row()) is lunch
+        assert current.column() == 0
+
+
+def test_sorting_loads_the_ledger_and_reorders_the_row_index():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = _populate(tmpdir)
+        model = TransactionTableModel(manager)
+        model.refresh()
+
+        model.sort(4, Qt.DescendingOrder)
+        assert _column(model, 4) == ['₹500.00', '₹30.00', '₹12.00', '₹11.00', '₹10.00']
+        assert not model.canFetchMore()
+        assert model.transaction_at(0).description == 'Pay'
+
+        manager.add_transaction(40, 'expense', 'Food', 'Dinner', date.today())
+        model.refresh()
+        assert _column(model, 5)[:3] == ['Pay', 'Dinner', 'Lunch']
+
+        model.sort(1, Qt.DescendingOrder)
+        assert _column(model, 5)[-1] == 'Old 2'
+
+
+def test_search_results_replace_rows_until_refresh():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = _populate(tmpdir)
+        model = TransactionTableModel(manager)
+        model.refresh()
+
+        model.set_transactions(manager.search_transactions('old'))
+        assert _column(model, 5) == ['Old 0', 'Old 1', 'Old 2']
+        assert not model.canFetchMore()
+
+        model.refresh()
+        assert _column(model, 5) == ['Lunch', 'Pay', 'Old 0', 'Old 1', 'Old 2']
+
+
+def _run_search(manager, model, query, within=None, is_current=lambda generation: True):
+    task = SearchTask(manager, query, 1, is_current, model.sorted_transactions, within)
+    task.CHUNK_SIZE = 2
+    matched, streamed = [], []
+    task.signals.matched.connect(lambda generation, q, found: matched.append(found))
+    task.signals.rows.connect(lambda generation, rows, first: streamed.append((list(rows), first)))
+    task.run()
+    return matched, streamed
+
+
+def test_search_task_streams_sorted_results_and_narrows_previous_matches():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = _populate(tmpdir)
+        model = TransactionTableModel(manager)
+        model.refresh()
+
+        matched, streamed = _run_search(manager, model, 'old')
+        assert [first for _, first in streamed] == [True, False]
+        for rows, first in streamed:
+            model.set_transactions(rows, ordered=True) if first else model.append_transactions(rows)
+        assert _column(model, 5) == ['Old 0', 'Old 1', 'Old 2']
+
+        narrowed, streamed = _run_search(manager, model, 'old 1', within=matched[0])
+        assert [t.description for t in narrowed[0]] == ['Old 1']
+        assert streamed == [(narrowed[0], True)]
+
+
+def test_superseded_search_emits_nothing():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = _populate(tmpdir)
+        model = TransactionTableModel(manager)
+        matched, streamed = _run_search(manager, model, 'old', is_current=lambda generation: False)
+        assert matched == [] and streamed == []
+
+
+def test_month_model_applies_single_row_changes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = _open(tmpdir)
+        today = date.today()
+        first = manager.add_transaction(30, 'expense', 'Food', 'Lunch', today.replace(day=1))
+        model = MonthTransactionsModel()
+        model.set_transactions([first])
+
+        later = manager.add_transaction(500, 'income', 'Salary', 'Pay', today)
+        model.add(later)
+        assert _column(model, 4) == ['Pay', 'Lunch'] if today.day > 1 else ['Lunch', 'Pay']
+
+        manager.edit_transaction(first.id, description='Brunch')
+        model.update(first)
+        assert 'Brunch' in _column(model, 4)
+        assert model.data(model.index(0, 1)) in ('Income', 'Expense')
+
+        model.remove(later)
+        assert _column(model, 4) == ['Brunch']
+
+
+def test_search_worker_only_reads_a_fully_loaded_ledger():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        manager = _populate(tmpdir)
+        model = TransactionTableModel(manager)
+        assert manager.storage.loaded_since is not None
+
+        # What TransactionsWidget does on the GUI thread before dispatching a search
+        manager.load_all()
+        assert manager.storage.loaded_since is None
+
+        def load_older(since=None):
+            raise AssertionError("the search worker must not load partitions")
+        manager.storage.load_older = load_older
+        matched, _ = _run_search(manager, model, 'old')
+        assert {t.description for t in matched[0]} == {'Old 0', 'Old 1', 'Old 2'}